@@ -0,0 +1,135 @@
+"""
+Benchmark and quality harness for the summarizer inference backends.
+
+Each backend runs in its own interpreter over the articles stored in data/ and
+reports load time, mean/total summarization latency and peak RSS. Summaries are
+scored with ROUGE-1/2/L F1 against the fp32 "pytorch" backend's summaries.
+
+Run from the project root:
+    python benchmarks/bench_backends.py --backends pytorch int8 onnx --output backends.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+
+def peak_rss_mb():
+    """Returns this process's peak resident set size in MB."""
+    try:
+        import resource
+        return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)  # KB on Linux
+    except ImportError:  # Windows
+        import psutil
+        return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)
+
+
+def _ngrams(tokens, n):
+    return Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+
+def _f1(overlap, candidate_total, reference_total):
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / candidate_total, overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_n(reference, candidate, n):
+    """ROUGE-N F1 over lowercase whitespace tokens."""
+    ref, cand = _ngrams(reference.lower().split(), n), _ngrams(candidate.lower().split(), n)
+    return _f1(sum((ref & cand).values()), sum(cand.values()), sum(ref.values()))
+
+
+def rouge_l(reference, candidate):
+    """ROUGE-L F1 (longest common subsequence) over lowercase whitespace tokens."""
+    ref, cand = reference.lower().split(), candidate.lower().split()
+    previous = [0] * (len(cand) + 1)
+    for r in ref:
+        current = [0]
+        for j, c in enumerate(cand):
+            current.append(previous[j] + 1 if r == c else max(previous[j + 1], current[j]))
+        previous = current
+    return _f1(previous[-1], len(cand), len(ref))
+
+
+def run_worker(backend, output_path):
+    """Summarizes the corpus with one backend and writes timings and summaries as JSON."""
+    os.environ["SUMMARIZER_BACKEND"] = backend
+
+    from benchmarks.stub_server import load_corpus
+    from src.summarization import summarizer
+
+    summarizer.SUMMARY_CACHE = None  # always run the model
+    corpus = load_corpus()
+
+    start = time.perf_counter()
+    if summarizer.get_summarizer() is None:
+        raise SystemExit(f"Backend {backend} failed to load: {summarizer.MODEL_MANAGER.error}")
+    load_seconds = time.perf_counter() - start
+
+    summarizer.summarize_text(corpus[0]["content"])  # warm-up
+    summaries, latencies = [], []
+    for article in corpus:
+        start = time.perf_counter()
+        summaries.append(summarizer.summarize_text(article["content"])[0])
+        latencies.append(time.perf_counter() - start)
+
+    Path(output_path).write_text(json.dumps({
+        "backend": backend,
+        "load_seconds": round(load_seconds, 2),
+        "mean_latency": round(sum(latencies) / len(latencies), 3),
+        "total_latency": round(sum(latencies), 3),
+        "peak_rss_mb": peak_rss_mb(),
+        "summaries": summaries,
+    }), encoding="utf-8")
+
+
+def run(backends, output):
+    results = {}
+    for backend in backends:
+        with tempfile.TemporaryDirectory() as tmp:
+            out = Path(tmp) / "result.json"
+            proc = subprocess.run([sys.executable, __file__, "--worker", backend, "--worker-output", str(out)], cwd=ROOT_DIR)
+            if proc.returncode != 0 or not out.exists():
+                print(f"{backend}: failed (exit code {proc.returncode})")
+                continue
+            results[backend] = json.loads(out.read_text(encoding="utf-8"))
+
+    reference = results.get("pytorch")
+    print(f"{'backend':>8} {'load s':>7} {'mean s':>7} {'total s':>8} {'RSS MB':>8} {'R-1':>6} {'R-2':>6} {'R-L':>6}")
+    for backend, result in results.items():
+        if reference:
+            pairs = list(zip(reference["summaries"], result["summaries"]))
+            result["rouge1"] = round(sum(rouge_n(r, c, 1) for r, c in pairs) / len(pairs), 4)
+            result["rouge2"] = round(sum(rouge_n(r, c, 2) for r, c in pairs) / len(pairs), 4)
+            result["rougeL"] = round(sum(rouge_l(r, c) for r, c in pairs) / len(pairs), 4)
+        scores = " ".join(f"{result.get(k, float('nan')):>6.3f}" for k in ("rouge1", "rouge2", "rougeL"))
+        print(f"{backend:>8} {result['load_seconds']:>7.2f} {result['mean_latency']:>7.3f} "
+              f"{result['total_latency']:>8.3f} {result['peak_rss_mb']:>8.1f} {scores}")
+
+    if output:
+        Path(output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--backends", nargs="+", default=["pytorch", "int8", "onnx"])
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--worker-output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        run_worker(args.worker, args.worker_output)
+    else:
+        run(args.backends, args.output)
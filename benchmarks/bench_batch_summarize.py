@@ -0,0 +1,55 @@
+"""
+Benchmark: per-article summarization latency, one-by-one vs. batched.
+
+Summarizes the articles stored in data/ (repeated up to --articles) first with
+summarize_text in a loop, then with a single summarize_texts call. The summary cache
+is turned off, so both passes run the model.
+Needs the BART model (downloaded to models/ on first run).
+
+Run from the project root:
+    python benchmarks/bench_batch_summarize.py --articles 5
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.stub_server import load_corpus
+from src.summarization import summarizer
+from src.summarization.summarizer import get_summarizer, summarize_text, summarize_texts
+
+
+def run(n_articles, token_budget):
+    # Both passes must run the model: with the cache on, the batched pass would only read
+    # what the sequential pass just wrote
+    summarizer.SUMMARY_CACHE = None
+    corpus = load_corpus()
+    texts = [corpus[i % len(corpus)]["content"] for i in range(n_articles)]
+    get_summarizer()  # load the model up front so it isn't timed as part of the first pass
+
+    start = time.perf_counter()
+    sequential = [summarize_text(text) for text in texts]
+    sequential_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = summarize_texts(texts, token_budget=token_budget)
+    batched_time = time.perf_counter() - start
+
+    print(f"articles:            {n_articles}")
+    print(f"sequential:          {sequential_time:.2f}s ({sequential_time / n_articles:.2f}s/article)")
+    print(f"batched:             {batched_time:.2f}s ({batched_time / n_articles:.2f}s/article)")
+    print(f"speedup:             {sequential_time / batched_time:.2f}x")
+    identical = sum(a[0] == b[0] for a, b in zip(sequential, batched))
+    print(f"identical summaries: {identical}/{n_articles}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=5)
+    parser.add_argument("--token-budget", type=int, default=4096)
+    args = parser.parse_args()
+    run(args.articles, args.token_budget)
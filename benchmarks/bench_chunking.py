@@ -0,0 +1,63 @@
+"""
+Benchmark: legacy word-window chunking vs. token-aware sentence packing.
+
+For every article stored in data/, reports the number of chunks, the number of
+tokens fed to the model and (unless --no-model) end-to-end summarization latency
+for both strategies.
+
+Run from the project root:
+    python benchmarks/bench_chunking.py
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.stub_server import load_corpus
+from src.summarization.summarizer import (
+    MODEL_MAX_TOKENS, chunk_text, chunk_text_with_overlap, get_summarizer,
+)
+
+STRATEGIES = {
+    "word-window": lambda text, tokenizer: chunk_text_with_overlap(text),
+    "token-packed": lambda text, tokenizer: chunk_text(text, tokenizer),
+}
+
+
+def run(use_model):
+    summarizer = get_summarizer()
+    if summarizer is None:
+        sys.exit("Summarization model unavailable.")
+    tokenizer = summarizer.tokenizer
+    corpus = load_corpus()
+
+    print(f"{'strategy':>13} {'chunks':>7} {'tokens':>8} {'truncated':>10} {'seconds':>8}")
+    for name, strategy in STRATEGIES.items():
+        n_chunks = n_tokens = n_truncated = 0
+        elapsed = 0.0
+        for article in corpus:
+            chunks = strategy(article["content"], tokenizer)
+            lengths = [len(ids) for ids in tokenizer(chunks)["input_ids"]]
+            n_chunks += len(chunks)
+            n_tokens += sum(min(n, MODEL_MAX_TOKENS) for n in lengths)
+            n_truncated += sum(n > MODEL_MAX_TOKENS for n in lengths)
+
+            if use_model:
+                start = time.perf_counter()
+                for chunk in chunks:
+                    summarizer(chunk, min_length=50, max_length=200, do_sample=False, truncation=True)
+                elapsed += time.perf_counter() - start
+
+        seconds = f"{elapsed:.2f}" if use_model else "-"
+        print(f"{name:>13} {n_chunks:>7} {n_tokens:>8} {n_truncated:>10} {seconds:>8}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--no-model", action="store_true", help="only count chunks and tokens")
+    args = parser.parse_args()
+    run(not args.no_model)
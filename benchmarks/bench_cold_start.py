@@ -0,0 +1,60 @@
+"""
+Benchmark: cold-start cost of importing the summarizer.
+
+Each measurement runs in a fresh interpreter:
+- "eager" imports the summarizer and waits for the model, like the old import-time load;
+- "lazy" imports the summarizer and starts the background load, which is all the app
+  needs before it can render its first page.
+
+Run from the project root:
+    python benchmarks/bench_cold_start.py --runs 3
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+SNIPPETS = {
+    "eager": (
+        "import time; t = time.perf_counter()\n"
+        "from src.summarization.summarizer import get_summarizer\n"
+        "get_summarizer()\n"
+        "print(time.perf_counter() - t)"
+    ),
+    "lazy": (
+        "import time; t = time.perf_counter()\n"
+        "from src.summarization.summarizer import warm_up\n"
+        "warm_up()\n"
+        "print(time.perf_counter() - t)"
+    ),
+}
+
+
+def measure(snippet):
+    output = subprocess.run(
+        [sys.executable, "-c", snippet], cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def run(runs):
+    results = {}
+    for mode, snippet in SNIPPETS.items():
+        timings = [measure(snippet) for _ in range(runs)]
+        results[mode] = round(statistics.median(timings), 3)
+        print(f"{mode:>6}: median {results[mode]:.3f}s to first paint over {runs} runs")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args()
+    results = run(args.runs)
+    if args.json:
+        print(json.dumps(results))
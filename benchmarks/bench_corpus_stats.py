@@ -0,0 +1,80 @@
+"""
+Benchmark: corpus statistics over a large article store.
+
+Builds a synthetic store (see bench_search.py) and reports the one-off backfill of
+the per-article counts, the incremental update after a batch of new articles, and the
+time to load and aggregate everything the corpus dashboard shows, cold (new process,
+frame loaded from SQLite) and warm (after an incremental refresh), against a 1 s target.
+
+Run from the project root:
+    python benchmarks/bench_corpus_stats.py --articles 100000
+"""
+import argparse
+import itertools
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.bench_search import build_store, synthetic_articles
+from src.utils.corpus_stats import CorpusStats
+
+TARGET_SECONDS = 1.0
+
+
+def dashboard(stats):
+    """Everything the dashboard page computes, as it calls it."""
+    stats.refresh()
+    stats.overview()
+    stats.per_day(90)
+    stats.per_author(20)
+    stats.length_distribution("words")
+    stats.length_distribution("summary_words")
+    stats.readability_quartiles()
+    stats.top_articles("summary_grade", 10)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def run(n_articles, new_articles):
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        store = build_store(Path(tmp) / "articles.sqlite3", n_articles)
+        print(f"Stored {store.count()} articles in {time.perf_counter() - start:.1f}s")
+
+        start = time.perf_counter()
+        stats = CorpusStats(store.path)
+        print(f"Backfill: {stats.update()} articles counted in {time.perf_counter() - start:.2f}s")
+
+        cold = timed(dashboard, CorpusStats(store.path))
+        warm = timed(dashboard, stats)
+
+        batch = list(itertools.islice(synthetic_articles(n_articles + new_articles), n_articles, None))
+        store.add_many(batch)
+        store.set_summaries([(article["url"], article["summary"]) for article in batch])
+        incremental = timed(stats.update)
+        refreshed = timed(dashboard, stats)
+        cached = timed(dashboard, stats)
+
+        print(f"Incremental update ({new_articles} new articles): {incremental * 1000:.0f} ms")
+        print(f"{'dashboard':>28} {'seconds':>8}")
+        for name, seconds in (("cold (new process)", cold), ("warm (first render)", warm),
+                              ("after new articles", refreshed), ("unchanged corpus", cached)):
+            verdict = "OK" if seconds < TARGET_SECONDS else "over target"
+            print(f"{name:>28} {seconds:>8.3f}  {verdict}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--new-articles", type=int, default=100, help="articles added for the incremental update")
+    args = parser.parse_args()
+    run(args.articles, args.new_articles)
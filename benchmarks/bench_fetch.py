@@ -0,0 +1,46 @@
+"""
+Benchmark: article fetch throughput vs. concurrency against a local stand-in server.
+
+Run from the project root:
+    python benchmarks/bench_fetch.py --articles 50 --latency 0.05
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.stub_server import StubServer
+from src.scraping import scraper
+from src.scraping.scraper import create_session, extract_article_links, fetch_articles, fetch_page
+
+
+def run(n_articles, latency, levels):
+    scraper.HTTP_CACHE = None  # measure the network path, not cache hits
+    with StubServer(n_articles=n_articles, latency=latency) as server:
+        session = create_session(pool_size=max(levels))
+        links = extract_article_links(fetch_page(server.base_url, session=session), limit=n_articles)
+        expected = [server.article(n)["title"] for n in reversed(range(n_articles))]
+
+        print(f"{'workers':>8} {'seconds':>9} {'articles/s':>11} {'speedup':>8}")
+        baseline = None
+        for workers in levels:
+            start = time.perf_counter()
+            articles = fetch_articles(links, max_workers=workers, max_per_host=workers, session=session)
+            elapsed = time.perf_counter() - start
+
+            assert [a["title"] for a in articles] == expected, "results out of listing order"
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>9.3f} {len(articles) / elapsed:>11.1f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05, help="per-request server delay in seconds")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+    run(args.articles, args.latency, args.levels)
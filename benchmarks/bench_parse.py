@@ -0,0 +1,115 @@
+"""
+Benchmark: article parse throughput, full BeautifulSoup parsing vs. single-pass extraction.
+
+Parses every saved page in benchmarks/fixtures/ with the legacy path (full
+BeautifulSoup tree plus separate find/find_all scans) and with parse_article,
+checks that both produce identical dicts, and reports pages per second.
+
+Run from the project root:
+    python benchmarks/bench_parse.py --repeat 20
+    python benchmarks/bench_parse.py --record https://techcrunch.com/2025/03/08/...   # save real pages as fixtures
+    python benchmarks/bench_parse.py --synthesize                                      # rebuild stand-in fixtures
+"""
+import argparse
+import hashlib
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from bs4 import BeautifulSoup
+
+from benchmarks.stub_server import load_corpus, render_article
+from src.scraping.scraper import (
+    extract_article_content, extract_authors, fetch_html, format_published_time, parse_article,
+)
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def legacy_parse(url, html):
+    """The scraper's original article parsing: a full BeautifulSoup tree and one scan per field."""
+    soup = BeautifulSoup(html, "lxml")
+
+    title_tag = soup.find("title")
+    title = title_tag.text.strip().replace(" | TechCrunch", "") if title_tag else "No Title"
+
+    time_tag = soup.find("time")
+    published_time = format_published_time(time_tag["datetime"]) if time_tag and time_tag.has_attr("datetime") else "Unknown"
+
+    return {
+        "url": url,
+        "title": title,
+        "authors": extract_authors(soup),
+        "published_time": published_time,
+        "content": extract_article_content(soup),
+    }
+
+
+def load_fixtures():
+    """Returns (name, html) for every saved article fixture."""
+    return [(path.name, path.read_text(encoding="utf-8")) for path in sorted(FIXTURES_DIR.glob("article-*.html"))]
+
+
+def record(urls):
+    """Saves live article pages as fixtures."""
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    for url in urls:
+        html = fetch_html(url)
+        if html:
+            name = f"article-{hashlib.sha1(url.encode()).hexdigest()[:10]}.html"
+            (FIXTURES_DIR / name).write_text(html, encoding="utf-8")
+            print(f"Saved {url} -> {name}")
+
+
+def synthesize():
+    """Writes stand-in article fixtures built from data/, with and without the author meta tag."""
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    for i, article in enumerate(load_corpus()):
+        for meta_author in (True, False):
+            name = f"article-synthetic-{i}{'' if meta_author else '-nometa'}.html"
+            (FIXTURES_DIR / name).write_text(render_article(article, meta_author=meta_author), encoding="utf-8")
+            print(f"Wrote {name}")
+
+
+def run(repeat):
+    fixtures = load_fixtures()
+    if not fixtures:
+        sys.exit(f"No fixtures in {FIXTURES_DIR}; run with --synthesize or --record first.")
+
+    for name, html in fixtures:
+        url = f"fixture://{name}"
+        legacy, targeted = legacy_parse(url, html), parse_article(url, html)
+        assert legacy == targeted, f"{name}: extraction differs\n{legacy}\n{targeted}"
+
+    pages = len(fixtures) * repeat
+    megabytes = sum(len(html.encode("utf-8")) for _, html in fixtures) * repeat / 1e6
+    print(f"{len(fixtures)} fixtures x {repeat} repeats, outputs identical")
+    print(f"{'parser':>14} {'seconds':>8} {'pages/s':>8} {'MB/s':>7}")
+    timings = {}
+    for label, parse in (("beautifulsoup", legacy_parse), ("single-pass", parse_article)):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for name, html in fixtures:
+                parse(name, html)
+        timings[label] = time.perf_counter() - start
+        print(f"{label:>14} {timings[label]:>8.3f} {pages / timings[label]:>8.1f} {megabytes / timings[label]:>7.2f}")
+    print(f"speedup: {timings['beautifulsoup'] / timings['single-pass']:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--record", nargs="+", metavar="URL", help="save live article pages as fixtures")
+    parser.add_argument("--synthesize", action="store_true", help="write stand-in fixtures from data/")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record)
+    elif args.synthesize:
+        synthesize()
+    else:
+        run(args.repeat)
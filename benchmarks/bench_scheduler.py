@@ -0,0 +1,69 @@
+"""
+Benchmark: fixed concurrency vs. the adaptive request scheduler against a throttling stand-in server.
+
+The stand-in server answers 429 above `--rate-limit` requests per second and 503 above
+`--max-concurrent` requests in flight, both with Retry-After. Reports wall time, pages
+fetched and lost, throttle responses, and the scheduler's final window and latency stats.
+
+Run from the project root:
+    python benchmarks/bench_scheduler.py --articles 400 --rate-limit 40 --max-concurrent 6
+"""
+import argparse
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.stub_server import StubServer
+from src.scraping import scraper
+from src.scraping.scheduler import RequestScheduler
+from src.scraping.scraper import create_session, fetch_html
+
+
+def run_once(server, urls, scheduler, workers, retries):
+    """Fetches every URL with `workers` threads (pages only, no parsing, so the network path is measured)."""
+    scraper.FETCH_SCHEDULER = scheduler
+    session = create_session(pool_size=workers, retries=retries)
+    throttled_before = server.requests_throttled
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pages = list(executor.map(lambda url: fetch_html(url, session=session), urls))
+    elapsed = time.perf_counter() - start
+    lost = pages.count(None)
+    return elapsed, len(pages) - lost, lost, server.requests_throttled - throttled_before
+
+
+def run(n_articles, latency, rate_limit, max_concurrent, workers):
+    scraper.HTTP_CACHE = None  # measure the network path, not cache hits
+    with StubServer(n_articles=n_articles, latency=latency, rate_limit=rate_limit,
+                    max_concurrent=max_concurrent) as server:
+        urls = [server.article_url(n) for n in range(n_articles)]
+        modes = {
+            "fixed, no retries": (None, 0),
+            "fixed, urllib3 retries": (None, scraper.MAX_RETRIES),
+            "adaptive scheduler": (RequestScheduler(initial_concurrency=4, max_concurrency=workers), 0),
+        }
+        print(f"{'mode':>24} {'seconds':>8} {'fetched':>8} {'lost':>5} {'throttled':>10} {'pages/s':>11}")
+        for name, (scheduler, retries) in modes.items():
+            time.sleep(2)  # Let the rate limiter's bucket refill between runs
+            elapsed, fetched, lost, throttled = run_once(server, urls, scheduler, workers, retries)
+            print(f"{name:>24} {elapsed:>8.2f} {fetched:>8} {lost:>5} {throttled:>10} {fetched / elapsed:>11.1f}")
+        stats = scheduler.stats()
+        window = next(iter(stats["hosts"].values()))
+        print(f"Scheduler: window {window['limit']}, {stats['retries']} retries, "
+              f"latency p50 {stats['latency_p50']}s / p95 {stats['latency_p95']}s, {stats['rate_per_second']} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=400)
+    parser.add_argument("--latency", type=float, default=0.05, help="per-request server delay in seconds")
+    parser.add_argument("--rate-limit", type=float, default=40, help="server requests per second before 429")
+    parser.add_argument("--max-concurrent", type=int, default=6, help="server in-flight requests before 503")
+    parser.add_argument("--workers", type=int, default=16)
+    args = parser.parse_args()
+    run(args.articles, args.latency, args.rate_limit, args.max_concurrent, args.workers)
@@ -0,0 +1,92 @@
+"""
+Benchmark: full-text search latency over a large article store.
+
+Builds a synthetic store (sentences of the articles in data/ shuffled into new
+articles, with generated titles, authors and summaries) and reports p50 / p95 / max
+latency of ArticleStore.search for a set of queries, against a 50 ms target. Ranking uses
+the default candidate window (see SEARCH_CANDIDATES); --candidates 0 ranks every match.
+
+Run from the project root:
+    python benchmarks/bench_search.py --articles 100000
+"""
+import argparse
+import itertools
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.stub_server import load_corpus
+from src.scraping.article_store import SEARCH_CANDIDATES, ArticleStore
+from src.summarization.summarizer import split_sentences
+
+QUERIES = ["google", "chrome antitrust", "meta lawsuit", "tiktok ban", "ai", "copyright infringement",
+           "anthony ha", "trump administration", "dive", "nonexistentword"]
+AUTHORS = ["Anthony Ha", "Kyle Wiggers", "Lauren Forristal", "Sarah Perez", "Ivan Mehta", "Maxwell Zeff"]
+TARGET_MS = 50
+
+
+def synthetic_articles(n, seed=0):
+    """Yields `n` distinct articles built from the sentences of the stored corpus."""
+    rng = random.Random(seed)
+    sentences = [s for article in load_corpus() for s in split_sentences(article["content"])]
+    for i in range(n):
+        body = rng.sample(sentences, k=min(len(sentences), rng.randint(8, 20)))
+        day = 1 + i % 28
+        yield {
+            "url": f"https://techcrunch.example/{i}/",
+            "title": " ".join(rng.choice(body).split()[:10]),
+            "authors": ", ".join(rng.sample(AUTHORS, k=rng.randint(1, 2))),
+            "published_time": f"March {day:02d}, 2025 at 10:05 AM (EET)",
+            "content": f"{i}\n" + "\n".join(body),  # The id keeps every content hash distinct
+            "summary": " ".join(body[:2]),
+        }
+
+
+def build_store(path, n_articles, batch_size=5000):
+    store = ArticleStore(path)
+    articles = synthetic_articles(n_articles)
+    while batch := list(itertools.islice(articles, batch_size)):
+        store.add_many(batch)
+        store.set_summaries([(article["url"], article["summary"]) for article in batch])
+    store.optimize_index()
+    return store
+
+
+def run(n_articles, repeat, candidates=SEARCH_CANDIDATES):
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        store = build_store(Path(tmp) / "articles.sqlite3", n_articles)
+        print(f"Indexed {store.count()} articles in {time.perf_counter() - start:.1f}s")
+
+        print(f"{'query':>24} {'hits':>5} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+        all_times = []
+        for query in QUERIES:
+            times = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                hits = store.search(query, candidates=candidates)
+                times.append((time.perf_counter() - start) * 1000)
+            all_times.extend(times)
+            p95 = statistics.quantiles(times, n=20)[-1] if len(times) > 1 else times[0]
+            print(f"{query:>24} {len(hits):>5} {statistics.median(times):>8.2f} {p95:>8.2f} {max(times):>8.2f}")
+
+        p95 = statistics.quantiles(all_times, n=20)[-1]
+        verdict = "OK" if p95 < TARGET_MS else "over target"
+        print(f"Overall p50 {statistics.median(all_times):.2f} ms | p95 {p95:.2f} ms ({verdict}, target {TARGET_MS} ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--candidates", type=int, default=SEARCH_CANDIDATES,
+                        help="only rank this many of the newest matches (0: all)")
+    args = parser.parse_args()
+    run(args.articles, args.repeat, args.candidates or None)
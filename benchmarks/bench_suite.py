@@ -0,0 +1,222 @@
+"""
+Offline benchmark suite for the scrape -> summarize pipeline, with a regression gate.
+
+Everything runs locally. The stand-in server replays the recorded article pages in
+benchmarks/fixtures/ behind a rendered listing. A deterministic stub (benchmarks/stub_model.py)
+or, with --model, a small local seq2seq checkpoint stands in for BART. Measured:
+
+    fetch_pages_per_second     article pages fetched per second (no HTTP cache, no parsing)
+    listing_parse_ms           listing page parse + link extraction, median
+    article_parse_ms           parse_article per page, median
+    chunking_ms                chunk_for_summary per article, median
+    summarize_p50_ms / p95_ms  summarize_text per article (summary cache off)
+    stats_ms                   compute_summary_stats per summary, median
+    pipeline_articles_per_second  src/pipeline.py end to end over the listing
+    peak_memory_mb             traced peak allocation during the pipeline run
+
+Each metric is the median over --repeat passes. Results are written as JSON. The run
+exits with status 1 if any metric is worse than the stored baseline by more than its
+tolerance. Baselines are machine-specific: regenerate them on the machine that runs the
+gate.
+
+Run from the project root:
+    python benchmarks/bench_suite.py --output results.json
+    python benchmarks/bench_suite.py --update-baseline        # accept the current numbers
+    python benchmarks/bench_suite.py --model models/tiny-seq2seq --no-gate
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from bs4 import BeautifulSoup
+
+from benchmarks.bench_parse import load_fixtures
+from benchmarks.stub_model import StubSummarizer, load_tiny_model
+from benchmarks.stub_server import StubServer, load_corpus, render_article
+from src import pipeline
+from src.scraping import scraper
+from src.scraping.scraper import MAX_WORKERS, extract_article_links, fetch_html, parse_article
+from src.summarization import summarizer
+from src.summarization.model_manager import ModelManager
+from src.summarization.summarizer import chunk_for_summary, summarize_text
+from src.utils.metrics import METRICS as SPANS
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+DEFAULT_TOLERANCE = 0.3  # Fractional slowdown (or throughput / memory loss) allowed before failing
+
+# name: (unit, higher_is_better, tolerance override)
+METRICS = {
+    "fetch_pages_per_second": ("pages/s", True, None),
+    "listing_parse_ms": ("ms", False, None),
+    "article_parse_ms": ("ms", False, None),
+    "chunking_ms": ("ms", False, None),
+    "summarize_p50_ms": ("ms", False, None),
+    "summarize_p95_ms": ("ms", False, 0.5),  # Tail latency is noisier
+    "stats_ms": ("ms", False, 0.5),  # Sub-millisecond, so relatively noisy
+    "pipeline_articles_per_second": ("articles/s", True, None),
+    "peak_memory_mb": ("MB", False, 0.2),
+}
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p * len(values)))]
+
+
+def timed_ms(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1000
+
+
+def recorded_pages():
+    """Returns the recorded article pages, or stand-ins rendered from data/ if none are saved."""
+    pages = [html for _, html in load_fixtures()]
+    return pages or [render_article(article) for article in load_corpus()]
+
+
+def run_pass(server, model, n_articles):
+    """Runs every measurement once; returns {metric: value}."""
+    results = {}
+    urls = [server.article_url(n) for n in range(n_articles)]
+    pages = server.recorded
+
+    # Fetch throughput: page downloads only, through the scraper's session and scheduler
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        fetched = list(executor.map(fetch_html, urls))
+    results["fetch_pages_per_second"] = sum(html is not None for html in fetched) / (time.perf_counter() - start)
+
+    listing_html = fetch_html(server.base_url)
+    results["listing_parse_ms"] = statistics.median(
+        timed_ms(lambda: extract_article_links(BeautifulSoup(listing_html, "lxml"), limit=None)) for _ in range(5)
+    )
+    results["article_parse_ms"] = statistics.median(
+        timed_ms(parse_article, f"fixture://{i}", html) for i, html in enumerate(pages)
+    )
+
+    articles = [parse_article(f"fixture://{i}", html) for i, html in enumerate(pages)]
+    texts = [article["content"] for article in articles]
+    results["chunking_ms"] = statistics.median(timed_ms(chunk_for_summary, text, model.tokenizer) for text in texts)
+
+    # Stats time comes from the summary_stats span: a second call on the same summary hits textstat's cache
+    SPANS.reset()
+    latencies = [timed_ms(summarize_text, text) for text in texts]
+    results["summarize_p50_ms"] = percentile(latencies, 0.5)
+    results["summarize_p95_ms"] = percentile(latencies, 0.95)
+    results["stats_ms"] = SPANS.snapshot()["summary_stats"]["p50_seconds"] * 1000
+
+    # End to end: listing -> fetch -> chunk -> summarize -> JSON lines (nothing stored)
+    def run_pipeline():
+        return pipeline.run_pipeline(pipeline.listing_urls(n_articles, base_url=server.base_url, max_pages=1),
+                                     io.StringIO(), store=False)
+
+    start = time.perf_counter()
+    report = run_pipeline()
+    results["pipeline_articles_per_second"] = report["written"] / (time.perf_counter() - start)
+    tracemalloc.start()
+    run_pipeline()
+    results["peak_memory_mb"] = tracemalloc.get_traced_memory()[1] / 1e6
+    tracemalloc.stop()
+    return results
+
+
+def run(n_articles, latency, repeat, model_path, cost_per_token):
+    # Measure the code paths themselves: no caches, no shared on-disk state
+    scraper.HTTP_CACHE = None
+    scraper.NEAR_DUPLICATES = None
+    summarizer.SUMMARY_CACHE = None
+    if model_path:
+        model = load_tiny_model(model_path)
+        summarizer.MODEL_MANAGER = ModelManager(backend=f"local:{model_path}", loader=lambda backend: model)
+    else:
+        model = StubSummarizer(cost_per_token)
+        summarizer.MODEL_MANAGER = ModelManager(backend="stub", loader=lambda backend: model)
+
+    passes = []
+    with StubServer(n_articles=n_articles, latency=latency, recorded=recorded_pages()) as server:
+        for _ in range(repeat):
+            passes.append(run_pass(server, model, n_articles))
+    return {name: round(statistics.median(p[name] for p in passes), 3) for name in METRICS}
+
+
+def compare(results, baseline, default_tolerance):
+    """Returns one row per baselined metric: value, baseline, change and whether it regressed."""
+    rows = []
+    for name, value in results.items():
+        if name not in baseline.get("metrics", {}):
+            continue
+        base = baseline["metrics"][name]
+        _, higher_is_better, tolerance = METRICS[name]
+        tolerance = tolerance if tolerance is not None else baseline.get("tolerance", default_tolerance)
+        change = (value - base) / base if base else 0.0
+        worse = -change if higher_is_better else change
+        rows.append({"metric": name, "value": value, "baseline": base, "change": round(change, 3),
+                     "tolerance": tolerance, "regressed": worse > tolerance})
+    return rows
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--articles", type=int, default=40, help="article pages served (recorded pages repeat)")
+    parser.add_argument("--latency", type=float, default=0.01, help="per-request server delay in seconds")
+    parser.add_argument("--repeat", type=int, default=3, help="passes; each metric is the median")
+    parser.add_argument("--model", help="local seq2seq checkpoint directory to use instead of the stub")
+    parser.add_argument("--cost-per-token", type=float, default=0.0, help="simulated stub generation cost (s)")
+    parser.add_argument("--output", help="write the JSON results here (default: stdout)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--no-gate", action="store_true", help="report only; never fail on regressions")
+    args = parser.parse_args()
+
+    config = {"articles": args.articles, "latency": args.latency, "repeat": args.repeat,
+              "model": args.model or "stub", "cost_per_token": args.cost_per_token}
+    metrics = run(args.articles, args.latency, args.repeat, args.model, args.cost_per_token)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() and not args.update_baseline else {}
+    if baseline and baseline.get("config") != config:
+        print(f"Warning: baseline config {baseline.get('config')} differs from {config}", file=sys.stderr)
+    comparison = compare(metrics, baseline, args.tolerance)
+    results = {
+        "config": config,
+        "environment": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cpus": os.cpu_count()},
+        "metrics": {name: {"value": value, "unit": METRICS[name][0], "higher_is_better": METRICS[name][1]}
+                    for name, value in metrics.items()},
+        "comparison": comparison,
+        "regressions": [row["metric"] for row in comparison if row["regressed"]],
+    }
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+    print(f"{'metric':>29} {'value':>10} {'baseline':>10} {'change':>8}", file=sys.stderr)
+    for name, value in metrics.items():
+        row = next((row for row in comparison if row["metric"] == name), None)
+        base = f"{row['baseline']:>10}" if row else f"{'-':>10}"
+        change = f"{row['change']:>+8.0%}{' REGRESSED' if row['regressed'] else ''}" if row else f"{'-':>8}"
+        print(f"{name:>29} {value:>10} {base} {change}", file=sys.stderr)
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps({"config": config, "tolerance": args.tolerance,
+                                             "metrics": metrics}, indent=2) + "\n")
+        print(f"Baseline written to {args.baseline}", file=sys.stderr)
+    elif results["regressions"] and not args.no_gate:
+        print(f"Regressed: {', '.join(results['regressions'])}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,70 @@
+"""
+Deterministic stand-in for the summarization pipeline, for offline benchmarks.
+
+StubSummarizer has the interface summarizer.py uses: a `tokenizer` that returns
+`input_ids` (and `offset_mapping` on request), and `__call__(inputs, min_length=..., max_length=..., **kwargs)` that returns
+[{"summary_text": ...}]. Its "summary" is the input's leading tokens, cut to `max_length`.
+The same input always gives the same output, so runs are comparable.
+
+`cost_per_token` (seconds) adds a model-like generation cost: each call sleeps for
+padded input tokens x batch size x cost, plus 10x that per generated token.
+At the default of 0, the benchmark measures only the code around the model.
+
+For a real but small model, load_tiny_model(path) builds a transformers pipeline from a
+local seq2seq checkpoint directory.
+"""
+import re
+import time
+import zlib
+
+TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+class StubTokenizer:
+    """
+    Splits text into words and punctuation; ids are stable CRC32 hashes of the tokens.
+    Like a fast (Rust) tokenizer, it can return each token's character offsets.
+    """
+
+    is_fast = True
+
+    def _encode(self, text, truncation=False, max_length=None, return_offsets_mapping=False):
+        tokens = TOKEN_PATTERN.findall(text)
+        limit = max_length if truncation and max_length else None
+        encoded = {"input_ids": [zlib.crc32(token.encode("utf-8")) for token in tokens[:limit]]}
+        if return_offsets_mapping:
+            encoded["offset_mapping"] = [match.span() for match in TOKEN_PATTERN.finditer(text)][:limit]
+        return encoded
+
+    def __call__(self, text, truncation=False, max_length=None, add_special_tokens=True,
+                 return_offsets_mapping=False, **kwargs):
+        if isinstance(text, str):
+            return self._encode(text, truncation, max_length, return_offsets_mapping)
+        encoded = [self._encode(t, truncation, max_length, return_offsets_mapping) for t in text]
+        return {key: [e[key] for e in encoded] for key in encoded[0]} if encoded else {"input_ids": []}
+
+
+class StubSummarizer:
+    """Summarization pipeline stand-in: leading tokens of each input, with an optional simulated cost."""
+
+    def __init__(self, cost_per_token=0.0):
+        self.tokenizer = StubTokenizer()
+        self.cost_per_token = cost_per_token
+        self.calls = 0
+
+    def __call__(self, inputs, min_length=0, max_length=200, **kwargs):
+        texts = [inputs] if isinstance(inputs, str) else list(inputs)
+        self.calls += 1
+        summaries = [" ".join(TOKEN_PATTERN.findall(text)[:max_length]) for text in texts]
+        if self.cost_per_token:
+            longest = max(len(self.tokenizer(text)["input_ids"]) for text in texts)
+            generated = max(len(summary.split()) for summary in summaries)
+            time.sleep(self.cost_per_token * (longest * len(texts) + 10 * generated))
+        return [{"summary_text": summary} for summary in summaries]
+
+
+def load_tiny_model(path):
+    """Builds a summarization pipeline from a local (small) seq2seq checkpoint directory."""
+    from transformers import pipeline
+
+    return pipeline("summarization", model=str(path), tokenizer=str(path))
@@ -0,0 +1,233 @@
+"""
+Local stand-in for techcrunch.com used by the benchmarks.
+
+Serves a paginated listing at /latest/ and /latest/page/<p>/ (newest article first)
+and article pages at /article/<n>/ whose markup mirrors the classes the scraper looks for. Article bodies are built
+from the articles stored in data/, or replayed verbatim from recorded pages (benchmarks/fixtures/).
+"""
+import hashlib
+import html
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT_DIR / "data"
+
+
+def load_corpus(data_dir=DATA_DIR):
+    """Loads the stored .txt articles as dicts (title, authors, published_time, content)."""
+    corpus = []
+    for path in sorted(Path(data_dir).glob("*.txt")):
+        header, _, content = path.read_text(encoding="utf-8", errors="replace").partition("\n\n")
+        fields = dict(line.split(": ", 1) for line in header.splitlines() if ": " in line)
+        corpus.append({
+            "title": fields.get("Title", path.stem),
+            "authors": fields.get("Author(s)", "Unknown"),
+            "published_time": fields.get("Published", "Unknown"),
+            "content": content.strip(),
+        })
+    return corpus
+
+
+# Page chrome around the article, roughly shaped like a real TechCrunch page
+# (scripts, stylesheets, navigation, related-article cards and footer)
+def _page_chrome(n_links=120):
+    head = "".join(
+        f'<link rel="stylesheet" href="/wp-content/themes/tc/css/{i}.css">'
+        f'<script src="/wp-content/plugins/tc/js/{i}.js" defer></script>'
+        for i in range(40)
+    )
+    nav = "".join(
+        f'<li class="menu-item"><a class="menu-link" href="/category/section-{i}/">Section {i}</a></li>'
+        for i in range(n_links)
+    )
+    related = "".join(
+        f'<div class="wp-block-techcrunch-card"><div class="loop-card__meta"><span>Related</span></div>'
+        f'<h4 class="loop-card__title-small"><a href="/related/{i}/">Related story {i}</a></h4></div>'
+        for i in range(24)
+    )
+    footer = "".join(f'<a class="footer-link" href="/about/{i}/">Footer link {i}</a>' for i in range(60))
+    return head, f'<nav class="site-nav"><ul>{nav}</ul></nav>', f'<aside>{related}</aside>', f"<footer>{footer}</footer>"
+
+
+def render_listing(links):
+    """Renders a listing page with one TechCrunch card per link."""
+    head, nav, _, footer = _page_chrome()
+    cards = "\n".join(
+        f'<div class="wp-block-techcrunch-card"><h3 class="loop-card__title">'
+        f'<a href="{href}">{html.escape(title)}</a></h3></div>'
+        for href, title in links
+    )
+    return f"<html><head><title>Latest | TechCrunch</title>{head}</head><body>{nav}{cards}{footer}</body></html>"
+
+
+def render_article(article, published="2025-03-08T20:05:00+00:00", meta_author=True):
+    """
+    Renders an article page in TechCrunch's markup.
+
+    The first line of the content becomes the hero excerpt. Without `meta_author`,
+    authors only appear in the post-authors list.
+    """
+    head, nav, related, footer = _page_chrome()
+    lines = [line for line in article["content"].splitlines() if line.strip()]
+    excerpt, body = (lines[0], lines[1:]) if len(lines) > 1 else ("", lines)
+    paragraphs = "\n".join(f'<p class="wp-block-paragraph">{html.escape(p)}</p>' for p in body)
+    authors = "".join(
+        f'<li><a class="post-authors-list__author" href="/author/{i}/">{html.escape(name.strip())}</a></li>'
+        for i, name in enumerate(article["authors"].split(","))
+    )
+    meta = f'<meta name="author" content="{html.escape(article["authors"])}">' if meta_author else ""
+    return (
+        f"<html><head><title>{html.escape(article['title'])} | TechCrunch</title>{meta}{head}</head><body>{nav}"
+        f'<div class="wp-block-techcrunch-storyline-hero"><h1>{html.escape(article["title"])}</h1>'
+        f'<p class="wp-block-techcrunch-storyline-hero__excerpt">{html.escape(excerpt)}</p>'
+        f'<time datetime="{published}">{published}</time></div>'
+        f'<div class="post-authors-list"><ul class="post-authors-list__author-list">{authors}</ul></div>'
+        f'<div class="entry-content">{paragraphs}'
+        f'<p class="wp-block-paragraph">Topics <a href="/category/ai/">AI</a></p>'
+        f'<p class="wp-block-paragraph">© 2025 Yahoo.</p></div>{related}{footer}</body></html>'
+    )
+
+
+class StubServer:
+    """
+    Threaded HTTP/1.1 server on localhost serving `n_articles` synthetic articles.
+
+    Article `n_articles - 1` is the newest. Listing pages hold `page_size` articles
+    (all of them on /latest/ when None); raise `n_articles` to "publish" new ones.
+
+    `latency` adds a fixed delay (seconds) to every response to stand in for network round trips.
+    To stand in for a throttling server, `rate_limit` (requests per second, token bucket of
+    `rate_limit` tokens) answers 429 and `max_concurrent` (requests in flight) answers 503,
+    both with a `Retry-After` of `retry_after` seconds.
+    With `recorded` (a list of page HTML strings), article n is served as recorded page
+    n % len(recorded), byte for byte, instead of being rendered from the corpus.
+    Use as a context manager; `base_url` points at the listing page.
+    """
+
+    def __init__(self, n_articles=50, latency=0.05, corpus=None, page_size=None,
+                 rate_limit=None, max_concurrent=None, retry_after=1, recorded=None):
+        self.corpus = corpus or load_corpus()
+        self.recorded = recorded
+        self.n_articles = n_articles
+        self.page_size = page_size
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.max_concurrent = max_concurrent
+        self.retry_after = retry_after
+        self.requests_served = 0
+        self.requests_throttled = 0
+        self._in_flight = 0
+        self._tokens = rate_limit or 0
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/latest/"
+
+    def article_url(self, n):
+        return f"http://127.0.0.1:{self._server.server_address[1]}/article/{n}/"
+
+    def article(self, n):
+        article = dict(self.corpus[n % len(self.corpus)])
+        article["title"] = f"{article['title']} #{n}"
+        return article
+
+    def page_for(self, path):
+        """Returns the HTML for a request path, or None for a 404."""
+        if path == "/latest/" or path.startswith("/latest/page/"):
+            page = int(path.strip("/").split("/")[-1]) if path != "/latest/" else 1
+            newest_first = list(range(self.n_articles - 1, -1, -1))
+            if self.page_size:
+                newest_first = newest_first[(page - 1) * self.page_size:page * self.page_size]
+            elif page > 1:
+                newest_first = []
+            if not newest_first:
+                return None
+            return render_listing([(self.article_url(n), self.article(n)["title"]) for n in newest_first])
+        if path.startswith("/article/"):
+            n = int(path.strip("/").split("/")[-1])
+            if 0 <= n < self.n_articles:
+                if self.recorded:
+                    return self.recorded[n % len(self.recorded)]
+                return render_article(self.article(n), meta_author=n % 2 == 0)
+        return None
+
+    def _admit(self):
+        """Returns the throttle status for a new request (None if it may proceed)."""
+        with self._lock:
+            if self.rate_limit:
+                now = time.monotonic()
+                self._tokens = min(self.rate_limit, self._tokens + (now - self._refilled_at) * self.rate_limit)
+                self._refilled_at = now
+                if self._tokens < 1:
+                    self.requests_throttled += 1
+                    return 429
+                self._tokens -= 1
+            if self.max_concurrent and self._in_flight >= self.max_concurrent:
+                self.requests_throttled += 1
+                return 503
+            self._in_flight += 1
+            return None
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # keep-alive, so pooled sessions can reuse connections
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                throttled = stub._admit()
+                if throttled:
+                    self.send_response(throttled)
+                    self.send_header("Retry-After", str(stub.retry_after))
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                try:
+                    self._serve()
+                finally:
+                    with stub._lock:
+                        stub._in_flight -= 1
+
+            def _serve(self):
+                if stub.latency:
+                    time.sleep(stub.latency)
+                with stub._lock:
+                    stub.requests_served += 1
+                page = stub.page_for(self.path)
+                body = (page or "Not Found").encode("utf-8")
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+                if page and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200 if page else 404)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,330 @@
+"""
+Headless fetch -> chunk -> summarize -> store pipeline.
+
+Each stage runs in its own thread(s) and hands items to the next through a bounded
+queue, so page fetches overlap with model inference and at most a few articles are
+held in memory at any time, however many are processed. One JSON line is written
+per summarized article; per-stage throughput, queue depth and span timings go to
+stderr at the end.
+
+Run from the project root (e.g. from cron):
+    python src/pipeline.py --limit 50 --output summaries.jsonl
+    python src/pipeline.py --incremental --output summaries.jsonl   # only articles not seen before
+    cat urls.txt | python src/pipeline.py --urls - > summaries.jsonl
+"""
+import argparse
+import json
+import logging
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.scraping.crawler import MAX_PAGES, SeenIndex, listing_page_url
+from src.scraping.scraper import (
+    BASE_URL, CACHE_DIR, NEAR_DUPLICATES, extract_article_links, fetch_article_details, fetch_page,
+    near_duplicate_original, store_article, store_summary,
+)
+from src.summarization.summarizer import (
+    chunk_for_summary, get_cached_summary, get_summarizer, reuse_summary, summarize_texts,
+)
+from src.utils.metrics import METRICS
+
+QUEUE_SIZE = 8          # Max items waiting between two stages
+FETCH_WORKERS = 4       # Threads fetching article pages
+SUMMARY_BATCH = 4       # Max articles summarized in one batched model run
+MONITOR_INTERVAL = 0.5  # Seconds between queue depth samples
+
+# --incremental keeps its own seen index: the crawler's only means "fetched", not "summarized"
+PIPELINE_DB = CACHE_DIR / "pipeline_index.sqlite3"
+
+_DONE = object()  # End-of-stream marker passed down the queues
+
+
+class StageStats:
+    """Items in/out and busy time of one pipeline stage (shared by its worker threads)."""
+
+    def __init__(self, name):
+        self.name = name
+        self.items_in = 0
+        self.items_out = 0
+        self.busy_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, items_in, items_out, seconds):
+        with self._lock:
+            self.items_in += items_in
+            self.items_out += items_out
+            self.busy_seconds += seconds
+
+    def report(self, wall_seconds):
+        return {
+            "stage": self.name,
+            "in": self.items_in,
+            "out": self.items_out,
+            "busy_seconds": round(self.busy_seconds, 2),
+            "per_second": round(self.items_out / wall_seconds, 2) if wall_seconds else 0.0,
+        }
+
+
+class QueueMonitor(threading.Thread):
+    """Samples the depth of every queue until stopped; reports mean and max depth per queue."""
+
+    def __init__(self, queues, interval=MONITOR_INTERVAL):
+        super().__init__(daemon=True)
+        self.queues = queues
+        self.interval = interval
+        self.samples = {name: [] for name in queues}
+        self._stopped = threading.Event()
+
+    def run(self):
+        while not self._stopped.wait(self.interval):
+            for name, q in self.queues.items():
+                self.samples[name].append(q.qsize())
+
+    def stop(self):
+        self._stopped.set()
+        self.join()
+
+    def report(self):
+        return {
+            name: {
+                "mean_depth": round(sum(depths) / len(depths), 2) if depths else 0.0,
+                "max_depth": max(depths, default=0),
+            }
+            for name, depths in self.samples.items()
+        }
+
+
+def run_stage(name, handler, inbox, outbox, workers=1, batch_size=1):
+    """
+    Starts `workers` threads that take items (or batches of up to `batch_size` already
+    waiting items) from `inbox`, pass them to `handler` and put every item it returns on
+    `outbox`. The last thread to see the end-of-stream marker forwards it downstream.
+
+    Returns the stage's StageStats and its threads.
+    """
+    stats = StageStats(name)
+    remaining = [workers]
+    lock = threading.Lock()
+
+    def work():
+        done = False
+        while not done:
+            batch = [inbox.get()]
+            while batch[-1] is not _DONE and len(batch) < batch_size:
+                try:
+                    batch.append(inbox.get_nowait())
+                except queue.Empty:
+                    break
+            if batch[-1] is _DONE:
+                batch.pop()
+                done = True
+                inbox.put(_DONE)  # Let this stage's other workers see it too
+
+            if batch:
+                start = time.perf_counter()
+                try:
+                    outputs = handler(batch if batch_size > 1 else batch[0])
+                except Exception as e:
+                    logging.error(f"Pipeline stage {name} failed on {len(batch)} items: {e}")
+                    outputs = []
+                stats.record(len(batch), len(outputs), time.perf_counter() - start)
+                for output in outputs:
+                    if outbox is not None:
+                        outbox.put(output)
+
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last and outbox is not None:
+            outbox.put(_DONE)
+
+    threads = [threading.Thread(target=work, name=f"{name}-{i}", daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    return stats, threads
+
+
+def listing_urls(limit, base_url=BASE_URL, max_pages=MAX_PAGES, index=None):
+    """
+    Yields article URLs from the listing pages, newest first, until `limit` URLs.
+    With a SeenIndex, already seen URLs are skipped and the walk stops at the first
+    page that contains any (like crawler.crawl_incremental).
+    """
+    produced = 0
+    for page in range(1, max_pages + 1):
+        links = list(dict.fromkeys(extract_article_links(
+            fetch_page(listing_page_url(page, base_url), max_age=0), limit=None
+        )))
+        if not links:
+            return
+        seen = index.seen(links) if index else set()
+        for url in links:
+            if url in seen:
+                continue
+            if limit is not None and produced >= limit:
+                return
+            produced += 1
+            yield url
+        if seen:
+            return
+
+
+def run_pipeline(urls, output, min_length=50, max_length=200, store=True, with_content=False,
+                 fetch_workers=FETCH_WORKERS, summary_batch=SUMMARY_BATCH, index=None):
+    """
+    Runs the pipeline over an iterable of article URLs, writing one JSON line per summarized article to `output`.
+    Articles whose summarization fails are counted in the report's "failed" and are not stored.
+
+    Returns a report dict: wall time, per-stage stats, per-queue depth and per-span timings.
+    """
+    summarizer = get_summarizer()
+    if summarizer is None:
+        raise RuntimeError("Summarization model unavailable.")
+
+    url_queue, article_queue, chunk_queue, summary_queue = (queue.Queue(maxsize=QUEUE_SIZE) for _ in range(4))
+
+    def fetch(url):
+        article = fetch_article_details(url)
+        return [] if article["content"] == "Failed to fetch content" else [article]
+
+    def chunk(article):
+        return [(article, chunk_for_summary(article["content"], summarizer.tokenizer))]
+
+    def reused_summary(article):
+        """The summary of the article this one is a near-duplicate of, if it is cached (None otherwise)."""
+        original = near_duplicate_original(article)
+        if original is None or get_cached_summary(article["content"], min_length, max_length):
+            return None  # Not a near-duplicate, or already cached under its own text
+        result = reuse_summary(article["content"], original["content"], min_length, max_length)
+        if result and NEAR_DUPLICATES is not None:
+            NEAR_DUPLICATES.record_reuse(len(article["content"].split()))
+        return result
+
+    def summarize(items):
+        if not isinstance(items, list):  # summary_batch=1: run_stage passes the single (article, chunks) item
+            items = [items]
+        articles = [article for article, _ in items]
+        # Near-duplicates of already summarized articles reuse that summary instead of a model run
+        results = [reused_summary(article) for article in articles]
+        pending = [i for i, result in enumerate(results) if result is None]
+        summarized = summarize_texts(
+            [articles[i]["content"] for i in pending], min_length, max_length,
+            chunked=[items[i][1] for i in pending],
+        )
+        for i, result in zip(pending, summarized):
+            results[i] = result
+        return list(zip(articles, results))
+
+    failed = []  # URLs whose summarization failed (left unseen, so a later crawl retries them)
+
+    def write(item):
+        article, (summary_text, summary_stats) = item
+        if not summary_stats:
+            # Empty stats mean summarize_texts returned an error message
+            logging.warning(f"Not summarized: {article['url']} ({summary_text[:60]!r})")
+            failed.append(article["url"])
+            return []
+        if store:
+            store_article(article)
+            store_summary(article["url"], summary_text)
+        if index is not None:
+            index.add([article["url"]])
+        record = {
+            "url": article["url"],
+            "title": article["title"],
+            "authors": article["authors"],
+            "published_time": article["published_time"],
+            "near_duplicate": article.get("near_duplicate"),
+            "summary": summary_text,
+            "stats": summary_stats,
+        }
+        if with_content:
+            record["content"] = article["content"]
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+        return [item]
+
+    monitor = QueueMonitor({"urls": url_queue, "articles": article_queue, "chunks": chunk_queue,
+                            "summaries": summary_queue})
+    start = time.perf_counter()
+    monitor.start()
+    stages = [
+        run_stage("fetch", fetch, url_queue, article_queue, workers=fetch_workers),
+        run_stage("chunk", chunk, article_queue, chunk_queue),
+        run_stage("summarize", summarize, chunk_queue, summary_queue, batch_size=summary_batch),
+        run_stage("store", write, summary_queue, None),
+    ]
+
+    # Feed URLs from this thread; put() blocks while the fetchers are behind
+    n_urls = 0
+    for url in urls:
+        url_queue.put(url)
+        n_urls += 1
+    url_queue.put(_DONE)
+
+    for _, threads in stages:
+        for thread in threads:
+            thread.join()
+    monitor.stop()
+    wall = time.perf_counter() - start
+
+    return {
+        "urls": n_urls,
+        "written": stages[-1][0].items_out,
+        "failed": len(failed),
+        "seconds": round(wall, 2),
+        "stages": [stats.report(wall) for stats, _ in stages],
+        "queues": monitor.report(),
+        "spans": METRICS.snapshot(),
+    }
+
+
+def read_urls(source):
+    """Yields non-empty, non-comment lines of a URL file ("-" for stdin)."""
+    stream = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    with stream:
+        for line in stream:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch, summarize and store TechCrunch articles as JSON lines.")
+    parser.add_argument("--urls", help="file with one article URL per line ('-' for stdin); default: the listing")
+    parser.add_argument("--limit", type=int, default=20, help="max articles taken from the listing")
+    parser.add_argument("--incremental", action="store_true", help="skip listing articles summarized by earlier pipeline runs")
+    parser.add_argument("--output", default="-", help="JSONL file to append to ('-' for stdout)")
+    parser.add_argument("--min-length", type=int, default=50)
+    parser.add_argument("--max-length", type=int, default=200)
+    parser.add_argument("--fetch-workers", type=int, default=FETCH_WORKERS)
+    parser.add_argument("--batch", type=int, default=SUMMARY_BATCH, help="max articles per batched model run")
+    parser.add_argument("--no-store", action="store_true", help="don't save articles to the article store")
+    parser.add_argument("--with-content", action="store_true", help="include the article text in each line")
+    args = parser.parse_args()
+
+    index = SeenIndex(PIPELINE_DB) if args.incremental else None
+    urls = read_urls(args.urls) if args.urls else listing_urls(args.limit, index=index)
+    output = sys.stdout if args.output == "-" else open(args.output, "a", encoding="utf-8")
+    try:
+        report = run_pipeline(
+            urls, output, args.min_length, args.max_length, store=not args.no_store,
+            with_content=args.with_content, fetch_workers=args.fetch_workers, summary_batch=args.batch, index=index,
+        )
+    except RuntimeError as e:
+        print(f"Pipeline failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    logging.info(f"Pipeline finished: {report}")
+    print(json.dumps(report), file=sys.stderr)
+    sys.exit(0 if report["written"] or not report["urls"] else 1)
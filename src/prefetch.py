@@ -0,0 +1,149 @@
+"""
+Background prefetch-and-presummarize daemon.
+
+Every `--interval` seconds it fetches the latest articles, stores them with a snapshot
+of the listing, and summarizes the new ones at the app's default settings (slider at
+200 words, no condense pass). Near-duplicates of already summarized articles reuse
+that summary instead. The app then serves "Get Latest Articles" from the snapshot
+and summaries from the shared summary cache, computing live only on a miss.
+
+Summarization stays within an idle-CPU budget: it waits while the machine's load per
+core is above `--max-load`, and after each summary sleeps long enough that the daemon
+is busy at most `--cpu-budget` of the time.
+
+Run from the project root:
+    python src/prefetch.py --interval 600 --cpu-budget 0.5
+    python src/prefetch.py --once             # single refresh, e.g. from cron
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.scraping.scraper import (
+    ARTICLE_STORE, NEAR_DUPLICATES, get_latest_articles, near_duplicate_original, store_articles, store_summary,
+)
+from src.summarization.summarizer import get_cached_summary, reuse_summary, summarize_text
+from src.utils.metrics import start_metrics_server
+
+REFRESH_INTERVAL = 600  # Seconds between refreshes
+PREFETCH_LIMIT = 10     # Latest articles fetched per refresh (the app shows 5)
+CPU_BUDGET = 0.5        # Max fraction of wall time spent summarizing
+MAX_LOAD = 0.75         # Don't start a summary while the 1-minute load per core is above this
+IDLE_POLL = 5           # Seconds between load checks while the machine is busy
+
+
+def load_per_core():
+    """Returns the 1-minute load average per CPU core (0.0 where unsupported)."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (AttributeError, OSError):
+        return 0.0
+
+
+def wait_for_idle(max_load=MAX_LOAD, deadline=None):
+    """Waits until the load per core drops to `max_load`; False if `deadline` passes first."""
+    while load_per_core() > max_load:
+        if deadline is not None and time.time() >= deadline:
+            return False
+        time.sleep(IDLE_POLL)
+    return True
+
+
+def refresh_once(limit=PREFETCH_LIMIT, cpu_budget=CPU_BUDGET, max_load=MAX_LOAD, deadline=None):
+    """
+    Fetches and stores the latest articles, then presummarizes the ones not yet cached.
+    Summaries left over when the machine stays busy until `deadline` are picked up next run.
+
+    Returns the refresh stats.
+    """
+    start = time.perf_counter()
+    articles = [a for a in get_latest_articles(limit=limit) if a["content"] != "Failed to fetch content"]
+    store_articles(articles)
+    ARTICLE_STORE.set_latest(articles)
+
+    stats = {"fetched": len(articles), "cached": 0, "reused": 0, "summarized": 0, "failed": 0, "deferred": 0,
+             "summary_seconds": 0.0}
+    for article in articles:
+        if get_cached_summary(article["content"]):
+            stats["cached"] += 1
+            continue
+        # A near-duplicate of an already summarized article reuses that summary (and caches it as its own)
+        original = near_duplicate_original(article)
+        reused = original and reuse_summary(article["content"], original["content"])
+        if reused:
+            store_summary(article["url"], reused[0])
+            if NEAR_DUPLICATES is not None:
+                NEAR_DUPLICATES.record_reuse(len(article["content"].split()))
+            stats["reused"] += 1
+            continue
+        if not wait_for_idle(max_load, deadline):
+            stats["deferred"] += 1
+            continue
+
+        summary_start = time.perf_counter()
+        summary_text, summary_stats = summarize_text(article["content"])
+        busy = time.perf_counter() - summary_start
+        if summary_stats:
+            store_summary(article["url"], summary_text)
+            stats["summarized"] += 1
+        else:  # Empty stats: summarize_text returned an error message
+            stats["failed"] += 1
+        stats["summary_seconds"] += busy
+
+        # Duty cycle: idle for busy * (1 - budget) / budget so busy time stays within the budget
+        if cpu_budget < 1:
+            time.sleep(busy * (1 - cpu_budget) / cpu_budget)
+
+    stats["summary_seconds"] = round(stats["summary_seconds"], 2)
+    stats["seconds"] = round(time.perf_counter() - start, 2)
+    logging.info(f"Prefetch refresh finished: {stats}")
+    return stats
+
+
+def run_forever(interval=REFRESH_INTERVAL, limit=PREFETCH_LIMIT, cpu_budget=CPU_BUDGET, max_load=MAX_LOAD):
+    """Refreshes every `interval` seconds until interrupted."""
+    while True:
+        next_run = time.time() + interval
+        try:
+            stats = refresh_once(limit, cpu_budget, max_load, deadline=next_run)
+            print(f"{time.strftime('%Y-%m-%d %H:%M:%S')} {stats}", flush=True)
+        except Exception as e:
+            logging.error(f"Prefetch refresh failed: {e}")
+        time.sleep(max(0.0, next_run - time.time()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prefetch and presummarize the latest TechCrunch articles.")
+    parser.add_argument("--interval", type=float, default=REFRESH_INTERVAL, help="seconds between refreshes")
+    parser.add_argument("--limit", type=int, default=PREFETCH_LIMIT, help="latest articles fetched per refresh")
+    parser.add_argument("--cpu-budget", type=float, default=CPU_BUDGET,
+                        help="max fraction of time spent summarizing (0-1]")
+    parser.add_argument("--max-load", type=float, default=MAX_LOAD,
+                        help="wait while the 1-minute load per core is above this")
+    parser.add_argument("--threads", type=int, help="cap the model's intra-op threads")
+    parser.add_argument("--once", action="store_true", help="refresh once and exit")
+    parser.add_argument("--metrics-port", type=int, help="serve /metrics and /metrics.json on this port")
+    args = parser.parse_args()
+
+    if not 0 < args.cpu_budget <= 1:
+        parser.error("--cpu-budget must be in (0, 1]")
+    if args.threads:
+        import torch
+        torch.set_num_threads(args.threads)
+    if args.metrics_port:
+        start_metrics_server(args.metrics_port)
+
+    try:
+        if args.once:
+            print(refresh_once(args.limit, args.cpu_budget, args.max_load, deadline=time.time() + args.interval))
+        else:
+            run_forever(args.interval, args.limit, args.cpu_budget, args.max_load)
+    except KeyboardInterrupt:
+        print("Stopping prefetcher...")
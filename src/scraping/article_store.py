@@ -0,0 +1,306 @@
+import json
+import re
+import sqlite3
+import threading
+import time
+import logging
+from datetime import datetime
+
+from src.utils.hashing import content_hash
+
+
+ARTICLE_COLUMNS = ("url", "title", "authors", "published_time", "content")
+
+# Default for search(candidates=...): at most this many of the most recently stored
+# matches are ranked by BM25. Queries with fewer matches are ranked exactly; for very
+# common terms it is a recency window that can miss older, better matches, but it keeps
+# search within ~50 ms on a 100k-article store. None ranks every match.
+SEARCH_CANDIDATES = 10000
+
+
+def parse_published_time(published_time):
+    """
+    Converts the scraper's display date ("March 08, 2025 at 10:05 PM (EET)") to an ISO string
+    for range queries; None if it can't be parsed.
+    """
+    try:
+        return datetime.strptime(published_time.split(" (")[0], "%B %d, %Y at %I:%M %p").isoformat()
+    except (AttributeError, ValueError):
+        return None
+
+
+def _snippet(content, words, width=24):
+    """Returns about `width` words of `content` around the first query match, matches in bold."""
+    pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, words)) + r")\w*", re.IGNORECASE)
+    tokens = content.split()
+    first = next((i for i, token in enumerate(tokens) if pattern.search(token)), 0)
+    start = max(0, first - width // 4)
+    text = pattern.sub(lambda m: f"**{m.group(0)}**", " ".join(tokens[start:start + width]))
+    return f"{'… ' if start else ''}{text}{' …' if start + width < len(tokens) else ''}"
+
+
+class ArticleStore:
+    """
+    Indexed article store (SQLite) keyed by URL and content hash.
+
+    - Writing an article whose content is already stored under another URL is skipped.
+    - Re-writing a URL only updates it when its content changed.
+    - Articles can be queried by publication date range, author and title;
+      authors are kept in a separate indexed table.
+    - Title, authors, content and the generated summary are full-text indexed (FTS5),
+      kept in sync by triggers, and searchable with BM25 ranking.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                id INTEGER PRIMARY KEY,  -- stable rowid for the full-text index
+                url TEXT NOT NULL UNIQUE,
+                content_hash TEXT NOT NULL,
+                title TEXT NOT NULL,
+                authors TEXT NOT NULL,
+                published_time TEXT NOT NULL,
+                published_at TEXT,
+                content TEXT NOT NULL,
+                summary TEXT,
+                stored_at REAL NOT NULL
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_articles_hash ON articles(content_hash);
+            CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at);
+            CREATE INDEX IF NOT EXISTS idx_articles_title ON articles(title COLLATE NOCASE);
+            CREATE TABLE IF NOT EXISTS article_authors (
+                url TEXT NOT NULL,
+                author TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (author, url)
+            );
+            CREATE INDEX IF NOT EXISTS idx_article_authors_url ON article_authors(url);
+
+            -- Latest listing snapshot written by the prefetcher, in listing order
+            CREATE TABLE IF NOT EXISTS latest (
+                position INTEGER PRIMARY KEY,
+                url TEXT NOT NULL,
+                content_hash TEXT NOT NULL,  -- resolves articles stored under another URL
+                near_duplicate TEXT,         -- JSON, as set by the scraper's near-duplicate check
+                fetched_at REAL NOT NULL
+            );
+
+            -- Full-text index over the articles table (external content, no duplicate text)
+            CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+                title, authors, content, summary,
+                content='articles', content_rowid='id', tokenize='porter unicode61', prefix='2 3 4'
+            );
+            CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+                INSERT INTO articles_fts(rowid, title, authors, content, summary)
+                VALUES (new.id, new.title, new.authors, new.content, new.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, authors, content, summary)
+                VALUES ('delete', old.id, old.title, old.authors, old.content, old.summary);
+            END;
+            CREATE TRIGGER IF NOT EXISTS articles_fts_update AFTER UPDATE ON articles BEGIN
+                INSERT INTO articles_fts(articles_fts, rowid, title, authors, content, summary)
+                VALUES ('delete', old.id, old.title, old.authors, old.content, old.summary);
+                INSERT INTO articles_fts(rowid, title, authors, content, summary)
+                VALUES (new.id, new.title, new.authors, new.content, new.summary);
+            END;
+            """
+        )
+        self._conn.commit()
+
+    def add(self, article):
+        """Stores one article. Returns True if it was inserted or updated, False if skipped."""
+        return self.add_many([article]) == 1
+
+    def add_many(self, articles):
+        """Stores a batch of articles in one transaction. Returns how many were inserted or updated."""
+        written = 0
+        now = time.time()
+        with self._lock:
+            for article in articles:
+                if article.get("content") in (None, "", "Failed to fetch content"):
+                    continue
+                digest = content_hash(article["content"])
+                existing = self._conn.execute(
+                    "SELECT url FROM articles WHERE content_hash = ?", (digest,)
+                ).fetchone()
+                if existing:
+                    continue  # same content already stored (under this or another URL)
+
+                # Explicit delete + insert (not INSERT OR REPLACE) so the FTS delete trigger fires
+                self._conn.execute("DELETE FROM article_authors WHERE url = ?", (article["url"],))
+                self._conn.execute("DELETE FROM articles WHERE url = ?", (article["url"],))
+                self._conn.execute(
+                    "INSERT INTO articles (url, content_hash, title, authors, published_time, published_at, content, stored_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (article["url"], digest, article["title"], article["authors"], article["published_time"],
+                     parse_published_time(article["published_time"]), article["content"], now),
+                )
+                authors = {name.strip() for name in article["authors"].split(",") if name.strip()}
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO article_authors VALUES (?, ?)",
+                    [(article["url"], author) for author in authors],
+                )
+                written += 1
+            self._conn.commit()
+        logging.info(f"Stored {written} of {len(articles)} articles.")
+        return written
+
+    def set_summary(self, url, summary_text):
+        """Attaches a generated summary to a stored article (and to its full-text index entry)."""
+        self.set_summaries([(url, summary_text)])
+
+    def set_summaries(self, items):
+        """Attaches a batch of (url, summary_text) pairs in one transaction."""
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE articles SET summary = ? WHERE url = ?", [(summary, url) for url, summary in items]
+            )
+            self._conn.commit()
+
+    def search(self, text, limit=20, candidates=SEARCH_CANDIDATES):
+        """
+        Full-text search over title, authors, content and summary, best BM25 matches first.
+
+        Every word of `text` must match (the last one as a prefix, for search-as-you-type).
+        Only the newest `candidates` matches are ranked (see SEARCH_CANDIDATES); None ranks all of them.
+        Returns article dicts with an extra highlighted `snippet` and `score`.
+        """
+        words = re.findall(r"\w+", text)
+        if not words:
+            return []
+        match = " ".join(f'"{word}"' for word in words[:-1]) + f' "{words[-1]}"*'
+
+        # Rank on the index alone, then read the article rows for the top `limit` matches only
+        if candidates is None:
+            ranked = """SELECT rowid, bm25(articles_fts, 10.0, 5.0, 1.0, 2.0) AS score
+                        FROM articles_fts WHERE articles_fts MATCH ? ORDER BY score LIMIT ?"""
+            params = (match.strip(), limit)
+        else:
+            ranked = """SELECT rowid, score FROM (
+                            SELECT rowid, bm25(articles_fts, 10.0, 5.0, 1.0, 2.0) AS score
+                            FROM articles_fts WHERE articles_fts MATCH ?
+                            ORDER BY rowid DESC LIMIT ?
+                        ) ORDER BY score LIMIT ?"""
+            params = (match.strip(), candidates, limit)
+        rows = self._conn.execute(
+            f"""WITH ranked AS ({ranked})
+                SELECT {', '.join('a.' + c for c in ARTICLE_COLUMNS)}, ranked.score
+                FROM ranked JOIN articles a ON a.id = ranked.rowid
+                ORDER BY ranked.score""",
+            params,
+        ).fetchall()
+        return [
+            {**dict(zip(ARTICLE_COLUMNS, row)), "snippet": _snippet(row[4], words), "score": row[-1]}
+            for row in rows
+        ]
+
+    def set_latest(self, articles):
+        """
+        Replaces the latest listing snapshot with `articles` (newest first). Each one is
+        linked by content hash, so an article skipped by add_many as a copy of one stored
+        under another URL still resolves to that stored article.
+        """
+        now = time.time()
+        rows = [
+            (i, article["url"], content_hash(article["content"]),
+             json.dumps(article["near_duplicate"]) if article.get("near_duplicate") else None, now)
+            for i, article in enumerate(articles)
+        ]
+        with self._lock:
+            self._conn.execute("DELETE FROM latest")
+            self._conn.executemany("INSERT INTO latest VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.commit()
+
+    def latest(self, limit=None, max_age=None):
+        """
+        Returns the stored articles of the latest listing snapshot, newest first (with their
+        `near_duplicate` flag), or [] when there is none or it is older than `max_age` seconds.
+        """
+        fetched_at = self.latest_fetched_at()
+        if fetched_at is None or (max_age is not None and time.time() - fetched_at > max_age):
+            return []
+        rows = self._conn.execute(
+            f"SELECT {', '.join('a.' + c for c in ARTICLE_COLUMNS)}, l.near_duplicate FROM latest l "
+            f"JOIN articles a ON a.content_hash = l.content_hash ORDER BY l.position LIMIT ?",
+            (-1 if limit is None else limit,),
+        ).fetchall()
+        return [
+            {**dict(zip(ARTICLE_COLUMNS, row)), "near_duplicate": json.loads(row[-1]) if row[-1] else None}
+            for row in rows
+        ]
+
+    def latest_fetched_at(self):
+        """Returns when the latest listing snapshot was taken (epoch seconds), or None."""
+        return self._conn.execute("SELECT MIN(fetched_at) FROM latest").fetchone()[0]
+
+    def optimize_index(self):
+        """Merges the full-text index segments into one (worth running after bulk imports)."""
+        with self._lock:
+            self._conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('optimize')")
+            self._conn.commit()
+
+    def get(self, url):
+        """Returns the article dict stored for `url`, or None."""
+        row = self._conn.execute(
+            f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles WHERE url = ?", (url,)
+        ).fetchone()
+        return dict(zip(ARTICLE_COLUMNS, row)) if row else None
+
+    def get_by_hash(self, digest):
+        """Returns the article dict whose content has the given hash, or None."""
+        row = self._conn.execute(
+            f"SELECT {', '.join(ARTICLE_COLUMNS)} FROM articles WHERE content_hash = ?", (digest,)
+        ).fetchone()
+        return dict(zip(ARTICLE_COLUMNS, row)) if row else None
+
+    def query(self, start=None, end=None, author=None, title=None, limit=100):
+        """
+        Returns articles newest first, filtered by publication date range (ISO dates/datetimes,
+        inclusive), exact author name and title substring (both case-insensitive).
+        """
+        clauses, params = [], []
+        if start:
+            clauses.append("a.published_at >= ?")
+            params.append(start)
+        if end:
+            clauses.append("a.published_at <= ?")
+            params.append(end if "T" in end else f"{end}T23:59:59")
+        if author:
+            clauses.append("a.url IN (SELECT url FROM article_authors WHERE author = ?)")
+            params.append(author)
+        if title:
+            clauses.append("a.title LIKE ?")
+            params.append(f"%{title}%")
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self._conn.execute(
+            f"SELECT {', '.join('a.' + c for c in ARTICLE_COLUMNS)} FROM articles a {where} "
+            f"ORDER BY a.published_at DESC LIMIT ?",
+            (*params, limit),
+        ).fetchall()
+        return [dict(zip(ARTICLE_COLUMNS, row)) for row in rows]
+
+    def iter_articles(self, batch_size=1000, with_summary=False):
+        """
+        Yields every stored article dict without loading the whole corpus at once.
+        With `with_summary`, each dict also carries its stored "summary" (or None).
+        """
+        columns = ARTICLE_COLUMNS + ("summary",) if with_summary else ARTICLE_COLUMNS
+        last_url = ""
+        while True:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(columns)} FROM articles WHERE url > ? ORDER BY url LIMIT ?",
+                (last_url, batch_size),
+            ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield dict(zip(columns, row))
+            last_url = rows[-1][0]
+
+    def count(self):
+        return self._conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
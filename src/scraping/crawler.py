@@ -0,0 +1,153 @@
+"""
+Incremental crawler for TechCrunch's paginated listing.
+
+Walks /latest/, /latest/page/2/, ... newest first and stops at the first page that
+contains an article already in the seen-URL index, so each run only fetches what
+was published since the last one.
+
+Run from the project root:
+    python src/scraping/crawler.py --max-pages 10 --store
+"""
+import argparse
+import logging
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.scraping.scraper import (
+    BASE_URL, CACHE_DIR, MAX_WORKERS, extract_article_links, fetch_articles, fetch_page, store_articles,
+)
+
+# Define the crawl index database path
+CRAWL_DB = CACHE_DIR / "crawl_index.sqlite3"
+
+MAX_PAGES = 10  # Hard stop for the listing walk (e.g. on the very first run)
+
+
+def listing_page_url(page, base_url=BASE_URL):
+    """Returns the URL of listing page `page` (1 is the base listing)."""
+    return base_url if page == 1 else f"{base_url}page/{page}/"
+
+
+class SeenIndex:
+    """Persistent index of article URLs already fetched, plus per-run crawl stats (SQLite)."""
+
+    def __init__(self, path=CRAWL_DB):
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY, first_seen REAL NOT NULL)")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS crawl_runs (
+                started_at REAL NOT NULL,
+                seconds REAL NOT NULL,
+                pages INTEGER NOT NULL,
+                new INTEGER NOT NULL,
+                skipped INTEGER NOT NULL,
+                failed INTEGER NOT NULL
+            )"""
+        )
+        self._conn.commit()
+
+    def seen(self, urls):
+        """Returns the subset of `urls` already in the index."""
+        urls = list(urls)
+        if not urls:
+            return set()
+        placeholders = ",".join("?" * len(urls))
+        rows = self._conn.execute(f"SELECT url FROM seen WHERE url IN ({placeholders})", urls).fetchall()
+        return {row[0] for row in rows}
+
+    def add(self, urls):
+        """Adds URLs to the index."""
+        now = time.time()
+        self._conn.executemany("INSERT OR IGNORE INTO seen VALUES (?, ?)", [(url, now) for url in urls])
+        self._conn.commit()
+
+    def record_run(self, stats):
+        """Stores the stats of a crawl run."""
+        self._conn.execute(
+            "INSERT INTO crawl_runs VALUES (?, ?, ?, ?, ?, ?)",
+            (stats["started_at"], stats["seconds"], stats["pages"], stats["new"], stats["skipped"], stats["failed"]),
+        )
+        self._conn.commit()
+
+    def recent_runs(self, limit=10):
+        """Returns the stats of the latest crawl runs, newest first."""
+        rows = self._conn.execute(
+            "SELECT started_at, seconds, pages, new, skipped, failed FROM crawl_runs ORDER BY started_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        keys = ("started_at", "seconds", "pages", "new", "skipped", "failed")
+        return [dict(zip(keys, row)) for row in rows]
+
+
+def crawl_incremental(index=None, max_pages=MAX_PAGES, base_url=BASE_URL, max_workers=MAX_WORKERS, store=False):
+    """
+    Fetches the articles published since the last run.
+
+    With `store`, each page's new articles are saved to the article store and only then
+    marked as seen. Without it the run is a dry run: nothing is marked, so the next
+    crawl fetches the same articles again.
+
+    Returns:
+        - articles (list): Newly fetched article dicts, newest first.
+        - stats (dict): Pages walked, new / skipped / failed article counts and run time.
+    """
+    index = index or SeenIndex()
+    started_at = time.time()
+    start = time.perf_counter()
+    articles, pages, skipped, failed = [], 0, 0, 0
+
+    for page in range(1, max_pages + 1):
+        # Listing pages change constantly, so always revalidate them
+        soup = fetch_page(listing_page_url(page, base_url), max_age=0)
+        links = extract_article_links(soup, limit=None)
+        if not links:
+            break
+        pages += 1
+
+        seen = index.seen(links)
+        new_links = [url for url in dict.fromkeys(links) if url not in seen]
+        skipped += len(links) - len(new_links)
+
+        fetched = fetch_articles(new_links, max_workers=max_workers)
+        ok = [article for article in fetched if article["content"] != "Failed to fetch content"]
+        failed += len(fetched) - len(ok)
+        if store:
+            store_articles(ok)
+            index.add(article["url"] for article in ok)
+        articles.extend(ok)
+
+        # Listing is newest first: once we reach known articles, everything older is known too
+        if seen:
+            break
+
+    stats = {
+        "started_at": started_at,
+        "seconds": round(time.perf_counter() - start, 2),
+        "pages": pages,
+        "new": len(articles),
+        "skipped": skipped,
+        "failed": failed,
+    }
+    index.record_run(stats)
+    logging.info(f"Incremental crawl finished: {stats}")
+    return articles, stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fetch TechCrunch articles published since the last crawl.")
+    parser.add_argument("--max-pages", type=int, default=MAX_PAGES)
+    parser.add_argument("--store", action="store_true",
+                        help="save new articles to the article store (without it, nothing is marked as seen)")
+    args = parser.parse_args()
+
+    articles, stats = crawl_incremental(max_pages=args.max_pages, store=args.store)
+    for i, article in enumerate(articles, 1):
+        print(f"{i}. {article['title']}  ({article['url']})")
+    print(f"Pages walked: {stats['pages']} | New: {stats['new']} | Skipped: {stats['skipped']} | "
+          f"Failed: {stats['failed']} | {stats['seconds']}s")
@@ -0,0 +1,152 @@
+import sqlite3
+import threading
+import time
+import logging
+
+
+class HttpCache:
+    """
+    Persistent on-disk HTTP response cache keyed by URL (SQLite).
+
+    - Entries younger than `ttl` seconds are served straight from disk.
+    - Older entries are revalidated with If-None-Match / If-Modified-Since;
+      a 304 response is served from disk and refreshes the entry.
+    - Total body size is capped at `max_bytes`; least recently used entries are evicted first.
+    """
+
+    def __init__(self, path, ttl=3600, max_bytes=200 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.counters = {"hits": 0, "revalidated": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)")
+        self._conn.commit()
+
+    def lookup(self, url):
+        """Returns the cached entry for `url` as a dict, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+        return {"url": url, "body": row[0], "etag": row[1], "last_modified": row[2], "fetched_at": row[3]}
+
+    def is_fresh(self, entry, max_age=None):
+        """Checks whether an entry can be served without contacting the server."""
+        max_age = self.ttl if max_age is None else max_age
+        return time.time() - entry["fetched_at"] < max_age
+
+    @staticmethod
+    def conditional_headers(entry):
+        """Builds the validator headers for revalidating a cached entry."""
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, body, etag=None, last_modified=None):
+        """Stores a response body and its validators, evicting old entries if over the size cap."""
+        now = time.time()
+        size = len(body.encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, size, now, now),
+            )
+            self.counters["stores"] += 1
+            self._evict()
+            self._conn.commit()
+
+    def refresh(self, url):
+        """Marks an entry as freshly validated (after a 304)."""
+        with self._lock:
+            self._conn.execute("UPDATE responses SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Free down to 90% of the cap so we don't evict on every store
+        target = self.max_bytes * 0.9
+        for url, size in self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= target:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            self.counters["evictions"] += 1
+
+    def fetch(self, session, url, timeout=10, max_age=None, scheduler=None):
+        """
+        GETs `url` through the cache and returns the response text.
+
+        `max_age` overrides the TTL for this call (0 always revalidates).
+        Network requests go through `scheduler` (a RequestScheduler) when given.
+        Raises requests.RequestException on network/HTTP errors.
+        """
+        entry = self.lookup(url)
+        if entry and self.is_fresh(entry, max_age):
+            self._count("hits")
+            return entry["body"]
+
+        headers = self.conditional_headers(entry) if entry else {}
+        if scheduler is not None:
+            response = scheduler.get(session, url, headers=headers, timeout=timeout)
+        else:
+            response = session.get(url, headers=headers, timeout=timeout)
+
+        if response.status_code == 304 and entry:
+            self.refresh(url)
+            self._count("revalidated")
+            return entry["body"]
+
+        response.raise_for_status()
+        self._count("misses")
+        self.store(url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        return response.text
+
+    def _count(self, name):
+        with self._lock:
+            self.counters[name] += 1
+
+    def stats(self):
+        """Returns hit/miss counters plus the current entry count and size on disk."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.counters["hits"] + self.counters["revalidated"] + self.counters["misses"]
+        served = self.counters["hits"] + self.counters["revalidated"]
+        return {
+            **self.counters,
+            "entries": entries,
+            "size_bytes": size,
+            "hit_ratio": round(served / lookups, 2) if lookups else 0,
+        }
+
+    def clear(self):
+        """Removes every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+        logging.info("HTTP cache cleared.")
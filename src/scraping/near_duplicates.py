@@ -0,0 +1,160 @@
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+import numpy as np
+
+
+NUM_PERM = 128          # MinHash signature length
+LSH_BANDS = 32          # Bands x rows must equal NUM_PERM; 32 x 4 finds candidates from ~0.45 similarity up
+LSH_ROWS = NUM_PERM // LSH_BANDS
+SHINGLE_WORDS = 3       # Word n-grams compared between articles
+MERSENNE_PRIME = (1 << 61) - 1
+
+# Fixed permutations so signatures stay comparable across runs and processes
+_rng = np.random.RandomState(1)
+_PERM_A = _rng.randint(1, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, 1 << 32, size=NUM_PERM, dtype=np.uint64)
+
+
+def shingles(text, size=SHINGLE_WORDS):
+    """Returns the set of lowercased word n-grams of `text`."""
+    words = re.findall(r"\w+", text.lower())
+    return {" ".join(words[i:i + size]) for i in range(max(1, len(words) - size + 1))}
+
+
+def minhash_signature(text):
+    """Returns the MinHash signature (NUM_PERM uint32 values) of the text's shingles."""
+    hashes = np.fromiter(
+        (zlib.crc32(shingle.encode("utf-8")) for shingle in shingles(text)), dtype=np.uint64
+    )
+    permuted = (hashes[:, None] * _PERM_A + _PERM_B) % MERSENNE_PRIME
+    return (permuted & 0xFFFFFFFF).min(axis=0).astype(np.uint32)
+
+
+def estimate_similarity(signature_a, signature_b):
+    """Estimated Jaccard similarity of two signatures."""
+    return float(np.mean(signature_a == signature_b))
+
+
+def _band_buckets(signature):
+    """One LSH bucket id per band; the band number is hashed in so buckets never collide across bands."""
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS].tobytes()
+        digest = hashlib.blake2b(band.to_bytes(1, "little") + rows, digest_size=8).digest()
+        buckets.append(int.from_bytes(digest, "little", signed=True))
+    return buckets
+
+
+class NearDuplicateIndex:
+    """
+    Persistent near-duplicate index of article content (MinHash + LSH, SQLite).
+
+    - check() finds the most similar already indexed article at or above `threshold`
+      (estimated Jaccard similarity of word 3-grams), then indexes the new one.
+    - Candidates come from LSH buckets, so a lookup doesn't scan the whole index.
+    - Counters record how many articles were flagged and how much summarization
+      was skipped by reusing a near-duplicate's summary.
+    """
+
+    def __init__(self, path, threshold=0.8):
+        self.path = path
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS signatures (url TEXT PRIMARY KEY, signature BLOB NOT NULL, added_at REAL NOT NULL);
+            CREATE INDEX IF NOT EXISTS idx_signatures_added ON signatures(added_at);
+            CREATE TABLE IF NOT EXISTS lsh_buckets (bucket INTEGER NOT NULL, url TEXT NOT NULL);
+            CREATE INDEX IF NOT EXISTS idx_lsh_bucket ON lsh_buckets(bucket);
+            CREATE INDEX IF NOT EXISTS idx_lsh_url ON lsh_buckets(url);
+            CREATE TABLE IF NOT EXISTS counters (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            """
+        )
+        self._conn.commit()
+
+    def find(self, text, url=None):
+        """
+        Returns (url, similarity) of the closest indexed article at or above the threshold, or None.
+        When `url` is already indexed, only articles indexed before it are considered.
+        """
+        return self._find(minhash_signature(text), url)
+
+    def _find(self, signature, url):
+        row = self._conn.execute("SELECT added_at FROM signatures WHERE url = ?", (url,)).fetchone()
+        added_before = row[0] if row else float("inf")
+        buckets = _band_buckets(signature)
+        rows = self._conn.execute(
+            f"SELECT url, signature FROM signatures WHERE added_at < ? AND url IN "
+            f"(SELECT url FROM lsh_buckets WHERE bucket IN ({','.join('?' * len(buckets))}))",
+            (added_before, *buckets),
+        ).fetchall()
+        best = None
+        for candidate, blob in rows:
+            if candidate == url:
+                continue
+            similarity = estimate_similarity(signature, np.frombuffer(blob, dtype=np.uint32))
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (candidate, round(similarity, 3))
+        return best
+
+    def add(self, url, text):
+        """Indexes (or re-indexes) the content of `url`."""
+        signature = minhash_signature(text)
+        with self._lock:
+            self._add(url, signature)
+            self._conn.commit()
+
+    def _add(self, url, signature):
+        self._conn.execute("DELETE FROM lsh_buckets WHERE url = ?", (url,))
+        self._conn.execute(
+            "INSERT INTO signatures VALUES (?, ?, ?) ON CONFLICT(url) DO UPDATE SET signature = excluded.signature",
+            (url, signature.tobytes(), time.time()),
+        )
+        self._conn.executemany(
+            "INSERT INTO lsh_buckets VALUES (?, ?)", [(bucket, url) for bucket in _band_buckets(signature)]
+        )
+
+    def check(self, url, text):
+        """
+        Looks up a freshly fetched article and indexes it (a re-fetched URL keeps its place,
+        so it is only ever flagged against articles seen before it).
+        Returns {"url", "similarity"} of its near-duplicate, or None.
+        """
+        signature = minhash_signature(text)
+        with self._lock:
+            match = self._find(signature, url)
+            row = self._conn.execute("SELECT signature FROM signatures WHERE url = ?", (url,)).fetchone()
+            # Re-fetches of unchanged content (cache misses, prefetch cycles) are not counted again
+            if row is None or row[0] != signature.tobytes():
+                self._add(url, signature)
+                self._increment("checked")
+                if match:
+                    self._increment("near_duplicates")
+                self._conn.commit()
+        return {"url": match[0], "similarity": match[1]} if match else None
+
+    def record_reuse(self, words):
+        """Counts a summary reused from a near-duplicate instead of running the model on `words` words."""
+        with self._lock:
+            self._increment("summaries_reused")
+            self._increment("words_not_summarized", words)
+            self._conn.commit()
+
+    def _increment(self, name, amount=1):
+        self._conn.execute(
+            "INSERT INTO counters VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def stats(self):
+        """Returns the index size and the checked / near_duplicates / summaries_reused / words_not_summarized counters."""
+        stats = {"indexed": 0, "checked": 0, "near_duplicates": 0, "summaries_reused": 0, "words_not_summarized": 0}
+        stats.update(self._conn.execute("SELECT name, value FROM counters").fetchall())
+        stats["indexed"] = self._conn.execute("SELECT COUNT(*) FROM signatures").fetchone()[0]
+        return stats
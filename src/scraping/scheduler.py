@@ -0,0 +1,245 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import requests
+
+
+THROTTLE_STATUSES = frozenset({429, 503})   # Server asks us to slow down
+RETRY_STATUSES = frozenset({500, 502, 504})  # Transient server errors
+STATS_WINDOW = 30                            # Seconds of completed requests behind rate / latency stats
+RATE_WINDOW = 2                              # Seconds of successes behind a host's measured request rate
+
+
+def parse_retry_after(value, now=None):
+    """Returns the delay in seconds from a Retry-After header (seconds or HTTP date), or None."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - (now or time.time()))
+    except (TypeError, ValueError):
+        return None
+
+
+class _HostState:
+    """Concurrency window and pacing state of one host."""
+
+    def __init__(self, limit):
+        self.limit = float(limit)
+        self.in_flight = 0
+        self.not_before = 0.0      # No new request starts before this time (Retry-After / backoff / pacing)
+        self.rate = None           # Paced requests per second, set once the host has throttled us
+        self.last_decrease = 0.0
+        self.baseline_latency = None
+        self.recent = deque()      # Finish times of recent successes, for the measured rate
+        self.created_at = time.time()
+        self.cond = threading.Condition()
+
+    def measured_rate(self, now):
+        while self.recent and self.recent[0] < now - RATE_WINDOW:
+            self.recent.popleft()
+        return len(self.recent) / max(1e-3, min(RATE_WINDOW, now - self.created_at))
+
+
+class RequestScheduler:
+    """
+    Adaptive per-host request scheduler: AIMD concurrency, Retry-After and jittered backoff.
+
+    - Each host gets a concurrency window that grows by about one request per window of
+      successes while it is in full use (additive increase) and halves on a throttle
+      (429/503) or error response, or shrinks by `latency_decrease` when latency climbs to
+      `latency_factor` x its baseline (multiplicative decrease, once per congestion event).
+    - Once a host throttles, request starts are also paced: the pacing rate drops to
+      `rate_decrease` x the rate measured when throttled, then grows by about
+      `rate_increase` requests/s every second, so a request-rate limit is probed slowly
+      instead of being tripped on every window increase.
+    - Throttled requests wait for `Retry-After` (the whole host pauses, for at most
+      `backoff_max`; longer waits return the throttled response); connection errors and
+      timeouts are retried up to `max_retries` times with full-jitter exponential backoff.
+    - stats() reports live request rate, latency percentiles, window sizes and counters.
+    """
+
+    def __init__(self, initial_concurrency=4, min_concurrency=1, max_concurrency=16, max_retries=4,
+                 backoff_base=0.5, backoff_max=30.0, latency_factor=2.0, latency_decrease=0.8,
+                 rate_decrease=0.85, rate_increase=2.0):
+        self.initial_concurrency = initial_concurrency
+        self.min_concurrency = min_concurrency
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.latency_factor = latency_factor
+        self.latency_decrease = latency_decrease
+        self.rate_decrease = rate_decrease
+        self.rate_increase = rate_increase
+        self._hosts = {}
+        self._started = time.time()
+        self._lock = threading.Lock()
+        self._completed = deque()  # (finished_at, latency) of recent successful requests
+        self._counters = {"requests": 0, "succeeded": 0, "throttled": 0, "errors": 0, "retries": 0, "failed": 0}
+
+    def _host(self, url):
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = _HostState(self.initial_concurrency)
+            return self._hosts[host]
+
+    def _count(self, name):
+        with self._lock:
+            self._counters[name] += 1
+
+    def _acquire(self, state):
+        with state.cond:
+            while True:
+                wait = state.not_before - time.time()
+                if wait > 0:
+                    state.cond.wait(wait)
+                elif state.in_flight >= int(state.limit):
+                    state.cond.wait()
+                else:
+                    state.in_flight += 1
+                    if state.rate:
+                        state.not_before = time.time() + 1 / state.rate
+                    return
+
+    def _release(self, state):
+        with state.cond:
+            state.in_flight -= 1
+            state.cond.notify_all()
+
+    def _on_success(self, state, latency):
+        now = time.time()
+        with state.cond:
+            if state.baseline_latency is None:
+                state.baseline_latency = latency
+            else:
+                # Slow-moving baseline that follows improvements faster than regressions
+                weight = 0.5 if latency < state.baseline_latency else 0.05
+                state.baseline_latency += weight * (latency - state.baseline_latency)
+
+            if latency > self.latency_factor * state.baseline_latency:
+                self._decrease(state, self.latency_decrease, now, cooldown=latency)
+            elif state.in_flight + 1 >= int(state.limit):
+                # Only grow a window that is actually in use (not held back by pacing)
+                state.limit = min(self.max_concurrency, state.limit + 1 / state.limit)
+            if state.rate:
+                state.rate += self.rate_increase / state.rate
+            state.recent.append(now)
+            state.cond.notify_all()
+        with self._lock:
+            self._counters["succeeded"] += 1
+            self._completed.append((now, latency))
+            while self._completed and self._completed[0][0] < now - STATS_WINDOW:
+                self._completed.popleft()
+
+    def _decrease(self, state, factor, now, cooldown):
+        # One decrease per congestion event, not one per request caught in it
+        if now - state.last_decrease >= cooldown:
+            state.limit = max(self.min_concurrency, state.limit * factor)
+            state.last_decrease = now
+
+    def _on_failure(self, state, delay, latency, throttled=False):
+        now = time.time()
+        with state.cond:
+            if throttled and now - state.last_decrease >= latency:
+                measured = state.measured_rate(now) or 1 / max(latency, 1e-3)
+                state.rate = max(0.1, self.rate_decrease * min(state.rate or measured, measured))
+            self._decrease(state, 0.5, now, cooldown=latency or 0.0)
+            state.not_before = max(state.not_before, now + delay)
+            state.cond.notify_all()
+
+    def _backoff(self, attempt):
+        """Full-jitter exponential backoff for retry `attempt` (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def get(self, session, url, **kwargs):
+        """
+        GETs `url` through `session` under the host's concurrency window, retrying
+        throttled and failed attempts. Returns the final response (which may still be an
+        error status once retries run out); raises the last exception if every attempt raised.
+        """
+        state = self._host(url)
+        for attempt in range(self.max_retries + 1):
+            self._acquire(state)
+            self._count("requests")
+            start = time.perf_counter()
+            try:
+                response = session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+            except Exception:
+                # Not worth retrying (redirect loops, bad URLs, decoding errors, hook errors)
+                self._count("errors")
+                self._count("failed")
+                raise
+            else:
+                error = None
+            finally:
+                # Every exit path gives the slot back, or the host's window leaks shut
+                self._release(state)
+            latency = time.perf_counter() - start
+
+            if error is not None:
+                self._count("errors")
+                if attempt == self.max_retries:
+                    self._count("failed")
+                    raise error
+                delay = self._backoff(attempt)
+                self._on_failure(state, delay, latency)
+                logging.warning(f"{url}: {error}; retrying in {delay:.2f}s")
+                self._count("retries")
+                continue
+
+            status = response.status_code
+            if status not in THROTTLE_STATUSES and status not in RETRY_STATUSES:
+                self._on_success(state, latency)
+                return response
+
+            self._count("throttled" if status in THROTTLE_STATUSES else "errors")
+            if attempt == self.max_retries:
+                self._count("failed")
+                return response
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = retry_after if retry_after is not None else self._backoff(attempt)
+            # A Retry-After beyond backoff_max would stall the host (and the caller) for that long: give up instead
+            self._on_failure(state, min(delay, self.backoff_max), latency, throttled=status in THROTTLE_STATUSES)
+            if delay > self.backoff_max:
+                self._count("failed")
+                logging.warning(f"{url}: HTTP {status} with Retry-After {delay:.0f}s (over {self.backoff_max}s); giving up")
+                return response
+            logging.warning(f"{url}: HTTP {status}; retrying in {delay:.2f}s")
+            self._count("retries")
+
+    def stats(self):
+        """Returns counters, request rate and latency percentiles over the last STATS_WINDOW seconds, and per-host windows."""
+        now = time.time()
+        with self._lock:
+            recent = [latency for finished, latency in self._completed if finished >= now - STATS_WINDOW]
+            stats = dict(self._counters)
+            hosts = dict(self._hosts)
+        latencies = sorted(recent)
+
+        def percentile(p):
+            return round(latencies[min(len(latencies) - 1, int(p * len(latencies)))], 3) if latencies else None
+
+        stats.update({
+            "rate_per_second": round(len(recent) / max(1e-3, min(STATS_WINDOW, now - self._started)), 2),
+            "latency_p50": percentile(0.5),
+            "latency_p95": percentile(0.95),
+            "hosts": {
+                host: {"limit": round(state.limit, 2), "in_flight": state.in_flight,
+                       "paced_rate": round(state.rate, 2) if state.rate else None,
+                       "baseline_latency": round(state.baseline_latency or 0.0, 3)}
+                for host, state in hosts.items()
+            },
+        })
+        return stats
@@ -1,12 +1,31 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 from datetime import datetime
 import pytz  
 import os
+import sys
 import logging
 from pathlib import Path
 from docx import Document
 import re
+import sqlite3
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.scraping.http_cache import HttpCache
+from src.scraping.extraction import extract_article_fields
+from src.scraping.article_store import ArticleStore, SEARCH_CANDIDATES as DEFAULT_SEARCH_CANDIDATES
+from src.scraping.near_duplicates import NearDuplicateIndex
+from src.scraping.scheduler import RequestScheduler
+from src.utils.metrics import METRICS, propagate, timed
 
 
 # Get the absolute path to the logs directory
@@ -33,6 +52,13 @@ logging.info("Scraper started.")
 STORAGE_DIR = Path(__file__).resolve().parent.parent.parent / "data"
 STORAGE_DIR.mkdir(exist_ok=True)  # Ensure the directory exists
 
+# Indexed article store; .txt/.docx files are only rendered by export_article
+ARTICLE_STORE = ArticleStore(STORAGE_DIR / "articles.sqlite3")
+
+# Define HTTP cache directory
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "cache"
+CACHE_DIR.mkdir(exist_ok=True)
+
 
 # Constants
 BASE_URL = "https://techcrunch.com/latest/"
@@ -41,17 +67,100 @@ HEADERS = {
     "Accept-Language": "en-US,en;q=0.5",
 }
 
-def fetch_page(url):
-    """Fetches and parses a webpage, returning a BeautifulSoup object."""
+# Concurrency settings for fetching article pages
+MAX_WORKERS = 8        # Threads used to fetch article pages in parallel
+MAX_PER_HOST = 4       # Max in-flight requests to a single host
+MAX_RETRIES = 3        # Bounded retries for connection errors and 429/5xx responses
+REQUEST_TIMEOUT = 10
+MAX_CONCURRENCY = 16   # Upper bound of the scheduler's adaptive per-host concurrency window
+
+# HTTP cache settings
+CACHE_TTL = 3600                     # Serve cached pages without revalidating for 1 hour
+CACHE_MAX_BYTES = 200 * 1024 * 1024  # LRU-evict cached pages beyond 200 MB
+
+# Near-duplicate detection (event promos, syndicated pieces): estimated word 3-gram
+# Jaccard similarity at which a new article counts as a copy of an earlier one
+NEAR_DUPLICATE_THRESHOLD = float(os.environ.get("NEAR_DUPLICATE_THRESHOLD", 0.8))
+
+# Full-text search ranks at most this many of the newest matches (exact below that);
+# SEARCH_CANDIDATES=0 ranks every match, which is slower for very common terms on a large store
+SEARCH_CANDIDATES = int(os.environ.get("SEARCH_CANDIDATES", DEFAULT_SEARCH_CANDIDATES)) or None
+
+# Latest-listing snapshots written by the background prefetcher (src/prefetch.py) are served for this long
+PREFETCH_MAX_AGE = 1800
+
+
+def create_session(pool_size=MAX_WORKERS, retries=MAX_RETRIES):
+    """Creates a keep-alive session with a connection pool and bounded retries."""
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Adaptive per-host concurrency, Retry-After and jittered backoff for every fetch (set to None to disable)
+FETCH_SCHEDULER = RequestScheduler(
+    initial_concurrency=MAX_PER_HOST, max_concurrency=MAX_CONCURRENCY, max_retries=MAX_RETRIES,
+)
+
+# Shared session so every fetch reuses pooled connections (no new TCP/TLS handshake per page).
+# Retries are left to the scheduler when it is enabled.
+SESSION = create_session(pool_size=MAX_CONCURRENCY, retries=0 if FETCH_SCHEDULER is not None else MAX_RETRIES)
+
+# Persistent conditional response cache shared by every fetch (set to None to disable)
+HTTP_CACHE = HttpCache(CACHE_DIR / "http_cache.sqlite3", ttl=CACHE_TTL, max_bytes=CACHE_MAX_BYTES)
+
+# MinHash index of fetched article content, checked after every fetch (set to None to disable)
+NEAR_DUPLICATES = NearDuplicateIndex(CACHE_DIR / "near_duplicates.sqlite3", threshold=NEAR_DUPLICATE_THRESHOLD)
+
+
+def fetch_html(url, session=None, max_age=None):
+    """
+    Fetches a webpage, returning its HTML (None on error).
+
+    Pages go through HTTP_CACHE; `max_age` overrides its TTL (0 always revalidates).
+    If the cache's database fails, the page is fetched without it.
+    """
+    session = session or SESSION
     try:
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        return BeautifulSoup(response.text, "lxml")
+        with METRICS.span("fetch_html", url=url):
+            if HTTP_CACHE is not None:
+                try:
+                    return HTTP_CACHE.fetch(session, url, timeout=REQUEST_TIMEOUT, max_age=max_age, scheduler=FETCH_SCHEDULER)
+                except sqlite3.Error as e:
+                    # A locked or broken cache file shouldn't stop scraping: fetch the page without it
+                    logging.error(f"HTTP cache unavailable for {url}, fetching without it: {e}")
+            if FETCH_SCHEDULER is not None:
+                response = FETCH_SCHEDULER.get(session, url, timeout=REQUEST_TIMEOUT)
+            else:
+                response = session.get(url, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            return response.text
     except requests.RequestException as e:
         print(f"Error fetching {url}: {e}")
         logging.error(f"Error fetching {url}: {e}")
         return None
 
+@timed()
+def fetch_page(url, session=None, max_age=None):
+    """Fetches and parses a webpage, returning a BeautifulSoup object."""
+    html = fetch_html(url, session=session, max_age=max_age)
+    if html is None:
+        return None
+    with METRICS.span("parse_html"):
+        return BeautifulSoup(html, "lxml")
+
+@timed()
 def extract_article_links(soup, limit=3):
     """Extracts the latest article links."""
     if not soup:
@@ -70,32 +179,40 @@ def extract_article_links(soup, limit=3):
 
     return links
 
+def format_authors(meta_author, author_names):
+    """Builds the author string from the author meta tag's content, else the author list."""
+    if meta_author and meta_author.strip():
+        return meta_author.strip()
+
+    authors = set()
+    for name in author_names:
+        authors.add(name.strip())
+
+    return ", ".join(authors) if authors else "Unknown"
+
+@timed()
 def extract_authors(soup):
     """Extracts the author(s) from the article's meta tag or author list."""
     meta_author = soup.find("meta", attrs={"name": "author"})
-    if meta_author and meta_author["content"].strip():
-        return meta_author["content"].strip()
 
-    authors = set()
+    author_names = []
     for author_list in soup.find_all("ul", class_="post-authors-list__author-list"):
         for author_tag in author_list.find_all("a", class_="post-authors-list__author"):
-            authors.add(author_tag.text.strip())
+            author_names.append(author_tag.text)
 
-    return ", ".join(authors) if authors else "Unknown"
+    return format_authors(meta_author["content"] if meta_author else None, author_names)
 
-def extract_article_content(soup):
-    """Extracts the main content of the article."""
-    excerpt_tag = soup.find("p", class_="wp-block-techcrunch-storyline-hero__excerpt")
-    excerpt = excerpt_tag.text.strip().replace("\n\n", " ") if excerpt_tag else ""
+def format_article_content(excerpt_text, paragraph_texts):
+    """Builds the article content from the excerpt text and the paragraph texts."""
+    excerpt = excerpt_text.strip().replace("\n\n", " ") if excerpt_text is not None else ""
 
-    paragraphs = soup.find_all("p", class_="wp-block-paragraph")
     # content = "\n".join(
     #     p.text.strip() for p in paragraphs 
     #     if p.text.strip() and not p.text.strip().startswith("Topics") and "© 2024 Yahoo" not in p.text.strip()
     # )
     content = "\n".join(
-    p.text.strip() for p in paragraphs
-    if p.text.strip() and not p.text.strip().startswith("Topics")
+    p.strip() for p in paragraph_texts
+    if p.strip() and not p.strip().startswith("Topics")
     )
 
     # Remove copyright patterns like "© 2025 Yahoo" or similar
@@ -106,6 +223,13 @@ def extract_article_content(soup):
 
     return f"{excerpt}\n{content}".strip() if excerpt else content or "Content not available"
 
+@timed()
+def extract_article_content(soup):
+    """Extracts the main content of the article."""
+    excerpt_tag = soup.find("p", class_="wp-block-techcrunch-storyline-hero__excerpt")
+    paragraphs = soup.find_all("p", class_="wp-block-paragraph")
+    return format_article_content(excerpt_tag.text if excerpt_tag else None, [p.text for p in paragraphs])
+
 def format_published_time(time_str):
     """Converts an ISO 8601 datetime string into a human-readable format."""
     try:
@@ -116,34 +240,77 @@ def format_published_time(time_str):
         logging.warning(f"Invalid date format: {time_str}")
         return "Unknown Date"
 
-def fetch_article_details(url):
-    """Fetches full details (title, author, published time, content) from a given article URL."""
-    soup = fetch_page(url)
-    if not soup:
-        logging.error(f"Failed to fetch article content from {url}")
-        return {"url": url, "title": "Unknown", "authors": "Unknown", "published_time": "Unknown", "content": "Failed to fetch content"}
-
-    title_tag = soup.find("title")
-    title = title_tag.text.strip().replace(" | TechCrunch", "") if title_tag else "No Title"
+@timed()
+def parse_article(url, html):
+    """Builds the article dict (url, title, authors, published_time, content) from a page's HTML."""
+    fields = extract_article_fields(html)
 
-    time_tag = soup.find("time")
-    published_time = format_published_time(time_tag["datetime"]) if time_tag and time_tag.has_attr("datetime") else "Unknown"
+    title = fields["title"].strip().replace(" | TechCrunch", "") if fields["title"] is not None else "No Title"
+    published_time = format_published_time(fields["datetime"]) if fields["datetime"] is not None else "Unknown"
 
-    article_data = {
+    return {
         "url": url,
         "title": title,
-        "authors": extract_authors(soup),
+        "authors": format_authors(fields["meta_author"], fields["author_names"]),
         "published_time": published_time,
-        "content": extract_article_content(soup),
+        "content": format_article_content(fields["excerpt"], fields["paragraphs"]),
     }
 
-    logging.info(f"Successfully fetched article: {title}")
+@timed()
+def fetch_article_details(url, session=None):
+    """Fetches full details (title, author, published time, content) from a given article URL."""
+    html = fetch_html(url, session=session)
+    if html is None:
+        logging.error(f"Failed to fetch article content from {url}")
+        return {"url": url, "title": "Unknown", "authors": "Unknown", "published_time": "Unknown", "content": "Failed to fetch content"}
+
+    article_data = parse_article(url, html)
+
+    # Flag near-copies of earlier articles so their summary can be reused
+    if NEAR_DUPLICATES is not None and article_data["content"] != "Content not available":
+        with METRICS.span("near_duplicate_check"):
+            article_data["near_duplicate"] = NEAR_DUPLICATES.check(url, article_data["content"])
+        if article_data["near_duplicate"]:
+            logging.info(f"{url} is a near-duplicate of {article_data['near_duplicate']['url']} "
+                         f"(similarity {article_data['near_duplicate']['similarity']})")
+
+    logging.info(f"Successfully fetched article: {article_data['title']}")
 
     return article_data
 
-def get_latest_articles(limit=3):
+def fetch_articles(urls, max_workers=MAX_WORKERS, max_per_host=MAX_PER_HOST, session=None):
+    """
+    Fetches the details of many articles concurrently over a shared session.
+
+    Per-host concurrency is adapted by FETCH_SCHEDULER when it is enabled; otherwise at
+    most `max_per_host` requests are in flight to any single host.
+    Results are returned in the same order as `urls`.
+    """
+    if max_workers <= 1 or len(urls) <= 1:
+        return [fetch_article_details(url, session=session) for url in urls]
+
+    if FETCH_SCHEDULER is not None:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            # propagate: spans in the pool threads join the caller's trace
+            return list(executor.map(propagate(lambda url: fetch_article_details(url, session=session)), urls))
+
+    host_limits = defaultdict(lambda: threading.BoundedSemaphore(max_per_host))
+    host_limits_lock = threading.Lock()
+
+    def fetch_limited(url):
+        with host_limits_lock:
+            host_limit = host_limits[urlparse(url).netloc]
+        with host_limit:
+            return fetch_article_details(url, session=session)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        # executor.map keeps the listing order regardless of completion order
+        return list(executor.map(propagate(fetch_limited), urls))
+
+def get_latest_articles(limit=3, max_workers=MAX_WORKERS):
     """Fetches the latest articles' details."""
-    soup = fetch_page(BASE_URL)
+    # The listing changes constantly, so always revalidate it (a 304 is still served from disk)
+    soup = fetch_page(BASE_URL, max_age=0)
     article_links = extract_article_links(soup, limit)
 
     if not article_links:
@@ -151,21 +318,48 @@ def get_latest_articles(limit=3):
         logging.warning("No articles found.")
         return []
 
-    articles = [fetch_article_details(url) for url in article_links]
+    articles = fetch_articles(article_links, max_workers=max_workers)
 
     logging.info(f"Successfully fetched {len(articles)} articles.")
+    if HTTP_CACHE is not None:
+        logging.info(f"HTTP cache stats: {HTTP_CACHE.stats()}")
 
     return articles
 
 
 
-def store_article(article_data, file_format="txt"):
+def store_article(article_data):
+    """Stores an article in the indexed article store (skipped if its content is already stored)."""
+    return ARTICLE_STORE.add(article_data)
+
+def store_articles(articles):
+    """Stores a batch of articles (e.g. one crawl run) in a single transaction; returns how many were written."""
+    return ARTICLE_STORE.add_many(articles)
+
+def store_summary(url, summary_text):
+    """Attaches a generated summary to a stored article so it becomes searchable."""
+    ARTICLE_STORE.set_summary(url, summary_text)
+
+def search_articles(query, limit=20):
+    """Full-text searches the stored articles and their summaries; best matches first."""
+    return ARTICLE_STORE.search(query, limit=limit, candidates=SEARCH_CANDIDATES)
+
+def get_prefetched_articles(limit=3, max_age=PREFETCH_MAX_AGE):
+    """Returns the latest articles prefetched by the background refresher, or [] if none are fresh."""
+    return ARTICLE_STORE.latest(limit=limit, max_age=max_age)
+
+def near_duplicate_original(article_data):
+    """Returns the stored article that `article_data` was flagged as a near-duplicate of, or None."""
+    match = article_data.get("near_duplicate")
+    return ARTICLE_STORE.get(match["url"]) if match else None
+
+def export_article(article_data, file_format="txt", directory=STORAGE_DIR):
     """
-    Stores the article in the specified format (txt or docx).
+    Renders an article to a .txt or .docx file in `directory` and returns its path (None on failure).
     """
     # Clean title for filename
     title = article_data["title"].replace("/", "-")  
-    filename = STORAGE_DIR / f"{title}.{file_format}"
+    filename = Path(directory) / f"{title}.{file_format}"
 
     try:
         if file_format == "txt":
@@ -183,13 +377,13 @@ def store_article(article_data, file_format="txt"):
             doc.save(filename)
         else:
             logging.warning(f"Unsupported file format: {file_format}")
-            return False
+            return None
         
-        logging.info(f"Article saved successfully: {filename}")
-        return True
+        logging.info(f"Article exported successfully: {filename}")
+        return filename
     except Exception as e:
-        logging.error(f"Error saving article {article_data['title']}: {e}")
-        return False
+        logging.error(f"Error exporting article {article_data['title']}: {e}")
+        return None
 
 
 
@@ -199,8 +393,7 @@ if __name__ == "__main__":
 
     for i, article in enumerate(articles, 1):
 
-        store_article(article, "docx")
-        store_article(article, "txt")
+        store_article(article)
         print(f"{i}. {article['title']}")
         print(f"   Link: {article['url']}")
         print(f"   Published: {article['published_time']}")
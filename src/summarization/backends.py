@@ -0,0 +1,61 @@
+import logging
+from pathlib import Path
+
+
+# Exported ONNX models are stored next to the PyTorch weights
+ONNX_DIR = Path(__file__).resolve().parent.parent.parent / "models" / "bart-large-cnn-onnx"
+
+
+def load_pytorch(model_dir):
+    """Full-precision PyTorch model (the original path). Uses the GPU when available."""
+    import torch
+    from transformers import AutoModelForSeq2SeqLM
+
+    device = 0 if torch.cuda.is_available() else -1
+    return AutoModelForSeq2SeqLM.from_pretrained(str(model_dir)), device
+
+
+def load_int8(model_dir):
+    """PyTorch model with dynamic int8 quantization of every Linear layer (CPU only)."""
+    import torch
+    from transformers import AutoModelForSeq2SeqLM
+
+    model = AutoModelForSeq2SeqLM.from_pretrained(str(model_dir))
+    model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    return model, -1
+
+
+def load_onnx(model_dir, onnx_dir=ONNX_DIR):
+    """
+    ONNX Runtime model via `optimum` (CPU), exported from the local weights on first use.
+
+    Requires the optional `optimum[onnxruntime]` package.
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    except ImportError as e:
+        raise ImportError("The onnx backend requires `pip install optimum[onnxruntime]`.") from e
+
+    if not (onnx_dir / "config.json").exists():
+        logging.info("Exporting BART model to ONNX for the first time...")
+        model = ORTModelForSeq2SeqLM.from_pretrained(str(model_dir), export=True)
+        model.save_pretrained(onnx_dir)
+        logging.info("ONNX model exported and saved locally.")
+        return model, -1
+    return ORTModelForSeq2SeqLM.from_pretrained(str(onnx_dir)), -1
+
+
+# Backend name -> loader(model_dir) returning (model, pipeline device)
+BACKENDS = {
+    "pytorch": load_pytorch,
+    "int8": load_int8,
+    "onnx": load_onnx,
+}
+
+
+def load_backend_model(backend, model_dir):
+    """Loads the model for a backend name, raising ValueError for unknown backends."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown summarizer backend '{backend}'. Choose one of: {', '.join(BACKENDS)}")
+    logging.info(f"Loading summarizer backend: {backend}")
+    return BACKENDS[backend](model_dir)
@@ -0,0 +1,143 @@
+import json
+import sqlite3
+import time
+import logging
+from pathlib import Path
+
+
+# Define the job queue database path
+QUEUE_PATH = Path(__file__).resolve().parent.parent.parent / "cache" / "summary_jobs.sqlite3"
+
+# Running jobs not finished within this many seconds are assumed lost and requeued
+STALE_JOB_SECONDS = 600
+
+
+class JobQueue:
+    """
+    Persistent local summarization job queue (SQLite), shared by the app and worker processes.
+
+    Jobs are keyed by the summary cache key (content hash + generation settings), so
+    submitting the same article twice returns the existing job instead of queueing a new one.
+    Job states: "queued" -> "running" -> "done" | "failed".
+    """
+
+    def __init__(self, path=QUEUE_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; claim() manages its own transaction
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")  # readers don't block the workers
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                params TEXT NOT NULL,
+                status TEXT NOT NULL,
+                summary TEXT,
+                stats TEXT,
+                error TEXT,
+                worker TEXT,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status, created_at)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+    def submit(self, job_id, text, **params):
+        """
+        Queues a summarization job and returns its id.
+
+        An existing job with the same id is reused; a failed one is queued again.
+        """
+        self._conn.execute(
+            "INSERT OR IGNORE INTO jobs (id, text, params, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+            (job_id, text, json.dumps(params), time.time()),
+        )
+        self._conn.execute(
+            "UPDATE jobs SET status = 'queued', error = NULL, created_at = ? WHERE id = ? AND status = 'failed'",
+            (time.time(), job_id),
+        )
+        return job_id
+
+    def set_worker_backend(self, backend):
+        """Records the inference backend the workers run, so job and cache keys match their results."""
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('worker_backend', ?)", (backend,))
+
+    def worker_backend(self):
+        """Returns the inference backend of the most recently started worker, or None if none has started."""
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'worker_backend'").fetchone()
+        return row[0] if row else None
+
+    def claim(self, worker):
+        """Atomically takes the oldest queued job for `worker`; returns (id, text, params) or None."""
+        now = time.time()
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Requeue jobs whose worker died mid-run
+            self._conn.execute(
+                "UPDATE jobs SET status = 'queued', worker = NULL WHERE status = 'running' AND started_at < ?",
+                (now - STALE_JOB_SECONDS,),
+            )
+            row = self._conn.execute(
+                "SELECT id, text, params FROM jobs WHERE status = 'queued' ORDER BY created_at LIMIT 1"
+            ).fetchone()
+            if row:
+                self._conn.execute(
+                    "UPDATE jobs SET status = 'running', worker = ?, started_at = ? WHERE id = ?",
+                    (worker, now, row[0]),
+                )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return (row[0], row[1], json.loads(row[2])) if row else None
+
+    def complete(self, job_id, summary_text, summary_stats):
+        """Stores a finished job's result."""
+        self._conn.execute(
+            "UPDATE jobs SET status = 'done', summary = ?, stats = ?, finished_at = ? WHERE id = ?",
+            (summary_text, json.dumps(summary_stats), time.time(), job_id),
+        )
+
+    def fail(self, job_id, error):
+        """Marks a job as failed."""
+        self._conn.execute(
+            "UPDATE jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+            (str(error), time.time(), job_id),
+        )
+        logging.error(f"Summarization job {job_id} failed: {error}")
+
+    def status(self, job_id):
+        """Returns a job's state and, once done, its summary and stats; None for unknown ids."""
+        row = self._conn.execute(
+            "SELECT status, summary, stats, error, worker, created_at, started_at, finished_at FROM jobs WHERE id = ?",
+            (job_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        status, summary, stats, error, worker, created_at, started_at, finished_at = row
+        return {
+            "id": job_id,
+            "status": status,
+            "summary": summary,
+            "stats": json.loads(stats) if stats else {},
+            "error": error,
+            "worker": worker,
+            "queued_seconds": round((started_at or time.time()) - created_at, 2),
+            "run_seconds": round((finished_at or time.time()) - started_at, 2) if started_at else None,
+        }
+
+    def counts(self):
+        """Returns the number of jobs in each state."""
+        counts = {"queued": 0, "running": 0, "done": 0, "failed": 0}
+        counts.update(self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+        return counts
+
+    def purge(self, older_than_seconds=7 * 24 * 3600):
+        """Deletes finished jobs older than the given age."""
+        self._conn.execute(
+            "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at < ?",
+            (time.time() - older_than_seconds,),
+        )
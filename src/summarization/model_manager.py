@@ -0,0 +1,154 @@
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.summarization.backends import load_backend_model
+
+
+# Define model path in "models" directory
+MODEL_DIR = Path(__file__).resolve().parent.parent.parent / "models" / "bart-large-cnn"
+MODEL_NAME = "facebook/bart-large-cnn"
+
+# Inference backend: "pytorch" (fp32), "int8" (dynamic quantization) or "onnx" (ONNX Runtime)
+SUMMARIZER_BACKEND = os.environ.get("SUMMARIZER_BACKEND", "pytorch")
+
+# A failed load is retried on the next start()/get() after this many seconds, doubled per
+# consecutive failure up to RETRY_BACKOFF_MAX (a download or disk hiccup shouldn't need a restart)
+RETRY_BACKOFF = 30
+RETRY_BACKOFF_MAX = 600
+
+
+def download_model(model_name=MODEL_NAME, model_dir=MODEL_DIR):
+    """
+    Downloads the model and tokenizer files into `model_dir` on first run.
+
+    Files are copied straight from the Hub without loading the weights, so each backend
+    loads the model exactly once.
+    """
+    if (model_dir / "config.json").exists():  # Check if the model is already downloaded
+        return
+    from huggingface_hub import snapshot_download
+
+    model_dir.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
+    logging.info("Downloading BART model for the first time...")
+    # Configs, tokenizer files and the safetensors weights only (skip TF/Flax/Rust weights)
+    snapshot_download(model_name, local_dir=model_dir, allow_patterns=["*.json", "*.txt", "model.safetensors"])
+    logging.info("BART model downloaded and saved locally.")
+
+
+def load_summarization_pipeline(backend=SUMMARIZER_BACKEND, model_name=MODEL_NAME, model_dir=MODEL_DIR):
+    """
+    Builds the summarization pipeline for an inference backend, downloading the model on first run.
+
+    The model and tokenizer are loaded once and handed to the pipeline.
+    """
+    # Heavy imports live here so importing this module stays cheap
+    from transformers import pipeline, AutoTokenizer
+
+    download_model(model_name, model_dir)
+    logging.info("Loading BART model from local storage.")
+    model, device = load_backend_model(backend, model_dir)
+    tokenizer = AutoTokenizer.from_pretrained(str(model_dir))
+
+    return pipeline("summarization", model=model, tokenizer=tokenizer, device=device)
+
+
+class ModelManager:
+    """
+    Lazily loads one shared summarization pipeline per process.
+
+    `start()` begins loading on a background thread and returns immediately;
+    `get()` returns the pipeline, loading it (or waiting for the background load) if needed.
+    States: "not_loaded" -> "loading" -> "ready" | "failed"; "failed" goes back to
+    "loading" on the first start()/get() after the retry back-off.
+    """
+
+    def __init__(self, backend=SUMMARIZER_BACKEND, loader=load_summarization_pipeline,
+                 retry_backoff=RETRY_BACKOFF, retry_backoff_max=RETRY_BACKOFF_MAX):
+        self.backend = backend
+        self._loader = loader
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self._failures = 0
+        self._retry_at = None
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._thread = None
+        self.pipeline = None
+        self.state = "not_loaded"
+        self.error = None
+        self.started_at = None
+        self.load_seconds = None
+
+    def start(self):
+        """
+        Starts loading the model on a background thread (no-op if loading or loaded,
+        or if the last load failed and its retry back-off hasn't elapsed).
+        """
+        with self._lock:
+            if self.state == "failed" and time.monotonic() >= self._retry_at:
+                logging.info(f"Retrying model load (attempt {self._failures + 1}).")
+            elif self.state != "not_loaded":
+                return
+            self.state = "loading"
+            self.started_at = time.perf_counter()
+            self.load_seconds = None
+            self._ready.clear()
+            self._thread = threading.Thread(target=self._load, name="model-loader", daemon=True)
+            self._thread.start()
+
+    def _load(self):
+        try:
+            self.pipeline = self._loader(self.backend)
+            self._failures = 0
+            self.error = None
+            self.state = "ready"
+        except Exception as e:
+            self._failures += 1
+            backoff = min(self.retry_backoff * 2 ** (self._failures - 1), self.retry_backoff_max)
+            logging.error(f"Error loading BART model (retrying after {backoff}s): {e}")
+            print(f"Error loading BART model: {e}")
+            self.error = str(e)
+            self._retry_at = time.monotonic() + backoff
+        finally:
+            # Under the lock: start() may restart a failed load as soon as it sees "failed"
+            with self._lock:
+                if self.state != "ready":
+                    self.state = "failed"
+                self.load_seconds = round(time.perf_counter() - self.started_at, 2)
+                logging.info(f"Model load finished in {self.load_seconds}s (state: {self.state}).")
+                self._ready.set()
+
+    def get(self, timeout=None):
+        """
+        Returns the pipeline, blocking until it is loaded; None if loading failed or timed out.
+        A failed load is retried here once its back-off has elapsed.
+        """
+        self.start()
+        self._ready.wait(timeout)
+        return self.pipeline
+
+    def is_ready(self):
+        return self.state == "ready"
+
+    def metrics(self):
+        """Returns the load state and timing (and, after a failure, the seconds until the next retry)."""
+        elapsed = None
+        if self.started_at is not None:
+            elapsed = self.load_seconds if self.load_seconds is not None else round(time.perf_counter() - self.started_at, 2)
+        retry_in = None
+        if self.state == "failed":
+            retry_in = max(0, round(self._retry_at - time.monotonic()))
+        return {"state": self.state, "backend": self.backend, "load_seconds": elapsed, "error": self.error,
+                "retry_in": retry_in}
+
+
+# Single shared instance per process
+MODEL_MANAGER = ModelManager()
@@ -1,9 +1,21 @@
-from transformers import pipeline, AutoModelForSeq2SeqLM, AutoTokenizer
+import bisect
 import logging
 from pathlib import Path
 import textstat
 import json
-import torch
+import queue
+import re
+import sys
+import threading
+import time
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.summarization.summary_cache import SummaryCache, summary_cache_key
+from src.summarization.model_manager import MODEL_MANAGER, MODEL_NAME
+from src.utils.metrics import METRICS, timed
 
 
 
@@ -15,42 +27,40 @@ logging.basicConfig(
     level=logging.INFO,
 )
 
-# Define model path in "models" directory
-MODEL_DIR = Path(__file__).resolve().parent.parent.parent / "models" / "bart-large-cnn"
-MODEL_DIR.mkdir(parents=True, exist_ok=True)  # Ensure directory exists
+# Persistent summary cache shared across sessions and restarts (set to None to disable)
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "cache"
+CACHE_DIR.mkdir(exist_ok=True)
+SUMMARY_CACHE = SummaryCache(CACHE_DIR / "summaries.sqlite3", max_entries=10000)
 
 
-# Check for available device (CUDA or CPU)
-device = 0 if torch.cuda.is_available() else -1  # Use device 0 (GPU) if available, otherwise use CPU (-1)
+def get_summarizer(timeout=None):
+    """Returns the shared summarization pipeline, loading it on first use (None if unavailable)."""
+    return MODEL_MANAGER.get(timeout)
 
 
-# Load or Download Model
-try:
-    if not (MODEL_DIR / "config.json").exists():  # Check if the model is already downloaded
-        logging.info("Downloading BART model for the first time...")
-        summarizer = pipeline("summarization", model="facebook/bart-large-cnn",device=device)
-        model = AutoModelForSeq2SeqLM.from_pretrained("facebook/bart-large-cnn")
-        tokenizer = AutoTokenizer.from_pretrained("facebook/bart-large-cnn")
-        
-        # Save model locally
-        model.save_pretrained(MODEL_DIR)
-        tokenizer.save_pretrained(MODEL_DIR)
-        logging.info("BART model downloaded and saved locally.")
-        
-    else:
-        logging.info("Loading BART model from local storage.")
-        summarizer = pipeline("summarization", model=str(MODEL_DIR), tokenizer=str(MODEL_DIR),device=device)
-        
-except Exception as e:
-    logging.error(f"Error loading BART model: {e}")
-    print(f"Error loading BART model: {e}")
-    summarizer = None
+def warm_up():
+    """Starts loading the model in the background so the first summary doesn't wait for it."""
+    MODEL_MANAGER.start()
+
+
+# Chunking settings
+MODEL_MAX_TOKENS = 1024        # BART's context limit
+CHUNK_MAX_TOKENS = 1000        # Token budget per chunk (headroom for special tokens)
+CHUNK_OVERLAP_SENTENCES = 1    # Sentences repeated at the start of the next chunk
 
+# Token streaming gives up when generation produces nothing new for this many seconds
+STREAM_TOKEN_TIMEOUT = 120
 
-print()
+# Legacy word-window chunking (kept for comparison in benchmarks/bench_chunking.py)
+CHUNK_MAX_WORDS = 500
+CHUNK_OVERLAP = 150
 
-def chunk_text_with_overlap(text, max_words=500, overlap=150):
-    """Splits text into overlapping chunks while keeping sentences intact."""
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?…\"”’])\s+|\n+")
+WORD = re.compile(r"\S+")
+
+@timed()
+def chunk_text_with_overlap(text, max_words=CHUNK_MAX_WORDS, overlap=CHUNK_OVERLAP):
+    """Splits text into fixed-size word windows that overlap by `overlap` words."""
     words = text.split()
     chunks = []
     start = 0
@@ -65,67 +75,457 @@ def chunk_text_with_overlap(text, max_words=500, overlap=150):
     return chunks
 
 
-def summarize_text(text, min_length=50, max_length=200):
+def split_sentences(text):
+    """Splits text into sentences on terminal punctuation and line breaks."""
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text) if sentence.strip()]
+
+
+@timed()
+def chunk_text(text, tokenizer, max_tokens=CHUNK_MAX_TOKENS, overlap_sentences=CHUNK_OVERLAP_SENTENCES):
     """
-    Summarizes text using BART with overlapping chunks and returns summary statistics.
-    
-    Returns:
-        - summary_text (str): Final summarized text.
-        - summary_stats (dict): Contains original & summary lengths and compression ratio.
+    Packs whole sentences into chunks of at most `max_tokens` model tokens.
+
+    Each chunk starts with the last `overlap_sentences` sentences of the previous one.
+    A single sentence longer than `max_tokens` is split on word boundaries.
     """
-    if not summarizer:
-        logging.error("Summarizer pipeline not initialized.")
-        return "Summarization model unavailable.", {}
+    sentences = []
+    for sentence in split_sentences(text):
+        sentences.extend(_split_long_sentence(sentence, tokenizer, max_tokens))
+    if not sentences:
+        return []
 
-    if not text or len(text.split()) < 50:
-        logging.warning("Text too short for summarization.")
-        return text, {}
+    lengths = [len(ids) for ids in tokenizer(sentences, add_special_tokens=False)["input_ids"]]
 
-    # Create overlapping chunks
-    chunks = chunk_text_with_overlap(text)
-    summarized_chunks = []
+    chunks = []
+    current, current_tokens = [], 0
+    for sentence, length in zip(sentences, lengths):
+        if current and current_tokens + length > max_tokens:
+            chunks.append(" ".join(s for s, _ in current))
+            # Carry the overlap over only if it leaves room for new content
+            current = current[-overlap_sentences:] if overlap_sentences else []
+            current_tokens = sum(n for _, n in current)
+            if current_tokens + length > max_tokens:
+                current, current_tokens = [], 0
+        current.append((sentence, length))
+        current_tokens += length
+
+    if current:
+        chunks.append(" ".join(s for s, _ in current))
+    return chunks
 
 
+@timed()
+def chunk_for_summary(text, tokenizer):
+    """Returns a text's chunks and their token lengths (capped at the model's context), ready for summarize_texts."""
+    chunks = chunk_text(text, tokenizer)
+    lengths = [
+        min(len(ids), MODEL_MAX_TOKENS)
+        for ids in tokenizer(chunks, truncation=True, max_length=MODEL_MAX_TOKENS)["input_ids"]
+    ]
+    return chunks, lengths
 
 
-    try:
-        for chunk in chunks:
-            summary = summarizer(chunk, min_length=min_length, max_length=max_length, do_sample=False)
-            summarized_chunks.append(summary[0]["summary_text"])
+def _split_long_sentence(sentence, tokenizer, max_tokens):
+    """
+    Splits a sentence that exceeds `max_tokens` into word-boundary pieces that fit.
+
+    Words are packed into pieces on their cumulative token counts. A fast tokenizer
+    tokenizes the sentence once, and each token counts towards the word its offset starts
+    in. Tokenizers without offsets (slow ones) count every word in one batched call.
+    """
+    if getattr(tokenizer, "is_fast", False):
+        offsets = tokenizer(sentence, add_special_tokens=False, return_offsets_mapping=True)["offset_mapping"]
+        if len(offsets) <= max_tokens:
+            return [sentence]
+        words = WORD.findall(sentence)
+        word_ends = [match.end() for match in WORD.finditer(sentence)]
+        counts = [0] * len(words)
+        for start, _ in offsets:
+            # A token starting in the whitespace before a word belongs to that word
+            counts[min(bisect.bisect_right(word_ends, start), len(words) - 1)] += 1
+    else:
+        if len(tokenizer(sentence, add_special_tokens=False)["input_ids"]) <= max_tokens:
+            return [sentence]
+        words = WORD.findall(sentence)
+        counts = [len(ids) for ids in tokenizer(words, add_special_tokens=False)["input_ids"]]
+
+    pieces, current, current_tokens = [], [], 0
+    for word, count in zip(words, counts):
+        if current and current_tokens + count > max_tokens:
+            pieces.append(" ".join(current))
+            current, current_tokens = [], 0
+        current.append(word)
+        current_tokens += count
+    if current:
+        pieces.append(" ".join(current))
+    return pieces
+
+
+# Batching settings for multi-chunk / multi-article inference
+TOKEN_BUDGET = 4096      # Max padded input tokens per generate call (batch_size * longest chunk)
+MAX_BATCH_SIZE = 8
+
+# Length budget: smallest max_length a single chunk's summary is given, and the number of
+# steps of max_length that chunk budgets are rounded down to (few distinct lengths keep batches full)
+MIN_CHUNK_SUMMARY_TOKENS = 20
+LENGTH_BUDGET_STEPS = 8
+
+
+@timed("summary_stats")
+def compute_summary_stats(text, summary_text):
+    """Computes length, compression and readability statistics for a summary."""
+    original_words = len(text.split())
+    original_chars = len(text)
+    summary_words = len(summary_text.split())
+    summary_chars = len(summary_text)
+    compression_ratio = round(summary_words / original_words, 2) if original_words else 0
+
+    # Calculate Flesch-Kincaid Grade Level ---->  {The higher the score, the more complex the text}
+    fk_grade_level  = textstat.flesch_kincaid_grade(summary_text)
+
+    # Calculate Flesch Reading Ease  ---> (0 ---> 100%) {The higher the score (closer to 100), the easier the text is to read}
+    fk_reading_ease = textstat.flesch_reading_ease(summary_text)
+
+
+    return {
+        "original_words": original_words,
+        "original_chars": original_chars,
+        "summary_words": summary_words,
+        "summary_chars": summary_chars,
+        "compression_ratio": compression_ratio,
+        "readability_grade(flesch_kincaid)":fk_grade_level,
+        "Reading Ease(fl_reading_ease )":fk_reading_ease
+    }
+
+
+def make_batches(lengths, token_budget=TOKEN_BUDGET, max_batch_size=MAX_BATCH_SIZE):
+    """
+    Groups item indices into length-sorted batches.
+
+    Items are sorted by token length so each batch pads to a similar length, and a batch
+    grows only while batch_size * longest item stays within `token_budget`.
+    """
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True)
+    batches, batch = [], []
+    for i in order:
+        # Sorted longest first, so the first item of a batch is its padded length
+        longest = lengths[batch[0]] if batch else lengths[i]
+        if batch and (len(batch) >= max_batch_size or (len(batch) + 1) * longest > token_budget):
+            batches.append(batch)
+            batch = []
+        batch.append(i)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def allocate_length_budget(chunk_lengths, min_length, max_length, floor=MIN_CHUNK_SUMMARY_TOKENS,
+                           steps=LENGTH_BUDGET_STEPS):
+    """
+    Splits a summary length budget across chunks by each chunk's share of the input tokens.
+
+    Returns a (min_length, max_length) pair per chunk. Each chunk's share of `max_length` is
+    rounded down to a multiple of max_length / `steps` (at least `floor` tokens) and its min_length
+    follows from that, so chunks of every text fall into a few pairs that generate_summaries
+    can batch together. A single chunk keeps the full lengths. The total only exceeds
+    `max_length` when there are more than max_length / floor chunks.
+    """
+    total = sum(chunk_lengths) or 1
+    budgets = []
+    for length in chunk_lengths:
+        chunk_max = max(floor, round(max_length * (steps * length // total) / steps))
+        chunk_min = min(max(1, round(min_length * chunk_max / max_length)), chunk_max - 1)
+        budgets.append((chunk_min, chunk_max))
+    return budgets
 
-        # Join summarized chunks
-        summary_text = " ".join(summarized_chunks)
 
-        # Compute statistics
-        original_words = len(text.split())
-        original_chars = len(text)
-        summary_words = len(summary_text.split())
-        summary_chars = len(summary_text)
-        compression_ratio = round(summary_words / original_words, 2) if original_words else 0
+def generate_summaries(summarizer, inputs, lengths, params, token_budget=TOKEN_BUDGET):
+    """
+    Runs `inputs` through the pipeline in length-sorted batches.
 
-        # Calculate Flesch-Kincaid Grade Level ---->  {The higher the score, the more complex the text}
-        fk_grade_level  = textstat.flesch_kincaid_grade(summary_text)
+    `params` holds a (min_length, max_length) pair per input; inputs are only batched
+    with others sharing the same pair. Returns the summaries in input order.
+    """
+    groups = {}
+    for i, pair in enumerate(params):
+        groups.setdefault(pair, []).append(i)
+
+    summaries = [None] * len(inputs)
+    for (min_length, max_length), members in groups.items():
+        for batch in make_batches([lengths[i] for i in members], token_budget):
+            batch = [members[i] for i in batch]
+            with METRICS.span("generate", batch_size=len(batch), max_length=max_length):
+                outputs = summarizer(
+                    [inputs[i] for i in batch],
+                    min_length=min_length, max_length=max_length, do_sample=False,
+                    truncation=True, batch_size=len(batch),
+                )
+            for i, output in zip(batch, outputs):
+                summaries[i] = output["summary_text"]
+    return summaries
+
+
+def summary_key(text, min_length=50, max_length=200, length_budget=True, reduce=False, backend=None):
+    """
+    Builds the summary cache key for a text and the current model/chunking settings
+    (for `backend`, by default this process's inference backend).
+    """
+    return summary_cache_key(
+        text, model=MODEL_NAME, backend=backend or MODEL_MANAGER.backend, min_length=min_length, max_length=max_length,
+        chunk_max_tokens=CHUNK_MAX_TOKENS, chunk_overlap_sentences=CHUNK_OVERLAP_SENTENCES,
+        length_budget=length_budget, reduce=reduce,
+    )
 
-        # Calculate Flesch Reading Ease  ---> (0 ---> 100%) {The higher the score (closer to 100), the easier the text is to read}
-        fk_reading_ease = textstat.flesch_reading_ease(summary_text)
 
+@timed()
+def get_cached_summary(text, min_length=50, max_length=200, length_budget=True, reduce=False, backend=None):
+    """Returns the cached (summary_text, summary_stats) for a text, or None if not summarized yet."""
+    if SUMMARY_CACHE is None or not text:
+        return None
+    return SUMMARY_CACHE.get(summary_key(text, min_length, max_length, length_budget, reduce, backend))
 
-        summary_stats = {
-            "original_words": original_words,
-            "original_chars": original_chars,
-            "summary_words": summary_words,
-            "summary_chars": summary_chars,
-            "compression_ratio": compression_ratio,
-            "readability_grade(flesch_kincaid)":fk_grade_level,
-            "Reading Ease(fl_reading_ease )":fk_reading_ease
-        }
 
-        logging.info("Summarization successful.")
-        return summary_text, summary_stats
+def reuse_summary(text, original_text, min_length=50, max_length=200, length_budget=True, reduce=False,
+                  backend=None):
+    """
+    Returns the cached summary of `original_text` (the article `text` is a near-duplicate of)
+    with stats recomputed for `text`, or None if the original isn't summarized at these settings.
+    The result is cached under `text` as well, so later lookups for it hit the cache directly.
+    """
+    cached = get_cached_summary(original_text, min_length, max_length, length_budget, reduce, backend)
+    if not cached:
+        return None
+    result = cached[0], compute_summary_stats(text, cached[0])
+    if SUMMARY_CACHE is not None:
+        SUMMARY_CACHE.put(summary_key(text, min_length, max_length, length_budget, reduce, backend), *result)
+    return result
+
+
+@timed()
+def summarize_texts(texts, min_length=50, max_length=200, token_budget=TOKEN_BUDGET,
+                    length_budget=True, reduce=False, chunked=None):
+    """
+    Summarizes many texts at once, batching all of their chunks through the model.
+
+    Texts already in SUMMARY_CACHE are served from it. Chunks from the remaining texts
+    are sorted by token length and run in batches sized to `token_budget`, then the
+    chunk summaries are joined back per text and cached.
+
+    With `length_budget`, `min_length`/`max_length` apply to the whole summary and are
+    split across a text's chunks by their share of its tokens; otherwise every chunk gets
+    the full lengths. With `reduce`, multi-chunk summaries get a final pass that condenses
+    the joined chunk summaries to `min_length`/`max_length`.
+
+    `chunked` optionally holds each text's (chunks, lengths) from chunk_for_summary, for
+    callers that chunk ahead of time (e.g. the pipeline's chunking stage).
+
+    Returns:
+        - list of (summary_text, summary_stats) tuples, in the same order as `texts`.
+          summary_stats is empty when summarization failed; summary_text is then an error message.
+    """
+    results = [None] * len(texts)
+    pending = []
+    for index, text in enumerate(texts):
+        if not text or len(text.split()) < 50:
+            logging.warning("Text too short for summarization.")
+            # The text is its own summary; only failures come back with empty stats
+            results[index] = (text, compute_summary_stats(text, text) if text else {})
+            continue
+        results[index] = get_cached_summary(text, min_length, max_length, length_budget, reduce)
+        if results[index] is None:
+            pending.append(index)
+
+    if not pending:
+        return results
+
+    summarizer = get_summarizer()
+    if not summarizer:
+        logging.error("Summarizer pipeline not initialized.")
+        return [result or ("Summarization model unavailable.", {}) for result in results]
+
+    chunks = []  # (text index, chunk)
+    lengths = []
+    try:
+        for index in pending:
+            # Pack sentences into chunks sized to the model's context
+            text_chunks, text_lengths = (
+                chunked[index] if chunked else chunk_for_summary(texts[index], summarizer.tokenizer)
+            )
+            chunks.extend((index, chunk) for chunk in text_chunks)
+            lengths.extend(text_lengths)
+
+        chunk_texts = [chunk for _, chunk in chunks]
+
+        # Per-chunk generation lengths
+        params = [(min_length, max_length)] * len(chunks)
+        if length_budget:
+            chunk_members = {}
+            for i, (index, _) in enumerate(chunks):
+                chunk_members.setdefault(index, []).append(i)
+            for members in chunk_members.values():
+                budgets = allocate_length_budget([lengths[i] for i in members], min_length, max_length)
+                for i, budget in zip(members, budgets):
+                    params[i] = budget
+
+        chunk_summaries = generate_summaries(summarizer, chunk_texts, lengths, params, token_budget)
+
+        # Join summarized chunks back per text, in chunk order
+        summarized_chunks = {}
+        for (index, _), chunk_summary in zip(chunks, chunk_summaries):
+            summarized_chunks.setdefault(index, []).append(chunk_summary)
+        joined = {index: " ".join(pieces) for index, pieces in summarized_chunks.items()}
+
+        # Optional reduce pass: condense multi-chunk summaries in one more generate call each
+        if reduce:
+            to_reduce = [index for index, pieces in summarized_chunks.items() if len(pieces) > 1]
+            if to_reduce:
+                reduce_inputs = [joined[index] for index in to_reduce]
+                reduce_lengths = [
+                    len(ids) for ids in
+                    summarizer.tokenizer(reduce_inputs, truncation=True, max_length=MODEL_MAX_TOKENS)["input_ids"]
+                ]
+                reduced = generate_summaries(
+                    summarizer, reduce_inputs, reduce_lengths,
+                    [(min_length, max_length)] * len(to_reduce), token_budget,
+                )
+                joined.update(zip(to_reduce, reduced))
+
+        for index, summary_text in joined.items():
+            results[index] = (summary_text, compute_summary_stats(texts[index], summary_text))
+            if SUMMARY_CACHE is not None:
+                key = summary_key(texts[index], min_length, max_length, length_budget, reduce)
+                SUMMARY_CACHE.put(key, *results[index])
+
+        logging.info(f"Summarization successful: {len(joined)} texts, {len(chunks)} chunks.")
+        return results
+
+    except Exception as e:
+        logging.error(f"Error during summarization: {e}")
+        return [result or ("Error summarizing text.", {}) for result in results]
+
+
+def summarize_text(text, min_length=50, max_length=200, length_budget=True, reduce=False):
+    """
+    Summarizes text using BART with sentence-packed chunks and returns summary statistics.
+    
+    Returns:
+        - summary_text (str): Final summarized text.
+        - summary_stats (dict): Contains original & summary lengths and compression ratio.
+    """
+    return summarize_texts(
+        [text], min_length=min_length, max_length=max_length, length_budget=length_budget, reduce=reduce
+    )[0]
+
+def _stream_chunk_tokens(summarizer, chunk, min_length, max_length):
+    """Yields decoded text pieces for one chunk as the model generates them (greedy decoding)."""
+    from transformers import TextIteratorStreamer
+
+    tokenizer = summarizer.tokenizer
+    streamer = TextIteratorStreamer(tokenizer, skip_prompt=True, skip_special_tokens=True, timeout=STREAM_TOKEN_TIMEOUT)
+    inputs = tokenizer(chunk, return_tensors="pt", truncation=True, max_length=MODEL_MAX_TOKENS)
+    inputs = inputs.to(summarizer.model.device)
+    errors = []
+
+    def generate():
+        try:
+            # Streamers don't support beam search, so token streaming decodes greedily
+            summarizer.model.generate(**inputs, streamer=streamer, min_length=min_length, max_length=max_length,
+                                      num_beams=1, do_sample=False)
+        except Exception as e:
+            # Hand the error to the consumer and end the stream, or it would wait for tokens forever
+            errors.append(e)
+            streamer.end()
+
+    generation = threading.Thread(target=generate, daemon=True)
+    start = time.perf_counter()
+    generation.start()
+    try:
+        yield from streamer
+    except queue.Empty:
+        # Generation is stuck; the (daemon) thread is left behind
+        raise TimeoutError(f"No summary tokens generated for {STREAM_TOKEN_TIMEOUT}s") from None
+    generation.join()
+    if errors:
+        raise errors[0]
+    # Timed by hand: a span can't stay open across the yields to the caller
+    METRICS.record("generate", start, time.perf_counter() - start, batch_size=1, max_length=max_length, streamed=True)
+
+
+def stream_summary(text, min_length=50, max_length=200, token_stream=False, result=None):
+    """
+    Summarizes text chunk by chunk, yielding pieces of the summary as soon as they exist.
+
+    By default each chunk's summary is yielded when it finishes (same decoding and length
+    budget as summarize_text, and the result is cached). With `token_stream`, text is
+    yielded token by token using greedy decoding instead.
+
+    If `result` is a dict, it is filled with summary_text, summary_stats,
+    time_to_first_text and total_seconds once the stream finishes.
+    """
+    result = {} if result is None else result
+    start = time.perf_counter()
+    pieces = []
+
+    def finish(summary_text, summary_stats):
+        result.update(summary_text=summary_text, summary_stats=summary_stats,
+                      total_seconds=round(time.perf_counter() - start, 3))
+        result.setdefault("time_to_first_text", result["total_seconds"])
+        logging.info(
+            f"Streamed summary: first text after {result['time_to_first_text']}s, "
+            f"done in {result['total_seconds']}s."
+        )
+
+    def emit(piece):
+        if not pieces:
+            result["time_to_first_text"] = round(time.perf_counter() - start, 3)
+        pieces.append(piece)
+        return piece
+
+    cached = None if token_stream else get_cached_summary(text, min_length, max_length)
+    if not text or len(text.split()) < 50 or cached:
+        summary_text, summary_stats = cached or summarize_text(text, min_length, max_length)
+        yield emit(summary_text)
+        finish(summary_text, summary_stats)
+        return
+
+    summarizer = get_summarizer()
+    if not summarizer:
+        logging.error("Summarizer pipeline not initialized.")
+        yield emit("Summarization model unavailable.")
+        finish("Summarization model unavailable.", {})
+        return
+
+    try:
+        chunks = chunk_text(text, summarizer.tokenizer)
+        lengths = [len(ids) for ids in summarizer.tokenizer(chunks, truncation=True, max_length=MODEL_MAX_TOKENS)["input_ids"]]
+        budgets = allocate_length_budget(lengths, min_length, max_length)
+
+        chunk_summaries = []
+        for chunk, (chunk_min, chunk_max) in zip(chunks, budgets):
+            separator = " " if chunk_summaries else ""
+            if token_stream:
+                chunk_pieces = []
+                for piece in _stream_chunk_tokens(summarizer, chunk, chunk_min, chunk_max):
+                    if piece:
+                        chunk_pieces.append(piece)
+                        yield emit(separator + piece if len(chunk_pieces) == 1 else piece)
+                chunk_summaries.append("".join(chunk_pieces).strip())
+            else:
+                with METRICS.span("generate", batch_size=1, max_length=chunk_max):
+                    output = summarizer(chunk, min_length=chunk_min, max_length=chunk_max, do_sample=False, truncation=True)
+                chunk_summaries.append(output[0]["summary_text"])
+                yield emit(separator + chunk_summaries[-1])
+
+        summary_text = " ".join(chunk_summaries)
+        summary_stats = compute_summary_stats(text, summary_text)
+        if SUMMARY_CACHE is not None and not token_stream:
+            SUMMARY_CACHE.put(summary_key(text, min_length, max_length), summary_text, summary_stats)
+        finish(summary_text, summary_stats)
 
     except Exception as e:
         logging.error(f"Error during summarization: {e}")
-        return "Error summarizing text.", {}
+        yield emit("Error summarizing text.")
+        finish("Error summarizing text.", {})
 
 #Test it: 
 if __name__ == "__main__" :
@@ -0,0 +1,90 @@
+import json
+import sqlite3
+import threading
+import time
+import logging
+
+from src.utils.hashing import content_hash
+
+
+def summary_cache_key(text, **params):
+    """
+    Builds a cache key from the article content and every parameter that affects the summary
+    (model id, min/max length, chunking settings, ...).
+    """
+    payload = json.dumps({"content": content_hash(text), **params}, sort_keys=True)
+    return content_hash(payload)
+
+
+class SummaryCache:
+    """
+    Persistent summary cache (SQLite), shared across sessions and process restarts.
+
+    Stores (summary_text, summary_stats) per key and keeps at most `max_entries`
+    entries, evicting the least recently used ones first.
+    """
+
+    def __init__(self, path, max_entries=10000):
+        self.path = path
+        self.max_entries = max_entries
+        self.counters = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                stats TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_access ON summaries(last_access)")
+        self._conn.commit()
+
+    def get(self, key):
+        """Returns the cached (summary_text, summary_stats) for `key`, or None."""
+        with self._lock:
+            row = self._conn.execute("SELECT summary, stats FROM summaries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.counters["misses"] += 1
+                return None
+            self._conn.execute("UPDATE summaries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._conn.commit()
+            self.counters["hits"] += 1
+        return row[0], json.loads(row[1])
+
+    def put(self, key, summary_text, summary_stats):
+        """Stores a summary and its stats, evicting the oldest entries if over `max_entries`."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries VALUES (?, ?, ?, ?, ?)",
+                (key, summary_text, json.dumps(summary_stats), now, now),
+            )
+            self.counters["stores"] += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        excess = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0] - self.max_entries
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM summaries WHERE key IN (SELECT key FROM summaries ORDER BY last_access ASC LIMIT ?)",
+            (excess,),
+        )
+        self.counters["evictions"] += excess
+
+    def stats(self):
+        """Returns hit/miss counters plus the current entry count."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM summaries").fetchone()[0]
+        return {**self.counters, "entries": entries}
+
+    def clear(self):
+        """Removes every cached summary."""
+        with self._lock:
+            self._conn.execute("DELETE FROM summaries")
+            self._conn.commit()
+        logging.info("Summary cache cleared.")
@@ -0,0 +1,110 @@
+"""
+Out-of-process summarization service.
+
+Starts N worker processes that take jobs from the local JobQueue, so app sessions
+submit work and poll for results instead of running the model in the script thread.
+
+Each worker loads its own copy of the model: weights are copied into process memory
+(and quantized or converted for the int8 / ONNX backends), so N workers need roughly
+N x the model's RAM (about 1.6 GB each for fp32 BART-large-CNN). Size --workers to memory,
+not only to CPU cores.
+
+Run from the project root:
+    python src/summarization/worker.py --workers 2
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.summarization.job_queue import JobQueue, QUEUE_PATH
+
+POLL_INTERVAL = 0.5  # Seconds a worker sleeps when the queue is empty
+
+
+def submit_summary_job(queue, text, min_length=50, max_length=200, reduce=False):
+    """
+    Queues a summary job and returns its id (identical requests share one job).
+
+    The id is the summary cache key for the backend the workers run (which may differ from
+    this process's SUMMARIZER_BACKEND), so it matches the cache entry the worker writes.
+    """
+    from src.summarization.summarizer import summary_key
+
+    job_id = summary_key(text, min_length, max_length, reduce=reduce, backend=queue.worker_backend())
+    return queue.submit(job_id, text, min_length=min_length, max_length=max_length, reduce=reduce)
+
+
+def worker_loop(queue_path=QUEUE_PATH, max_jobs=None, threads=None):
+    """
+    Processes queued jobs until stopped (or until `max_jobs` jobs have run).
+
+    `threads` caps the intra-op threads per worker so N workers don't oversubscribe the CPU.
+    """
+    from src.summarization.summarizer import MODEL_MANAGER, get_summarizer, summarize_text
+
+    if threads:
+        import torch
+        torch.set_num_threads(threads)
+
+    name = f"worker-{os.getpid()}"
+    queue = JobQueue(queue_path)
+
+    if get_summarizer() is None:
+        logging.error(f"{name}: summarization model unavailable, exiting.")
+        return
+    queue.set_worker_backend(MODEL_MANAGER.backend)
+    logging.info(f"{name}: ready ({MODEL_MANAGER.backend} backend).")
+
+    processed = 0
+    while max_jobs is None or processed < max_jobs:
+        job = queue.claim(name)
+        if job is None:
+            time.sleep(POLL_INTERVAL)
+            continue
+
+        job_id, text, params = job
+        try:
+            summary_text, summary_stats = summarize_text(text, **params)
+        except Exception as e:
+            queue.fail(job_id, e)
+        else:
+            if summary_stats:
+                queue.complete(job_id, summary_text, summary_stats)
+            else:
+                # summarize_text reports failures as an error message with empty stats;
+                # failing the job lets the next submit() queue it again
+                queue.fail(job_id, summary_text)
+        processed += 1
+
+
+def start_workers(n_workers, queue_path=QUEUE_PATH):
+    """Starts `n_workers` worker processes, splitting the CPU cores between them, and returns them."""
+    threads = max(1, (os.cpu_count() or 1) // n_workers)
+    workers = []
+    for _ in range(n_workers):
+        process = multiprocessing.Process(target=worker_loop, args=(queue_path, None, threads), daemon=True)
+        process.start()
+        workers.append(process)
+    logging.info(f"Started {n_workers} summarization workers.")
+    return workers
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the summarization worker pool.")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 4))
+    args = parser.parse_args()
+
+    processes = start_workers(args.workers)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        print("Stopping workers...")
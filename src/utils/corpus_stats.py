@@ -0,0 +1,359 @@
+"""
+Corpus-level article and summary statistics, computed in vectorized batches and updated incrementally.
+
+Per-article counts (words, characters, sentences, syllables, for the article and its
+summary) are computed with pandas string operations over batches of articles and kept in
+an `article_stats` table next to the articles. Triggers on the articles table log every
+insert, delete and summary change, and update() only processes the log entries it hasn't
+seen yet. Readability scores, compression ratios, length distributions and per-author and
+per-day volumes are then derived with NumPy/pandas from an in-memory frame of those counts.
+refresh() patches that frame with the changed rows only.
+
+Syllables are counted as vowel groups per word, a vectorizable approximation of textstat's
+dictionary-based count. Corpus-level scores are therefore close to textstat's per-summary
+scores but not identical.
+"""
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.utils.metrics import timed
+
+BATCH_SIZE = 2000        # Articles counted per vectorized batch / transaction
+LOG_RETAIN = 200000      # Change-log entries kept for other processes' frames to catch up from
+COUNT_COLUMNS = ("words", "chars", "sentences", "syllables")
+COUNTED_COLUMNS = COUNT_COLUMNS + tuple(f"summary_{column}" for column in COUNT_COLUMNS)
+STATS_COLUMNS = ("id", "url", "authors", "published_day", *COUNTED_COLUMNS)
+
+WORD_PATTERN = r"\S+"
+SENTENCE_PATTERN = r"[.!?…]+(?=\s|$)"
+SYLLABLE_PATTERN = r"[aeiouy]+"
+
+
+def text_counts(texts):
+    """
+    Returns a DataFrame of words, chars, sentences and syllables for a Series of texts
+    (missing texts get NaN counts). Every count is one vectorized pass over the batch.
+    """
+    texts = pd.Series(texts, dtype="object")
+    present = texts.notna()
+    filled = texts.fillna("")
+    counts = pd.DataFrame({
+        "words": filled.str.count(WORD_PATTERN),
+        "chars": filled.str.len(),
+        # Text without terminal punctuation is still one sentence
+        "sentences": filled.str.count(SENTENCE_PATTERN).clip(lower=1),
+        "syllables": filled.str.lower().str.count(SYLLABLE_PATTERN),
+    })
+    return counts.where(present)
+
+
+def readability(words, sentences, syllables):
+    """Vectorized Flesch-Kincaid grade and Flesch reading ease from word, sentence and syllable counts."""
+    words = np.asarray(words, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        words_per_sentence = words / np.asarray(sentences, dtype=float)
+        syllables_per_word = np.asarray(syllables, dtype=float) / words
+    grade = 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59
+    ease = 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word
+    invalid = ~(words > 0)
+    grade[invalid] = np.nan
+    ease[invalid] = np.nan
+    return np.round(grade, 2), np.round(ease, 2)
+
+
+class CorpusStats:
+    """
+    Incrementally maintained statistics over an ArticleStore database.
+
+    update() counts new and changed articles in batches (safe to run from several
+    processes); refresh() also brings this instance's in-memory frame up to date.
+    The aggregate methods work on that frame and are cached until it changes.
+    """
+
+    def __init__(self, path, batch_size=BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._frame = None
+        self._seq = 0         # Last change-log entry reflected in the frame
+        self._version = 0     # Bumped whenever the frame changes
+        self._cache = {}
+        # Autocommit mode; update() manages its own transactions
+        self._conn = sqlite3.connect(str(path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._create_schema()
+            self._conn.execute("COMMIT")
+        except sqlite3.Error:
+            self._conn.execute("ROLLBACK")
+            raise
+
+    def _create_schema(self):
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS article_stats (
+                id INTEGER PRIMARY KEY,  -- articles.id
+                url TEXT NOT NULL,
+                authors TEXT NOT NULL,
+                published_day TEXT,
+                words INTEGER, chars INTEGER, sentences INTEGER, syllables INTEGER,
+                summary_words INTEGER, summary_chars INTEGER, summary_sentences INTEGER, summary_syllables INTEGER
+            )"""
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS article_stats_meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        if self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'article_stats_log'"
+        ).fetchone():
+            return
+        # Every change to an article's stats inputs, in order; AUTOINCREMENT keeps seq increasing after pruning
+        self._conn.execute(
+            """CREATE TABLE article_stats_log (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                id INTEGER NOT NULL,
+                deleted INTEGER NOT NULL
+            )"""
+        )
+        for name, event, article in (("insert", "INSERT", "new"), ("summary", "UPDATE OF summary", "new"),
+                                     ("delete", "DELETE", "old")):
+            self._conn.execute(
+                f"""CREATE TRIGGER IF NOT EXISTS article_stats_{name} AFTER {event} ON articles BEGIN
+                    INSERT INTO article_stats_log (id, deleted) VALUES ({article}.id, {int(event == "DELETE")});
+                END"""
+            )
+        # Backfill: queue every article stored before the statistics existed
+        self._conn.execute("INSERT INTO article_stats_log (id, deleted) SELECT id, 0 FROM articles ORDER BY id")
+
+    def _meta(self, key):
+        row = self._conn.execute("SELECT value FROM article_stats_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0
+
+    @timed("corpus_stats_update")
+    def update(self):
+        """Counts every article logged since the last update, in batches. Returns how many log entries were processed."""
+        processed = 0
+        with self._lock:
+            while True:
+                done = self._meta("computed_seq")
+                log = self._conn.execute(
+                    "SELECT seq, id FROM article_stats_log WHERE seq > ? ORDER BY seq LIMIT ?",
+                    (done, self.batch_size),
+                ).fetchall()
+                if not log:
+                    break
+                # Count outside the write transaction, so article writers aren't blocked meanwhile.
+                # Articles changed after this read are logged again with a later seq.
+                stats = self._count(list(dict.fromkeys(article_id for _, article_id in log)))
+                last = log[-1][0]
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    if self._meta("computed_seq") != done:
+                        # Another process wrote this batch meanwhile
+                        self._conn.execute("ROLLBACK")
+                        continue
+                    self._write(stats)
+                    self._conn.execute("INSERT OR REPLACE INTO article_stats_meta VALUES ('computed_seq', ?)", (last,))
+                    self._conn.execute("DELETE FROM article_stats_log WHERE seq <= ?", (last - LOG_RETAIN,))
+                    self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                processed += len(log)
+        return processed
+
+    def _count(self, ids):
+        """Returns (ids, stats rows) for a batch of article ids; ids without an article row are deleted ones."""
+        rows = []
+        for start in range(0, len(ids), 900):  # Stay under SQLite's bound-parameter limit
+            chunk = ids[start:start + 900]
+            rows += self._conn.execute(
+                f"SELECT id, url, authors, substr(published_at, 1, 10), content, summary "
+                f"FROM articles WHERE id IN ({', '.join('?' * len(chunk))})", chunk,
+            ).fetchall()
+        if not rows:
+            return ids, []
+        batch = pd.DataFrame(rows, columns=["id", "url", "authors", "published_day", "content", "summary"])
+        content = text_counts(batch["content"])
+        summary = text_counts(batch["summary"]).add_prefix("summary_")
+        stats = pd.concat([batch[["id", "url", "authors", "published_day"]], content, summary], axis=1)
+        stats = stats[list(STATS_COLUMNS)].astype(object).where(stats.notna(), None)  # NaN -> NULL
+        return ids, [tuple(int(v) if isinstance(v, float) else v for v in row)
+                     for row in stats.itertuples(index=False, name=None)]
+
+    def _write(self, stats):
+        ids, rows = stats
+        self._conn.executemany("DELETE FROM article_stats WHERE id = ?", ((article_id,) for article_id in ids))
+        self._conn.executemany(
+            f"INSERT INTO article_stats ({', '.join(STATS_COLUMNS)}) VALUES ({', '.join('?' * len(STATS_COLUMNS))})",
+            rows,
+        )
+
+    def _load(self, ids=None):
+        # URLs stay in SQLite (see top_articles); building columns directly is much faster than
+        # a DataFrame of row tuples, and repeated author strings / days are parsed once as categories
+        columns = [column for column in STATS_COLUMNS if column != "url"]
+        sql = f"SELECT {', '.join(columns)} FROM article_stats"
+        if ids is not None:
+            sql += f" WHERE id IN ({', '.join('?' * len(ids))})"
+        values = list(zip(*self._conn.execute(sql, ids or ()).fetchall())) or [()] * len(columns)
+        data = dict(zip(columns, values))
+        days = pd.Categorical(data["published_day"])
+        # NaT appended last, so code -1 (no date) maps to it
+        day_values = np.append(pd.to_datetime(days.categories, format="%Y-%m-%d", errors="coerce").to_numpy(),
+                               np.datetime64("NaT", "ns"))
+        return pd.DataFrame({
+            "authors": pd.Categorical(data["authors"]),
+            "published_day": day_values[days.codes],
+            **{column: np.array(data[column], dtype="float64") for column in COUNTED_COLUMNS},
+        }, index=pd.Index(np.array(data["id"], dtype="int64"), name="id"))
+
+    @timed("corpus_stats_refresh")
+    def refresh(self):
+        """Runs update(), then patches the in-memory frame with the rows changed since the last refresh."""
+        self.update()
+        with self._lock:
+            computed = self._meta("computed_seq")
+            if self._frame is not None and computed == self._seq:
+                return self._frame
+            oldest = self._conn.execute("SELECT MIN(seq) FROM article_stats_log").fetchone()[0]
+            if self._frame is None or oldest is None or self._seq < oldest - 1:
+                # First load, or this frame fell behind the retained log: read everything
+                frame = self._load()
+            else:
+                changed = [row[0] for row in self._conn.execute(
+                    "SELECT DISTINCT id FROM article_stats_log WHERE seq > ? AND seq <= ?", (self._seq, computed)
+                )]
+                frame = self._frame.drop(index=changed, errors="ignore")
+                for start in range(0, len(changed), 900):  # Stay under SQLite's bound-parameter limit
+                    frame = pd.concat([frame, self._load(changed[start:start + 900])])
+                frame["authors"] = frame["authors"].astype("category")  # concat drops mismatched categories
+            self._frame, self._seq = frame, computed
+            self._version += 1
+            self._cache.clear()
+            return frame
+
+    @property
+    def frame(self):
+        """Per-article counts (index: article id); refreshed on first access."""
+        return self._frame if self._frame is not None else self.refresh()
+
+    def _cached(self, key, compute):
+        frame = self.frame
+        version = self._version
+        if key not in self._cache:
+            result = compute(frame)
+            if version == self._version:  # Don't cache results of a frame refresh() just replaced
+                self._cache[key] = result
+            return result
+        return self._cache[key]
+
+    # --- Aggregates ---
+
+    def overview(self):
+        """Corpus totals and means: articles, summaries, word counts, compression and readability."""
+        def compute(frame):
+            summarized = frame[frame["summary_words"].notna()]
+            grade, ease = readability(summarized["summary_words"], summarized["summary_sentences"],
+                                      summarized["summary_syllables"])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                compression = (summarized["summary_words"] / summarized["words"]).replace(np.inf, np.nan)
+            return {
+                "articles": int(len(frame)),
+                "summaries": int(len(summarized)),
+                "words": int(frame["words"].sum()),
+                "mean_words": round(float(frame["words"].mean()), 1) if len(frame) else None,
+                "median_words": float(frame["words"].median()) if len(frame) else None,
+                "mean_summary_words": round(float(summarized["summary_words"].mean()), 1) if len(summarized) else None,
+                "mean_compression_ratio": round(float(np.nanmean(compression)), 3) if len(summarized) else None,
+                "mean_readability_grade": round(float(np.nanmean(grade)), 2) if len(summarized) else None,
+                "mean_reading_ease": round(float(np.nanmean(ease)), 2) if len(summarized) else None,
+            }
+        return self._cached("overview", compute)
+
+    def per_article(self):
+        """Per-article frame with compression ratio and article / summary readability columns added."""
+        def compute(frame):
+            frame = frame.copy()
+            frame["grade"], frame["reading_ease"] = readability(frame["words"], frame["sentences"], frame["syllables"])
+            frame["summary_grade"], frame["summary_reading_ease"] = readability(
+                frame["summary_words"], frame["summary_sentences"], frame["summary_syllables"]
+            )
+            with np.errstate(divide="ignore", invalid="ignore"):
+                frame["compression_ratio"] = np.round(frame["summary_words"] / frame["words"], 3)
+            return frame
+        return self._cached("per_article", compute)
+
+    def readability_quartiles(self):
+        """Quartiles of article and summary readability and of compression ratio, one column each."""
+        def compute(frame):
+            columns = ["grade", "summary_grade", "reading_ease", "summary_reading_ease", "compression_ratio"]
+            return self.per_article()[columns].quantile([0.25, 0.5, 0.75]).round(2)
+        return self._cached("readability_quartiles", compute)
+
+    def top_articles(self, column="summary_grade", n=10):
+        """The `n` articles with the highest value of a per_article() column, with their URLs."""
+        def compute(frame):
+            top = self.per_article().nlargest(n, column)
+            ids = [int(article_id) for article_id in top.index]
+            urls = dict(self._conn.execute(
+                f"SELECT id, url FROM article_stats WHERE id IN ({', '.join('?' * len(ids))})", ids
+            ).fetchall())
+            return top.assign(url=[urls.get(article_id) for article_id in ids])
+        return self._cached(("top_articles", column, n), compute)
+
+    def length_distribution(self, column="words", bins=30):
+        """Histogram of a count column (e.g. "words", "summary_words") as a DataFrame of bin edges and counts."""
+        def compute(frame):
+            values = frame[column].dropna().to_numpy()
+            if not len(values):
+                return pd.DataFrame(columns=["start", "end", "articles"])
+            upper = np.percentile(values, 99)  # Keep a few huge outliers from flattening the histogram
+            counts, edges = np.histogram(np.minimum(values, upper), bins=bins)
+            return pd.DataFrame({"start": edges[:-1].round(), "end": edges[1:].round(), "articles": counts})
+        return self._cached(("length_distribution", column, bins), compute)
+
+    def per_author(self, limit=20):
+        """Articles, mean words and summaries per author, most prolific first."""
+        def compute(frame):
+            # Aggregate per distinct author list first, then split only those few strings
+            by_list = frame.groupby("authors", observed=True).agg(
+                articles=("words", "size"), words=("words", "sum"), summaries=("summary_words", "count")
+            )
+            by_list["author"] = by_list.index.astype(str).str.split(", ")
+            grouped = by_list.explode("author").groupby("author")[["articles", "words", "summaries"]].sum()
+            grouped["mean_words"] = (grouped.pop("words") / grouped["articles"]).round(1)
+            return grouped.sort_values("articles", ascending=False).head(limit)
+        return self._cached(("per_author", limit), compute)
+
+    def per_day(self, days=None):
+        """Articles and words published per day (the last `days` days that have articles, if given)."""
+        def compute(frame):
+            dated = frame[frame["published_day"].notna()]
+            grouped = dated.groupby("published_day").agg(articles=("words", "size"), words=("words", "sum"))
+            grouped = grouped.asfreq("D", fill_value=0) if len(grouped) else grouped
+            return grouped.tail(days) if days else grouped
+        return self._cached(("per_day", days), compute)
+
+    def version(self):
+        """Changes whenever the frame is refreshed with new data (for callers caching derived results)."""
+        return self._version
+
+
+if __name__ == "__main__":
+    from src.scraping.scraper import ARTICLE_STORE
+
+    start = time.perf_counter()
+    stats = CorpusStats(ARTICLE_STORE.path)
+    stats.refresh()
+    print(json.dumps(stats.overview(), indent=2))
+    print(stats.per_author(10).to_string())
+    print(f"({time.perf_counter() - start:.2f}s)")
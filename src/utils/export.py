@@ -0,0 +1,163 @@
+"""
+In-memory export of articles and their summaries (TXT / DOCX / JSON) and streamed ZIP bundles.
+
+Nothing is written to shared paths: single exports are rendered into byte buffers and
+cached per (article, summary), and bundles are produced chunk by chunk so a large
+export never sits in memory as a whole.
+
+Run from the project root to bundle every stored article:
+    python src/utils/export.py --output articles.zip --formats txt json
+"""
+import argparse
+import io
+import json
+import re
+import sys
+import zipfile
+from functools import lru_cache
+from pathlib import Path
+
+import docx
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+EXPORT_FORMATS = ("txt", "docx", "json")
+MIME_TYPES = {
+    "txt": "text/plain",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "json": "application/json",
+    "zip": "application/zip",
+}
+EXPORT_CACHE_SIZE = 256  # Rendered (article, summary, format) exports kept in memory
+
+
+def _render_txt(title, authors, published_time, summary, content):
+    text = f"Title: {title}\nAuthor(s): {authors}\nPublished: {published_time}\n\n"
+    if summary is not None:
+        text += f"Summary:\n{summary}"
+    if content is not None:
+        text += f"{chr(10) * 2 if summary is not None else ''}Article:\n{content}"
+    return text.encode("utf-8")
+
+
+def _render_docx(title, authors, published_time, summary, content):
+    doc = docx.Document()
+    doc.add_heading("TechCrunch Article Summary" if summary is not None else title, level=1)
+    doc.add_paragraph(f"Title: {title}")
+    doc.add_paragraph(f"Author(s): {authors}")
+    doc.add_paragraph(f"Published: {published_time}")
+    if summary is not None:
+        doc.add_paragraph("\nSummary:\n")
+        doc.add_paragraph(summary)
+    if content is not None:
+        doc.add_paragraph("\nArticle:\n")
+        doc.add_paragraph(content)
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def _render_json(title, authors, published_time, summary, content, url=None):
+    record = {"url": url, "title": title, "authors": authors, "published_time": published_time}
+    if summary is not None:
+        record["summary"] = summary
+    if content is not None:
+        record["content"] = content
+    return json.dumps(record, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+@lru_cache(maxsize=EXPORT_CACHE_SIZE)
+def _render(file_format, url, title, authors, published_time, summary, content):
+    if file_format == "txt":
+        return _render_txt(title, authors, published_time, summary, content)
+    if file_format == "docx":
+        return _render_docx(title, authors, published_time, summary, content)
+    if file_format == "json":
+        return _render_json(title, authors, published_time, summary, content, url=url)
+    raise ValueError(f"Unsupported export format: {file_format}")
+
+
+def render_export(article, summary=None, file_format="txt", include_content=False):
+    """
+    Returns the export of an article (and its summary, if given) as bytes.
+    Renders are cached per (article, summary, format), so reruns don't rebuild them.
+    """
+    return _render(
+        file_format, article.get("url"), article["title"], article["authors"], article["published_time"],
+        summary, article["content"] if include_content else None,
+    )
+
+
+def export_filename(article, file_format, index=None):
+    """Returns a safe file name for an article export ("0003-judge-allows-authors.txt")."""
+    slug = re.sub(r"[^\w]+", "-", article["title"].lower()).strip("-")[:60] or "article"
+    return f"{index:04d}-{slug}.{file_format}" if index is not None else f"{slug}.{file_format}"
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, unseekable stream whose written bytes are drained as chunks."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def stream_zip(items, formats=EXPORT_FORMATS, include_content=True):
+    """
+    Yields a ZIP archive of many exports chunk by chunk.
+
+    `items` is an iterable of (article, summary) pairs (summary may be None). Each pair is
+    rendered in every format, compressed and yielded before the next one is read, so only
+    one article's exports are in memory at a time. Renders here bypass the export cache.
+    """
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, (article, summary) in enumerate(items, 1):
+            content = article["content"] if include_content else None
+            for file_format in formats:
+                data = _render.__wrapped__(
+                    file_format, article.get("url"), article["title"], article["authors"],
+                    article["published_time"], summary, content,
+                )
+                archive.writestr(export_filename(article, file_format, index), data)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    yield sink.drain()  # Central directory
+
+
+def write_zip(items, fileobj, formats=EXPORT_FORMATS, include_content=True):
+    """Writes stream_zip's chunks to an open binary file object; returns the number of bytes written."""
+    written = 0
+    for chunk in stream_zip(items, formats, include_content):
+        fileobj.write(chunk)
+        written += len(chunk)
+    return written
+
+
+if __name__ == "__main__":
+    from src.scraping.scraper import ARTICLE_STORE
+
+    parser = argparse.ArgumentParser(description="Export every stored article and its summary to a ZIP file.")
+    parser.add_argument("--output", default="articles.zip")
+    parser.add_argument("--formats", nargs="+", choices=EXPORT_FORMATS, default=list(EXPORT_FORMATS))
+    parser.add_argument("--no-content", action="store_true", help="export summaries and metadata only")
+    args = parser.parse_args()
+
+    items = ((article, article.pop("summary")) for article in ARTICLE_STORE.iter_articles(with_summary=True))
+    with open(args.output, "wb") as f:
+        size = write_zip(items, f, args.formats, include_content=not args.no_content)
+    print(f"Wrote {args.output} ({size / 1024:.0f} KiB)")
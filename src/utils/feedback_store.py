@@ -0,0 +1,304 @@
+"""
+Normalized feedback store (SQLite) with buffered writes and an aggregate query API.
+
+Feedback rows refer to the article and summary they are about by content hash; each
+distinct text is stored once in `texts`, however much feedback it gets. Writes are
+buffered in memory and committed in batches (after `flush_size` entries or
+`flush_interval` seconds, and at exit), in WAL mode with a busy timeout so app
+sessions and processes can write concurrently. Entries of a failed write stay
+buffered and are retried.
+
+Run from the project root for a quick report:
+    python src/utils/feedback_store.py --by type
+    python src/utils/feedback_store.py --by max_length reduce --type summary_feedback
+"""
+import argparse
+import atexit
+import csv
+import json
+import logging
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+from src.utils.hashing import content_hash
+
+FLUSH_SIZE = 20       # Buffered entries that trigger a write
+FLUSH_INTERVAL = 2.0  # Max seconds an entry waits in the buffer
+
+# Columns counts() can group by ("day" is the UTC date of the feedback)
+GROUP_COLUMNS = {
+    "type": "type",
+    "url": "url",
+    "article_hash": "article_hash",
+    "summary_hash": "summary_hash",
+    "backend": "backend",
+    "max_length": "max_length",
+    "reduce": "reduce",
+    "source": "source",
+    "day": "date(created_at, 'unixepoch')",
+}
+MISSING = ("", "N/A", "General")  # Placeholder inputs/summaries written by the old CSV format
+
+
+class FeedbackStore:
+    """
+    Feedback entries keyed to article and summary content hashes.
+
+    add() only buffers; flush() writes the buffer in one transaction. Queries flush first,
+    so they always see this process's own entries.
+    """
+
+    def __init__(self, path, legacy_csv=None, flush_size=FLUSH_SIZE, flush_interval=FLUSH_INTERVAL):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._timer = None
+        self._lock = threading.Lock()
+        # Autocommit mode; flush() manages its own transaction
+        self._conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS texts (
+                hash TEXT PRIMARY KEY,
+                text TEXT NOT NULL
+            )"""
+        )
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS feedback (
+                id INTEGER PRIMARY KEY,
+                created_at REAL NOT NULL,
+                type TEXT NOT NULL,
+                message TEXT NOT NULL,
+                url TEXT,
+                article_hash TEXT REFERENCES texts(hash),
+                summary_hash TEXT REFERENCES texts(hash),
+                backend TEXT,
+                max_length INTEGER,
+                reduce INTEGER,
+                source TEXT NOT NULL DEFAULT 'app'
+            )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_feedback_article ON feedback(article_hash)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_feedback_created ON feedback(created_at)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        if legacy_csv is not None:
+            self.migrate_csv(legacy_csv)
+        atexit.register(self.flush)
+
+    def add(self, feedback_entry):
+        """
+        Buffers a feedback entry: a dict with "type" and "message", and optionally "input"
+        (the article text), "summary", "url", "backend", "max_length" and "reduce".
+        """
+        row = self._row(feedback_entry, time.time())
+        with self._lock:
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.flush_size
+            if not full:
+                self._schedule()
+        if full:
+            self._background_flush()
+
+    def _schedule(self):
+        """Starts the flush timer unless one is pending (caller holds the lock)."""
+        if self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self._background_flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _background_flush(self):
+        # Nobody is waiting on this flush to raise to: a failure is logged by _write and retried later
+        try:
+            self.flush()
+        except sqlite3.Error:
+            pass
+
+    @staticmethod
+    def _row(entry, created_at, source="app"):
+        texts = {}
+        hashes = []
+        for field in ("input", "summary"):
+            text = entry.get(field)
+            if text is None or text.strip() in MISSING:
+                hashes.append(None)
+                continue
+            digest = content_hash(text)
+            texts[digest] = text
+            hashes.append(digest)
+        reduce = entry.get("reduce")
+        return texts, (
+            created_at, entry["type"], entry["message"], entry.get("url"), hashes[0], hashes[1],
+            entry.get("backend"), entry.get("max_length"), None if reduce is None else int(reduce), source,
+        )
+
+    def flush(self):
+        """
+        Writes buffered entries in one transaction. Returns how many were written.
+        If the write fails, the entries go back to the buffer, a retry is scheduled and
+        the sqlite3.Error is raised.
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            rows, self._buffer = self._buffer, []
+            if rows:
+                try:
+                    self._write(rows)
+                except sqlite3.Error:
+                    self._buffer[:0] = rows  # Ahead of anything added since, so order is kept
+                    self._schedule()
+                    raise
+        return len(rows)
+
+    def _write(self, rows, meta=None):
+        """Inserts rows (and an optional meta (key, value)) in one transaction; False if `meta` was already set."""
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")  # Inside the try: a busy timeout here is a failed write too
+            if meta is not None and self._conn.execute("SELECT 1 FROM meta WHERE key = ?", (meta[0],)).fetchone():
+                self._conn.execute("ROLLBACK")
+                return False
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO texts (hash, text) VALUES (?, ?)",
+                [item for texts, _ in rows for item in texts.items()],
+            )
+            self._conn.executemany(
+                "INSERT INTO feedback (created_at, type, message, url, article_hash, summary_hash, "
+                "backend, max_length, reduce, source) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [values for _, values in rows],
+            )
+            if meta is not None:
+                self._conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)", meta)
+            self._conn.execute("COMMIT")
+            return True
+        except sqlite3.Error as e:
+            if self._conn.in_transaction:
+                self._conn.execute("ROLLBACK")
+            logging.error(f"Failed to write {len(rows)} feedback entries (kept for retry): {e}")
+            raise
+
+    def migrate_csv(self, csv_path):
+        """
+        Imports a legacy user_feedback.csv (Type, Message, Input, Summary) once; later calls
+        for the same file are no-ops. Rows are dated with the file's modification time.
+        Returns how many rows were imported.
+        """
+        csv_path = Path(csv_path)
+        key = f"migrated:{csv_path.name}"
+        if not csv_path.exists() or self._conn.execute("SELECT 1 FROM meta WHERE key = ?", (key,)).fetchone():
+            return 0
+        created_at = csv_path.stat().st_mtime
+        with open(csv_path, newline="", encoding="utf-8") as f:
+            rows = [
+                self._row({"type": r["Type"], "message": r["Message"], "input": r.get("Input"),
+                           "summary": r.get("Summary")}, created_at, source="csv")
+                for r in csv.DictReader(f) if r.get("Type") and r.get("Message")
+            ]
+        with self._lock:
+            # The meta key is rechecked inside the write transaction, so concurrent processes import once
+            if not self._write(rows, meta=(key, json.dumps({"rows": len(rows)}))):
+                return 0
+        logging.info(f"Migrated {len(rows)} feedback rows from {csv_path}")
+        return len(rows)
+
+    # --- Queries ---
+
+    @staticmethod
+    def _where(type=None, since=None, until=None, article_hash=None):
+        clauses, params = [], []
+        for clause, value in (("type = ?", type), ("created_at >= ?", since),
+                              ("created_at < ?", until), ("article_hash = ?", article_hash)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def counts(self, by=("type",), type=None, since=None, until=None, limit=None):
+        """
+        Returns feedback counts grouped by the GROUP_COLUMNS in `by`, most frequent first,
+        e.g. counts(by=("max_length", "reduce"), type="summary_feedback").
+        """
+        unknown = set(by) - set(GROUP_COLUMNS)
+        if unknown:
+            raise ValueError(f"Cannot group feedback by {sorted(unknown)}; choose from {sorted(GROUP_COLUMNS)}")
+        self.flush()
+        where, params = self._where(type, since, until)
+        columns = ", ".join(f"{GROUP_COLUMNS[name]} AS {name}" for name in by)
+        sql = (f"SELECT {columns}, COUNT(*) AS n FROM feedback{where} "
+               f"GROUP BY {', '.join(by)} ORDER BY n DESC")
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip((*by, "count"), row)) for row in rows]
+
+    def per_article(self, limit=20, since=None):
+        """Returns the most-commented articles: hash, url, feedback count, distinct summaries and last message."""
+        self.flush()
+        where, params = self._where("summary_feedback", since)
+        with self._lock:
+            rows = self._conn.execute(
+                f"""SELECT article_hash, MAX(url), COUNT(*), COUNT(DISTINCT summary_hash),
+                           (SELECT message FROM feedback f2 WHERE f2.article_hash = feedback.article_hash
+                            ORDER BY created_at DESC, id DESC LIMIT 1)
+                    FROM feedback{where} GROUP BY article_hash ORDER BY COUNT(*) DESC LIMIT ?""",
+                (*params, limit),
+            ).fetchall()
+        return [dict(zip(("article_hash", "url", "count", "summaries", "last_message"), row)) for row in rows]
+
+    def entries(self, type=None, article_hash=None, since=None, limit=100, with_text=False):
+        """Returns the newest feedback entries; with `with_text`, the article and summary texts too."""
+        self.flush()
+        where, params = self._where(type, since, article_hash=article_hash)
+        columns = ("id", "created_at", "type", "message", "url", "article_hash", "summary_hash",
+                   "backend", "max_length", "reduce", "source")
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(columns)} FROM feedback{where} ORDER BY created_at DESC, id DESC LIMIT ?",
+                (*params, limit),
+            ).fetchall()
+        results = [dict(zip(columns, row)) for row in rows]
+        if with_text:
+            for result in results:
+                result["input"] = self.text(result["article_hash"])
+                result["summary"] = self.text(result["summary_hash"])
+        return results
+
+    def text(self, digest):
+        """Returns the article or summary text stored under a content hash, or None."""
+        if digest is None:
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM texts WHERE hash = ?", (digest,)).fetchone()
+        return row[0] if row else None
+
+    def count(self):
+        self.flush()
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM feedback").fetchone()[0]
+
+
+if __name__ == "__main__":
+    from src.utils.helpers import FEEDBACK_STORE
+
+    parser = argparse.ArgumentParser(description="Report feedback counts from the feedback store.")
+    parser.add_argument("--by", nargs="+", choices=sorted(GROUP_COLUMNS), default=["type"])
+    parser.add_argument("--type", help="only count feedback of this type (e.g. summary_feedback)")
+    parser.add_argument("--days", type=float, help="only count feedback from the last N days")
+    parser.add_argument("--articles", type=int, default=0, help="also list the N most-commented articles")
+    args = parser.parse_args()
+
+    since = time.time() - args.days * 86400 if args.days else None
+    for row in FEEDBACK_STORE.counts(by=args.by, type=args.type, since=since):
+        print(json.dumps(row, ensure_ascii=False))
+    for row in FEEDBACK_STORE.per_article(limit=args.articles, since=since) if args.articles else []:
+        print(json.dumps(row, ensure_ascii=False))
@@ -0,0 +1,6 @@
+import hashlib
+
+
+def content_hash(text):
+    """Returns the SHA-256 hex digest of a text (articles, summaries, cache keys)."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
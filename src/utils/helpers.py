@@ -1,7 +1,6 @@
 import sys
 import json
 from pathlib import Path
-import csv
 
 # Ensure project root is added to sys.path
 ROOT_DIR = Path(__file__).resolve().parent.parent.parent
@@ -9,24 +8,19 @@ sys.path.append(str(ROOT_DIR))
 
 # Define feedback folder and file paths relative to the root directory
 FEEDBACK_DIR = ROOT_DIR / "feedback"  # Path to the feedback folder
-FEEDBACK_FILE = FEEDBACK_DIR / "user_feedback.csv"  # Path to the feedback file
+FEEDBACK_FILE = FEEDBACK_DIR / "user_feedback.csv"  # Legacy CSV feedback, migrated into the store on first use
+FEEDBACK_DB = FEEDBACK_DIR / "feedback.sqlite3"  # Path to the feedback store
 
 # Ensure the feedback folder exists
 FEEDBACK_DIR.mkdir(parents=True, exist_ok=True)
 
-def save_feedback(feedback_entry):
-    """Save feedback entry to a CSV file efficiently."""
-    file_exists = FEEDBACK_FILE.exists()
-
-    with open(FEEDBACK_FILE, mode="a", newline="", encoding="utf-8") as file:
-        writer = csv.writer(file)
+from src.utils.feedback_store import FeedbackStore
 
-        # Write header only if the file is new
-        if not file_exists:
-            writer.writerow(["Type", "Message", "Input", "Summary"])
+FEEDBACK_STORE = FeedbackStore(FEEDBACK_DB, legacy_csv=FEEDBACK_FILE)
 
-        # Write the new feedback entry as a row
-        writer.writerow([feedback_entry["type"], feedback_entry["message"], feedback_entry.get("input", "N/A"), feedback_entry.get("summary", "N/A")])
+def save_feedback(feedback_entry):
+    """Buffer a feedback entry in the feedback store (articles and summaries are stored once, by hash)."""
+    FEEDBACK_STORE.add(feedback_entry)
 
 def validate_text_input(text):
     """Validate text input and return an error message if necessary."""
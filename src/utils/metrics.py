@@ -0,0 +1,261 @@
+"""
+Lightweight timing spans and histograms for the scraper, summarizer and app.
+
+    with METRICS.span("fetch_html", url=url): ...      # time a block
+    @timed("extract_article_fields")                    # time every call of a function
+    with METRICS.trace("Summarize Article") as trace:   # collect the spans of one request
+
+Every span feeds a per-name histogram (Prometheus-style cumulative buckets plus the last
+RECENT_SAMPLES durations for exact p50/p95). Spans opened inside a trace, including in
+worker threads started through `propagate`, are also recorded on that trace with their
+nesting depth, so one request can be broken down into network, parsing, chunking,
+generation and stats time. A span costs two perf_counter() calls and one lock, i.e. a
+few microseconds; set METRICS_ENABLED=0 to turn spans into no-ops.
+
+Export with to_prometheus() / to_json(), or serve both over HTTP:
+    start_metrics_server(9100)   # GET /metrics (Prometheus text), GET /metrics.json
+"""
+import bisect
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("METRICS_ENABLED", "1") != "0"
+METRIC_PREFIX = "techcrunch"
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+RECENT_SAMPLES = 1000  # Durations kept per span name for exact percentiles
+RECENT_TRACES = 20     # Finished traces kept for the performance panel
+
+_current_trace = contextvars.ContextVar("current_trace", default=None)
+_depth = contextvars.ContextVar("span_depth", default=0)
+
+
+class Histogram:
+    """Duration histogram of one span name: cumulative buckets, count, sum, max and recent samples."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=RECENT_SAMPLES)
+
+    def observe(self, seconds):
+        i = bisect.bisect_left(self.buckets, seconds)
+        if i < len(self.buckets):
+            self.bucket_counts[i] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+    def percentile(self, p):
+        values = sorted(self.recent)
+        return values[min(len(values) - 1, int(p * len(values)))] if values else None
+
+
+class Trace:
+    """The spans of one request, in start order, with their offset, duration, depth and attributes."""
+
+    def __init__(self, name):
+        self.name = name
+        self.started_at = time.time()
+        self.spans = []
+        self.seconds = None
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def add(self, name, start, seconds, depth, attrs):
+        with self._lock:
+            self.spans.append({"name": name, "offset": start - self._start, "seconds": seconds,
+                               "depth": depth, **attrs})
+
+    def breakdown(self):
+        """Returns the trace's spans sorted by start time, with offsets and durations in milliseconds."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span["offset"])
+        return [
+            {"name": span["name"], "depth": span["depth"], "offset_ms": round(span["offset"] * 1000, 2),
+             "ms": round(span["seconds"] * 1000, 2),
+             **{key: value for key, value in span.items() if key not in ("name", "depth", "offset", "seconds")}}
+            for span in spans
+        ]
+
+    def totals(self):
+        """Returns call count and total seconds per span name (nested spans count toward their own name)."""
+        with self._lock:
+            spans = list(self.spans)
+        totals = {}
+        for span in spans:
+            entry = totals.setdefault(span["name"], {"calls": 0, "seconds": 0.0})
+            entry["calls"] += 1
+            entry["seconds"] += span["seconds"]
+        return totals
+
+
+class Metrics:
+    """Registry of span histograms and recent traces (one shared instance: METRICS)."""
+
+    def __init__(self, enabled=ENABLED):
+        self.enabled = enabled
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self.traces = deque(maxlen=RECENT_TRACES)
+
+    def observe(self, name, seconds):
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(seconds)
+
+    def record(self, name, start, seconds, **attrs):
+        """Records a span timed by the caller (perf_counter `start`), e.g. one that runs in a generator."""
+        if not self.enabled:
+            return
+        self.observe(name, seconds)
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.add(name, start, seconds, _depth.get(), attrs)
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """Times the block into the `name` histogram (and the current trace, if any)."""
+        if not self.enabled:
+            yield
+            return
+        depth = _depth.get()
+        token = _depth.set(depth + 1)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            _depth.reset(token)
+            self.observe(name, seconds)
+            trace = _current_trace.get()
+            if trace is not None:
+                trace.add(name, start, seconds, depth, attrs)
+
+    @contextmanager
+    def trace(self, name):
+        """Collects every span opened in the block into a Trace, kept in `traces` once finished."""
+        trace = Trace(name)
+        token = _current_trace.set(trace)
+        depth_token = _depth.set(0)
+        try:
+            yield trace
+        finally:
+            trace.seconds = time.perf_counter() - trace._start
+            _depth.reset(depth_token)
+            _current_trace.reset(token)
+            if self.enabled:
+                self.observe(f"request:{name}", trace.seconds)
+                self.traces.append(trace)
+
+    def last_trace(self, name=None):
+        """Returns the most recent finished trace (with that name, if given), or None."""
+        for trace in reversed(self.traces):
+            if name is None or trace.name == name:
+                return trace
+        return None
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+        self.traces.clear()
+
+    def snapshot(self):
+        """Returns per-span stats: count, total/mean/max seconds and p50/p95 of recent calls."""
+        with self._lock:
+            histograms = {name: (h.count, h.sum, h.max, h.percentile(0.5), h.percentile(0.95))
+                          for name, h in self._histograms.items()}
+        return {
+            name: {"count": count, "sum_seconds": round(total, 6), "mean_seconds": round(total / count, 6),
+                   "max_seconds": round(peak, 6), "p50_seconds": round(p50, 6), "p95_seconds": round(p95, 6)}
+            for name, (count, total, peak, p50, p95) in sorted(histograms.items())
+        }
+
+    def to_json(self):
+        return json.dumps({"spans": self.snapshot(), "generated_at": time.time()})
+
+    def to_prometheus(self):
+        """Renders every histogram in the Prometheus text exposition format."""
+        metric = f"{METRIC_PREFIX}_span_seconds"
+        lines = [f"# HELP {metric} Duration of instrumented spans.", f"# TYPE {metric} histogram"]
+        with self._lock:
+            histograms = {name: (list(h.bucket_counts), h.count, h.sum) for name, h in self._histograms.items()}
+        for name, (bucket_counts, count, total) in sorted(histograms.items()):
+            label = name.replace("\\", "\\\\").replace('"', '\\"')
+            cumulative = 0
+            for bound, bucket_count in zip(BUCKETS, bucket_counts):
+                cumulative += bucket_count
+                lines.append(f'{metric}_bucket{{span="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{span="{label}",le="+Inf"}} {count}')
+            lines.append(f'{metric}_sum{{span="{label}"}} {total:.6f}')
+            lines.append(f'{metric}_count{{span="{label}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
+
+
+def timed(name=None):
+    """Decorator: times every call of the function as a span (named after the function by default)."""
+    def decorate(func):
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with METRICS.span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def propagate(func):
+    """
+    Wraps `func` so calls made from other threads (e.g. a ThreadPoolExecutor) record their
+    spans on the caller's current trace, at the caller's span depth.
+    """
+    context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        # One copy per call: a Context can't be entered by two threads at once
+        return context.copy().run(func, *args, **kwargs)
+    return wrapper
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") == "/metrics":
+            body, content_type = METRICS.to_prometheus(), "text/plain; version=0.0.4"
+        elif self.path.rstrip("/") == "/metrics.json":
+            body, content_type = METRICS.to_json(), "application/json"
+        else:
+            self.send_error(404)
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # Keep scrapes out of stderr
+
+
+def start_metrics_server(port, host="127.0.0.1"):
+    """Serves /metrics and /metrics.json from a daemon thread; returns the server."""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    return server
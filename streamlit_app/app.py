@@ -3,8 +3,9 @@ import logging
 import sys
 import json
 from pathlib import Path
+import os
+import time
 import pandas as pd
-import docx
 
 
 # Configure logging
@@ -20,42 +21,192 @@ logging.basicConfig(
 ROOT_DIR = Path(__file__).resolve().parent.parent
 sys.path.append(str(ROOT_DIR))
 
-from src.scraping.scraper import get_latest_articles, fetch_article_details
-from src.summarization.summarizer import summarize_text
+from src.scraping.scraper import (
+    get_latest_articles, get_prefetched_articles, fetch_article_details, store_article, store_articles, store_summary, search_articles,
+    near_duplicate_original, ARTICLE_STORE, FETCH_SCHEDULER, HTTP_CACHE, NEAR_DUPLICATES,
+)
+from src.summarization.summarizer import (
+    summarize_text, summarize_texts, stream_summary, get_cached_summary, reuse_summary, warm_up,
+    MODEL_MANAGER,
+)
+from src.summarization.job_queue import JobQueue
+from src.summarization.worker import submit_summary_job
+from src.utils.export import render_export, stream_zip, EXPORT_FORMATS, MIME_TYPES
 from src.utils.helpers import *
+from src.utils.metrics import METRICS, start_metrics_server
+
+# Hand summaries to the worker pool (src/summarization/worker.py) instead of running the model here
+USE_JOB_QUEUE = os.environ.get("SUMMARIZER_QUEUE") == "1"
+# Serve /metrics (Prometheus text) and /metrics.json on this port when set
+METRICS_PORT = os.environ.get("METRICS_PORT")
 
 
 st.set_page_config(page_title="TechCrunch Summarizer", layout="wide")
 
+# Start loading the model in the background; browsing and scraping work meanwhile
+if not USE_JOB_QUEUE:
+    warm_up()
+
+
+@st.cache_resource
+def get_job_queue():
+    """One job queue connection shared by every session."""
+    return JobQueue()
+
+
+@st.cache_resource
+def get_metrics_server(port):
+    """One metrics endpoint per app process."""
+    return start_metrics_server(port)
+
+
+@st.fragment(run_every=2)
+def poll_summary_job():
+    """Polls the queued summary job without blocking the page; reruns the app once it finishes."""
+    job = get_job_queue().status(st.session_state["summary_job"])
+    if job is None or job["status"] in ("queued", "running"):
+        state = job["status"] if job else "queued"
+        st.info(f"⏳ Summary job {state}... (queued {job['queued_seconds'] if job else 0}s)")
+        return
+    st.session_state["summary_job"] = None
+    if job["status"] == "done":
+        st.session_state["summary"] = job["summary"]
+        st.session_state["summary_stats"] = job["stats"]
+    else:
+        st.session_state["summary_error"] = job["error"]
+    st.rerun()
+
+def summary_backend():
+    """The backend summaries are made with: the workers' in queue mode (None means this process's)."""
+    return get_job_queue().worker_backend() if USE_JOB_QUEUE else None
+
+def reuse_near_duplicate_summary(article, max_length=200, reduce=False):
+    """
+    Returns the cached summary of the article this one is a near-duplicate of, with stats
+    recomputed against this article's text, or None.
+    Each reuse is counted once per session in the near-duplicate index's savings counters.
+    """
+    original = near_duplicate_original(article)
+    if original is None:
+        return None
+    result = reuse_summary(article["content"], original["content"], max_length=max_length, reduce=reduce,
+                           backend=summary_backend())
+    reused = st.session_state.setdefault("reused_summaries", set())
+    if result and (article["url"], max_length, reduce) not in reused:
+        reused.add((article["url"], max_length, reduce))
+        NEAR_DUPLICATES.record_reuse(len(article["content"].split()))
+    return result
+
+def show_performance_panel(container, trace):
+    """Shows where the time of the session's last traced request went, plus the metric exports."""
+    with container.expander("⏱️ Performance", expanded=True):
+        if trace is None or trace.seconds is None:
+            st.caption("No request traced yet in this session.")
+        else:
+            st.caption(f"Last request: **{trace.name}** in {trace.seconds:.2f}s "
+                       "(nested spans are included in their parents' time)")
+            totals = pd.DataFrame(
+                [{"span": name, "calls": total["calls"], "seconds": round(total["seconds"], 3),
+                  "share": f"{total['seconds'] / trace.seconds:.0%}" if trace.seconds else "N/A"}
+                 for name, total in trace.totals().items()]
+            )
+            if not totals.empty:
+                st.dataframe(totals.sort_values("seconds", ascending=False), hide_index=True)
+                timeline = pd.DataFrame(trace.breakdown())
+                timeline["name"] = ["· " * depth + name for depth, name in zip(timeline["depth"], timeline["name"])]
+                st.dataframe(timeline.drop(columns="depth"), hide_index=True)
+        st.download_button("📥 Prometheus metrics", METRICS.to_prometheus(), file_name="metrics.txt",
+                           mime="text/plain", key="download_metrics_prometheus")
+        st.download_button("📥 JSON metrics", METRICS.to_json(), file_name="metrics.json",
+                           mime="application/json", key="download_metrics_json")
+
+if METRICS_PORT:
+    get_metrics_server(int(METRICS_PORT))
+
 st.title("🚀 TechCrunch Article Summarizer")
 st.sidebar.header("🔍 Options")
+# Filled at the end of the run, so it shows the request this run made
+performance_container = st.sidebar.container()
+
+model_metrics = MODEL_MANAGER.metrics()
+if USE_JOB_QUEUE:
+    job_counts = get_job_queue().counts()
+    st.sidebar.caption(f"🧠 Worker queue: {job_counts['queued']} queued, {job_counts['running']} running")
+elif model_metrics["state"] == "ready":
+    st.sidebar.caption(f"🧠 Model ready: {model_metrics['backend']} backend (loaded in {model_metrics['load_seconds']}s)")
+elif model_metrics["state"] == "failed":
+    st.sidebar.caption(f"🧠 Model failed to load: {model_metrics['error']} "
+                       f"(retrying on the next request after {model_metrics['retry_in']}s)")
+else:
+    st.sidebar.caption(f"🧠 Model loading in background... ({model_metrics['load_seconds']}s)")
 
 # --- Sidebar: Fetch Latest Articles ---
 with st.sidebar.expander("📡 Fetch TechCrunch Articles", expanded=True):
     if st.button("Get Latest Articles"):
-        with st.spinner("Fetching articles..."):
-            articles = get_latest_articles(limit=5)  # Fetch 5 articles
+        with st.spinner("Fetching articles..."), METRICS.trace("Get Latest Articles") as trace:
+            st.session_state["last_trace"] = trace
+            # Serve the background prefetcher's snapshot when it is fresh; scrape live otherwise
+            articles = get_prefetched_articles(limit=5)
+            if not articles:
+                articles = get_latest_articles(limit=5)  # Fetch 5 articles
+                store_articles(articles)  # Keep them searchable
             st.session_state["articles"] = articles
             st.session_state["selected_article"] = None
             st.session_state["summary"] = None  
             st.session_state["summary_stats"] = None
+            st.session_state["batch_summaries"] = {}
             st.success("Articles fetched successfully!")
+            prefetched_at = ARTICLE_STORE.latest_fetched_at()
+            if prefetched_at:
+                st.caption(f"⚡ Latest prefetch: {int((time.time() - prefetched_at) // 60)} min ago")
+            if HTTP_CACHE is not None:
+                cache_stats = HTTP_CACHE.stats()
+                st.caption(f"🗄️ HTTP cache: {cache_stats['hits'] + cache_stats['revalidated']} hits, "
+                           f"{cache_stats['misses']} misses ({cache_stats['hit_ratio']:.0%})")
+            if FETCH_SCHEDULER is not None:
+                fetch_stats = FETCH_SCHEDULER.stats()
+                st.caption(f"🚦 Fetching: {fetch_stats['rate_per_second']} req/s, "
+                           f"p50 {fetch_stats['latency_p50']}s / p95 {fetch_stats['latency_p95']}s, "
+                           f"{fetch_stats['throttled']} throttled, {fetch_stats['retries']} retries")
+    if NEAR_DUPLICATES is not None:
+        duplicate_stats = NEAR_DUPLICATES.stats()
+        st.caption(f"♻️ Near-duplicates: {duplicate_stats['near_duplicates']} flagged, "
+                   f"{duplicate_stats['summaries_reused']} summaries reused "
+                   f"({duplicate_stats['words_not_summarized']} words not summarized)")
 
 # --- Sidebar: URL Input ---
 with st.sidebar.expander("🔗 Summarize Custom Article", expanded=True):
     custom_url = st.text_input("Enter Article URL")
     if st.button("Fetch & Summarize"):
         if custom_url:
-            with st.spinner("Fetching article..."):
+            with st.spinner("Fetching article..."), METRICS.trace("Fetch Custom Article") as trace:
+                st.session_state["last_trace"] = trace
                 custom_article = fetch_article_details(custom_url)
+                store_article(custom_article)
                 st.session_state["articles"] = [custom_article]
                 st.session_state["selected_article"] = None
                 st.session_state["summary"] = None
                 st.session_state["summary_stats"] = None
+                st.session_state["batch_summaries"] = {}
                 st.success("Article fetched successfully!")
         else:
             st.error("Please enter a valid URL.")
 
+# --- Sidebar: Search Stored Articles ---
+with st.sidebar.expander("🔎 Search Stored Articles", expanded=False):
+    search_query = st.text_input("Search titles, authors, content and summaries")
+    if search_query:
+        results = search_articles(search_query)
+        st.caption(f"{len(results)} matching articles")
+        for result in results[:5]:
+            st.markdown(f"**{result['title']}** — {result['snippet']}")
+        if results and st.button("Open Results"):
+            st.session_state["articles"] = results
+            st.session_state["selected_article"] = None
+            st.session_state["summary"] = None
+            st.session_state["summary_stats"] = None
+            st.session_state["batch_summaries"] = {}
+
 
 # --- Sidebar: Overall Feedback ---
 st.sidebar.subheader("📝 Overall Feedback")
@@ -82,11 +233,58 @@ if "articles" in st.session_state and st.session_state["articles"]:
     
     selected_article = st.selectbox("📑 Select an article:", article_titles, key="article_select")
 
+    # Summary settings come first: they apply to Summarize All as well as the selected article
+    st.subheader("⚙️ Summary Settings")
+    summary_length = st.slider("Select summary length (words)", min_value=50, max_value=300, value=200, step=10)
+    condense = st.checkbox("Condense long articles into one pass (slower, more coherent)", value=False)
+
+    # --- Summarize every fetched article in one batched run ---
+    if len(articles) > 1 and st.button("Summarize All Articles", key="summarize_all_button"):
+        with st.spinner(f"Summarizing {len(articles)} articles..."), METRICS.trace("Summarize All Articles") as trace:
+            st.session_state["last_trace"] = trace
+            # Near-duplicates of already summarized articles reuse that summary instead of a model run
+            reused = {
+                art["url"]: reuse_near_duplicate_summary(art, max_length=summary_length, reduce=condense)
+                for art in articles
+            }
+            pending = [art for art in articles if not reused[art["url"]]]
+            results = dict(zip(
+                [art["url"] for art in pending],
+                summarize_texts([art["content"] for art in pending], max_length=summary_length, reduce=condense),
+            ))
+            st.session_state["batch_summaries"] = {
+                art["url"]: reused[art["url"]] or results[art["url"]] for art in articles
+            }
+            for url, (summary, stats) in st.session_state["batch_summaries"].items():
+                if stats:  # Empty stats: the "summary" is an error message, keep it out of the index
+                    store_summary(url, summary)
+            st.session_state["selected_article"] = None  # Reload the selected article's summary below
+            st.success("All articles summarized! ✅")
+
+    # --- Export every listed article (and any summary it has) as one ZIP ---
+    with st.expander("📦 Export All Articles", expanded=False):
+        export_formats = st.multiselect("Formats", EXPORT_FORMATS, default=["txt", "json"], key="export_formats")
+        if st.button("Prepare ZIP", key="prepare_zip_button") and export_formats:
+            summaries = st.session_state.get("batch_summaries", {})
+            indexed = st.session_state.get("indexed_summaries", {})
+            items = ((art, (summaries.get(art["url"]) or (None,))[0] or indexed.get(art["url"])) for art in articles)
+            # The download button needs the whole archive; stream_zip only holds one article's entries at a time
+            st.session_state["export_zip"] = (
+                [art["url"] for art in articles], b"".join(stream_zip(items, export_formats))
+            )
+        export_urls, export_zip = st.session_state.get("export_zip", (None, None))
+        if export_zip and export_urls == [art["url"] for art in articles]:
+            st.download_button("📥 Download ZIP", export_zip, file_name="articles.zip",
+                               mime=MIME_TYPES["zip"], key="download_zip")
+
     # Reset summary and statistics when a new article is selected
     if selected_article != st.session_state.get("selected_article"):
         st.session_state["selected_article"] = selected_article
-        st.session_state["summary"] = None
-        st.session_state["summary_stats"] = None
+        st.session_state["summary_job"] = None
+        batch_summary = st.session_state.get("batch_summaries", {}).get(
+            articles[article_titles.index(selected_article)]["url"], (None, None)
+        )
+        st.session_state["summary"], st.session_state["summary_stats"] = batch_summary
 
     if selected_article:
         article_index = article_titles.index(selected_article)
@@ -103,13 +301,41 @@ if "articles" in st.session_state and st.session_state["articles"]:
         st.text_area("Article Text", article["content"], height=400, disabled=True)
 
 
-        st.subheader("⚙️ Summary Settings")
-        summary_length = st.slider("Select summary length (words)", min_value=50, max_value=300, value=200, step=10)
+        # Show a previously computed summary for this article and length right away
+        if not st.session_state.get("summary"):
+            cached = get_cached_summary(article["content"], max_length=summary_length, reduce=condense,
+                                        backend=summary_backend())
+            cached = cached or reuse_near_duplicate_summary(article, max_length=summary_length, reduce=condense)
+            if cached:
+                st.session_state["summary"], st.session_state["summary_stats"] = cached
+
+        if article.get("near_duplicate"):
+            st.info(f"♻️ Near-duplicate of {article['near_duplicate']['url']} "
+                    f"(similarity {article['near_duplicate']['similarity']:.0%}).")
 
         # --- Summarization Button ---
         if st.button("Summarize Article", key="summarize_button"):
-            with st.spinner("Summarizing..."):
-                summary, stats = summarize_text(article["content"], max_length=summary_length)
+            if USE_JOB_QUEUE:
+                # Hand the work to the worker pool; poll_summary_job picks up the result
+                st.session_state["summary_job"] = submit_summary_job(
+                    get_job_queue(), article["content"], max_length=summary_length, reduce=condense
+                )
+            else:
+                with METRICS.trace("Summarize Article") as trace:
+                    st.session_state["last_trace"] = trace
+                    if condense:
+                        # The condense pass rewrites the whole summary at the end, so there's nothing to stream
+                        with st.spinner("Summarizing..."):
+                            summary, stats = summarize_text(article["content"], max_length=summary_length, reduce=condense)
+                    else:
+                        # Stream each part of the summary to the page as soon as it is generated
+                        stream_result = {}
+                        stream_placeholder = st.empty()
+                        with stream_placeholder.container():
+                            st.write_stream(stream_summary(article["content"], max_length=summary_length, result=stream_result))
+                        stream_placeholder.empty()
+                        summary, stats = stream_result["summary_text"], stream_result["summary_stats"]
+                        logging.info(f"Summary streamed: first text after {stream_result['time_to_first_text']}s.")
 
                 # ✅ Store results in session state
                 st.session_state["summary"] = summary
@@ -117,40 +343,29 @@ if "articles" in st.session_state and st.session_state["articles"]:
 
                 st.success("Summarization complete! ✅")
 
+        if st.session_state.get("summary_job"):
+            poll_summary_job()
+        if st.session_state.get("summary_error"):
+            st.error(f"Summarization failed: {st.session_state.pop('summary_error')}")
+
         # --- Display Summary ---
         if "summary" in st.session_state and st.session_state["summary"]:
             st.subheader("📝 AI-Generated Summary")
             st.text_area("Summary", st.session_state["summary"], height=100, disabled=False)
 
-            # --- Save as DOCX ---
-            doc = docx.Document()
-            doc.add_heading("TechCrunch Article Summary", level=1)
-            doc.add_paragraph(f"Title: {article['title']}")
-            doc.add_paragraph(f"Author(s): {article['authors']}")
-            doc.add_paragraph(f"Published: {article['published_time']}")
-            doc.add_paragraph("\nSummary:\n")
-            doc.add_paragraph(st.session_state["summary"])
-
-            doc_path = "temp/summary.docx"
-            doc.save(doc_path)
-
-            with open(doc_path, "rb") as f:
-                st.download_button("📥 Download DOCX", f, file_name="summary.docx")
-
-            # --- Save as TXT ---
-            txt_content = (
-                f"Title: {article['title']}\n"
-                f"Author(s): {article['authors']}\n"
-                f"Published: {article['published_time']}\n\n"
-                f"Summary:\n{st.session_state['summary']}"
-            )
-
-            txt_path = "temp/summary.txt"
-            with open(txt_path, "w",encoding='utf-8') as f:
-                f.write(txt_content)
+            # Index the summary for search (once per article and summary)
+            indexed = st.session_state.setdefault("indexed_summaries", {})
+            if st.session_state.get("summary_stats") and indexed.get(article["url"]) != st.session_state["summary"]:
+                store_summary(article["url"], st.session_state["summary"])
+                indexed[article["url"]] = st.session_state["summary"]
 
-            with open(txt_path, "rb") as f:
-                st.download_button("📥 Download TXT", f, file_name="summary.txt")
+            # --- Downloads (rendered in memory, cached per article and summary) ---
+            for file_format, label in (("docx", "📥 Download DOCX"), ("txt", "📥 Download TXT")):
+                st.download_button(
+                    label, render_export(article, st.session_state["summary"], file_format),
+                    file_name=f"summary.{file_format}", mime=MIME_TYPES[file_format],
+                    key=f"download_{file_format}",
+                )
 
             # Show Statistics Button
             if st.button("Show Statistics", key="stats_button"):
@@ -176,12 +391,21 @@ if "articles" in st.session_state and st.session_state["articles"]:
                     feedback_entry = {
                         "type": "summary_feedback",
                         "message": feedback_text,
-                        "input": article["content"],             # Saving the article
-                        "summary": st.session_state['summary']   # Saving the summary
+                        "input": article["content"],             # Stored once, referenced by content hash
+                        "summary": st.session_state['summary'],  # Stored once, referenced by content hash
+                        "url": article["url"],
+                        "backend": summary_backend() or MODEL_MANAGER.backend,  # The workers' in queue mode
+                        "max_length": summary_length,
+                        "reduce": condense,
                     }
                     save_feedback(feedback_entry)
                     st.success("✅ Feedback submitted successfully!")
 
 
 
-    
\ No newline at end of file
+    
+
+
+# --- Sidebar: Performance (optional) ---
+if performance_container.checkbox("⏱️ Show performance panel", value=False, key="show_performance"):
+    show_performance_panel(performance_container, st.session_state.get("last_trace"))
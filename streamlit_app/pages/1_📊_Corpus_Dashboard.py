@@ -0,0 +1,81 @@
+import streamlit as st
+import sys
+import time
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.scraping.scraper import ARTICLE_STORE
+from src.utils.corpus_stats import CorpusStats
+
+st.set_page_config(page_title="Corpus Dashboard", layout="wide")
+
+
+@st.cache_resource
+def get_corpus_stats():
+    """One statistics instance (and in-memory frame) shared by every session."""
+    return CorpusStats(ARTICLE_STORE.path)
+
+
+start = time.perf_counter()
+stats = get_corpus_stats()
+# Only articles stored or summarized since the last visit are counted here
+stats.refresh()
+overview = stats.overview()
+
+st.title("📊 Corpus Dashboard")
+if not overview["articles"]:
+    st.info("No stored articles yet. Fetch some articles on the main page first.")
+    st.stop()
+
+# --- Overview ---
+columns = st.columns(6)
+columns[0].metric("Articles", f"{overview['articles']:,}")
+columns[1].metric("Summarized", f"{overview['summaries']:,}")
+columns[2].metric("Median Words", f"{overview['median_words']:,.0f}")
+columns[3].metric("Compression", f"{overview['mean_compression_ratio'] or 0:.1%}")
+columns[4].metric("Summary Grade (FK)", overview["mean_readability_grade"] or "-")
+columns[5].metric("Summary Reading Ease", overview["mean_reading_ease"] or "-")
+
+# --- Volumes ---
+days = st.sidebar.slider("Days shown", min_value=7, max_value=365, value=90, step=7)
+authors_shown = st.sidebar.slider("Authors shown", min_value=5, max_value=100, value=20, step=5)
+
+left, right = st.columns(2)
+with left:
+    st.subheader("🗓️ Articles per Day")
+    st.bar_chart(stats.per_day(days)["articles"])
+with right:
+    st.subheader("✍️ Articles per Author")
+    st.dataframe(stats.per_author(authors_shown), use_container_width=True)
+
+# --- Distributions ---
+st.subheader("📏 Length Distributions")
+left, right = st.columns(2)
+with left:
+    st.caption("Article words")
+    distribution = stats.length_distribution("words")
+    st.bar_chart(distribution.set_index("start")["articles"])
+with right:
+    st.caption("Summary words")
+    distribution = stats.length_distribution("summary_words")
+    st.bar_chart(distribution.set_index("start")["articles"])
+
+st.subheader("📖 Readability")
+left, right = st.columns(2)
+with left:
+    st.caption("Grade level (Flesch-Kincaid), reading ease and compression ratio")
+    st.dataframe(stats.readability_quartiles(), use_container_width=True)
+with right:
+    st.caption("Hardest-to-read summaries")
+    st.dataframe(
+        stats.top_articles("summary_grade", 10)[["url", "summary_words", "summary_grade", "summary_reading_ease"]],
+        use_container_width=True, hide_index=True,
+    )
+
+st.caption(
+    f"Computed in {time.perf_counter() - start:.2f}s. Readability uses approximate (vowel-group) syllable counts, "
+    "so it can differ slightly from the per-summary statistics."
+)
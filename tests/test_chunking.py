@@ -0,0 +1,60 @@
+import sys
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.stub_model import StubTokenizer
+from src.summarization.summarizer import _split_long_sentence, allocate_length_budget, chunk_text
+
+SENTENCE = " ".join(f"word{i}, part-{i}" for i in range(300))
+
+
+class SlowTokenizer(StubTokenizer):
+    """Stub without offsets, like a slow (pure Python) transformers tokenizer."""
+
+    is_fast = False
+
+    def __call__(self, text, return_offsets_mapping=False, **kwargs):
+        if return_offsets_mapping:
+            raise NotImplementedError("return_offset_mapping is not available when using Python tokenizers")
+        return super().__call__(text, **kwargs)
+
+
+def token_count(tokenizer, text):
+    return len(tokenizer(text, add_special_tokens=False)["input_ids"])
+
+
+def test_split_long_sentence_pieces_fit_and_keep_every_word():
+    tokenizer = StubTokenizer()
+    pieces = _split_long_sentence(SENTENCE, tokenizer, 50)
+
+    assert len(pieces) > 1
+    assert all(token_count(tokenizer, piece) <= 50 for piece in pieces)
+    assert " ".join(pieces) == SENTENCE
+
+
+def test_split_long_sentence_without_offsets_matches_offsets():
+    assert _split_long_sentence(SENTENCE, SlowTokenizer(), 50) == _split_long_sentence(SENTENCE, StubTokenizer(), 50)
+
+
+def test_short_sentence_is_kept_whole():
+    assert _split_long_sentence("A short sentence.", SlowTokenizer(), 50) == ["A short sentence."]
+
+
+def test_chunk_text_with_slow_tokenizer():
+    tokenizer = SlowTokenizer()
+    chunks = chunk_text(SENTENCE + ". " + SENTENCE, tokenizer, max_tokens=100)
+
+    assert chunks
+    assert all(token_count(tokenizer, chunk) <= 100 for chunk in chunks)
+
+
+def test_length_budget_stays_within_max_length_in_few_pairs():
+    for chunk_lengths in ([1000], [400, 400, 200], [560, 440], [700, 200, 100], [300] * 5):
+        budgets = allocate_length_budget(chunk_lengths, 50, 200)
+        assert sum(chunk_max for _, chunk_max in budgets) <= 200
+        assert all(0 < chunk_min < chunk_max for chunk_min, chunk_max in budgets)
+    assert allocate_length_budget([1000], 50, 200) == [(50, 200)]
+    assert len({pair for n in range(1, 6) for pair in allocate_length_budget([1000] * n, 50, 200)}) <= 5
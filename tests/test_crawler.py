@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.scraping import crawler
+
+URLS = ["https://example.com/a", "https://example.com/b"]
+
+
+def fake_listing(monkeypatch, stored):
+    monkeypatch.setattr(crawler, "fetch_page", lambda url, max_age=None: url)
+    monkeypatch.setattr(crawler, "extract_article_links",
+                        lambda page, limit=None: URLS if page == crawler.listing_page_url(1) else [])
+    monkeypatch.setattr(crawler, "fetch_articles",
+                        lambda urls, max_workers=None: [{"url": url, "content": "Text"} for url in urls])
+    monkeypatch.setattr(crawler, "store_articles", stored.extend)
+
+
+def test_dry_run_does_not_mark_articles_seen(tmp_path, monkeypatch):
+    stored = []
+    fake_listing(monkeypatch, stored)
+    index = crawler.SeenIndex(tmp_path / "crawl.sqlite3")
+
+    articles, _ = crawler.crawl_incremental(index)
+
+    assert [article["url"] for article in articles] == URLS
+    assert stored == []
+    assert index.seen(URLS) == set()
+
+
+def test_stored_articles_are_marked_seen(tmp_path, monkeypatch):
+    stored = []
+    fake_listing(monkeypatch, stored)
+    index = crawler.SeenIndex(tmp_path / "crawl.sqlite3")
+
+    crawler.crawl_incremental(index, store=True)
+    articles, stats = crawler.crawl_incremental(index, store=True)
+
+    assert [article["url"] for article in stored] == URLS
+    assert index.seen(URLS) == set(URLS)
+    assert articles == [] and stats["skipped"] == len(URLS)
@@ -0,0 +1,54 @@
+import sys
+from pathlib import Path
+
+# Ensure project root is added to sys.path
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from benchmarks.stub_model import StubSummarizer
+from src.summarization import summarizer
+from src.summarization.job_queue import JobQueue
+from src.summarization.model_manager import ModelManager
+from src.summarization.worker import submit_summary_job, worker_loop
+
+TEXT = " ".join(f"Sentence {i} of a long enough article." for i in range(20))
+
+
+class FailingSummarizer(StubSummarizer):
+    """Stub whose generate step always raises, like a model running out of memory."""
+
+    def __call__(self, inputs, **kwargs):
+        raise RuntimeError("out of memory")
+
+
+def use_model(monkeypatch, model):
+    monkeypatch.setattr(summarizer, "SUMMARY_CACHE", None)
+    monkeypatch.setattr(summarizer, "MODEL_MANAGER", ModelManager(backend="stub", loader=lambda backend: model))
+
+
+def test_failed_summary_marks_job_failed_and_resubmit_requeues(tmp_path, monkeypatch):
+    use_model(monkeypatch, FailingSummarizer())
+    queue = JobQueue(tmp_path / "jobs.sqlite3")
+    queue.set_worker_backend("stub")
+    job_id = submit_summary_job(queue, TEXT)
+
+    worker_loop(tmp_path / "jobs.sqlite3", max_jobs=1)
+
+    status = queue.status(job_id)
+    assert status["status"] == "failed"
+    assert status["summary"] is None
+    assert submit_summary_job(queue, TEXT) == job_id
+    assert queue.status(job_id)["status"] == "queued"
+
+
+def test_successful_summary_completes_job(tmp_path, monkeypatch):
+    use_model(monkeypatch, StubSummarizer())
+    queue = JobQueue(tmp_path / "jobs.sqlite3")
+    queue.set_worker_backend("stub")
+    job_id = submit_summary_job(queue, TEXT)
+
+    worker_loop(tmp_path / "jobs.sqlite3", max_jobs=1)
+
+    status = queue.status(job_id)
+    assert status["status"] == "done"
+    assert status["stats"]